@@ -0,0 +1,102 @@
+"""
+Compare the memory used by the reader's domain objects with and without
+__slots__.
+
+The "dict" layout is built by compiling src/reader.py with every __slots__
+declaration removed, which reproduces the previous per-instance __dict__
+classes without keeping a second copy of them in the source tree.
+
+Usage:
+    python benchmarks/bench_memory.py [save_file] [--copies N]
+"""
+
+import argparse
+import ast
+import gc
+import os
+import sys
+import tracemalloc
+import types
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+import reader  # noqa: E402
+
+DEFAULT_SAVE = os.path.join(SRC_DIR, "..", "test", "Test Save.sav")
+
+
+def load_dict_layout_reader():
+    """Compile a copy of the reader module with all __slots__ removed."""
+    path = os.path.join(SRC_DIR, "reader.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            node.body = [
+                stmt
+                for stmt in node.body
+                if not (
+                    isinstance(stmt, ast.Assign)
+                    and any(
+                        isinstance(t, ast.Name) and t.id == "__slots__"
+                        for t in stmt.targets
+                    )
+                )
+            ]
+
+    module = types.ModuleType("reader_dict_layout")
+    module.__file__ = path
+    exec(compile(tree, path, "exec"), module.__dict__)
+    return module
+
+
+def measure(module, game, copies):
+    """Build the roster `copies` times and return (objects, peak bytes)."""
+    gc.collect()
+    tracemalloc.start()
+    rosters = []
+    for _ in range(copies):
+        missions = module.read_missions(game)
+        rosters.append((missions, module.read_roster(game, missions)))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    soldiers = sum(len(roster[1]) for _, roster in rosters)
+    del rosters
+    gc.collect()
+    return soldiers, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("save_file", nargs="?", default=DEFAULT_SAVE)
+    parser.add_argument(
+        "--copies",
+        type=int,
+        default=20,
+        help="Build the roster this many times to simulate a larger campaign.",
+    )
+    args = parser.parse_args()
+
+    _, game = reader.load_save(args.save_file)
+
+    results = {}
+    for label, module in (
+        ("dict", load_dict_layout_reader()),
+        ("slots", reader),
+    ):
+        results[label] = measure(module, game, args.copies)
+
+    soldiers, dict_peak = results["dict"]
+    _, slots_peak = results["slots"]
+    print(f"Soldiers built: {soldiers}")
+    print(f"{'layout':<8}{'peak KiB':>12}{'bytes/soldier':>16}")
+    for label, (_, peak) in results.items():
+        print(f"{label:<8}{peak / 1024:>12.1f}{peak / soldiers:>16.1f}")
+    print(f"Reduction: {100 * (1 - slots_peak / dict_peak):.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+"""
+Headless batch export of one or more save files.
+
+Loads saves through the reader (and, optionally, the game rulesets and
+translations), in parallel when asked to, and writes the soldier rosters to a
+single CSV, JSON or Parquet file. Nothing in here imports customtkinter or
+tkinter, so it runs on servers and in plain containers.
+
+Usage:
+    python src/batch.py SAVE_OR_DIR [SAVE_OR_DIR ...] -o OUTPUT
+                        [--format {csv,json,parquet}] [--columns COL [COL ...]]
+                        [--game-dir DIR] [--gzip] [--workers N]
+"""
+
+import argparse
+import csv
+import gzip
+import json
+import logging
+import os
+import sys
+
+import bulk_loader
+import reader
+from data_manager import GameDataManager
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+SAVE_EXTENSIONS = (".sav", ".asav")
+EXPORT_FORMATS = ("csv", "json", "parquet")
+
+# Rows handed to pyarrow at a time when writing Parquet
+_PARQUET_BATCH_SIZE = 1000
+
+
+def find_saves(paths):
+    """
+    Expand save file and directory arguments into a list of save files.
+    Directories contribute their *.sav/*.asav files (not recursive).
+    :param paths: Iterable of file or directory paths.
+    :return: Sorted save file paths per argument, in argument order.
+    """
+    saves = []
+    for path in paths:
+        if os.path.isdir(path):
+            found = sorted(
+                os.path.join(path, name)
+                for name in os.listdir(path)
+                if name.lower().endswith(SAVE_EXTENSIONS)
+                and os.path.isfile(os.path.join(path, name))
+            )
+            if not found:
+                logger.warning(f"No save files found in {path}")
+            saves.extend(found)
+        elif os.path.isfile(path):
+            saves.append(path)
+        else:
+            logger.warning(f"Skipping missing path: {path}")
+    return saves
+
+
+def iter_export_rows(save_paths, columns=None, game_dir=None, workers=1):
+    """
+    Lazily produce export rows for every soldier in every save, header first.
+    Each row is prefixed with the save's file name. Saves that fail to load
+    are logged and skipped.
+    :param save_paths: Iterable of save file paths.
+    :param columns: Headers from reader.CSV_COLUMNS to include.
+    :param game_dir: Game resource directory used to resolve rank names.
+    :param workers: Number of worker processes; with more than one, saves are
+                    exported in the order they finish loading.
+    :return: A generator of row lists.
+    """
+    if columns is None:
+        columns = list(reader.CSV_COLUMNS)
+    yield ["Save", *columns]
+
+    for summary in bulk_loader.load_saves(
+        save_paths, workers=workers, columns=columns, game_dir=game_dir
+    ):
+        if summary.error:
+            logger.error(f"Error loading {summary.path}: {summary.error}")
+            continue
+
+        save_name = os.path.basename(summary.path)
+        for row in summary.rows:
+            yield [save_name, *row]
+        logger.info(f"Exported {summary.soldier_count} soldiers from {summary.path}")
+
+
+def _open_text(path, compress):
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def _write_csv(rows, path, compress):
+    with _open_text(path, compress) as f:
+        csv.writer(f).writerows(rows)
+
+
+def _write_json(rows, path, compress):
+    """Write a JSON array of objects, one soldier at a time."""
+    rows = iter(rows)
+    header = next(rows, None)
+    with _open_text(path, compress) as f:
+        f.write("[")
+        for i, row in enumerate(rows):
+            f.write(",\n" if i else "\n")
+            f.write(json.dumps(dict(zip(header, row, strict=True))))
+        f.write("\n]\n")
+
+
+def _write_parquet(rows, path, compress):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    rows = iter(rows)
+    header = next(rows, None)
+    if header is None:
+        return
+
+    writer = None
+
+    def flush(batch):
+        nonlocal writer
+        table = pa.Table.from_pylist(
+            [dict(zip(header, row, strict=True)) for row in batch]
+        )
+        if writer is None:
+            writer = pq.ParquetWriter(
+                path, table.schema, compression="gzip" if compress else "snappy"
+            )
+        else:
+            table = table.cast(writer.schema)
+        writer.write_table(table)
+
+    try:
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= _PARQUET_BATCH_SIZE:
+                flush(batch)
+                batch = []
+        if batch:
+            flush(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+_WRITERS = {
+    "csv": _write_csv,
+    "json": _write_json,
+    "parquet": _write_parquet,
+}
+
+
+def guess_format(output):
+    """Infer the export format from an output file name, defaulting to CSV."""
+    name = output.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    for fmt in EXPORT_FORMATS:
+        if name.endswith(f".{fmt}"):
+            return fmt
+    return "csv"
+
+
+def export(
+    save_paths,
+    output,
+    fmt=None,
+    columns=None,
+    game_dir=None,
+    compress=None,
+    workers=1,
+):
+    """
+    Export the rosters of several saves to a single file.
+    :param save_paths: Iterable of save file paths.
+    :param output: Output file path.
+    :param fmt: One of EXPORT_FORMATS; inferred from `output` when omitted.
+    :param columns: Headers from reader.CSV_COLUMNS to include.
+    :param game_dir: Game resource directory used to resolve rank names.
+    :param compress: Gzip the output; defaults to True for ".gz" outputs.
+    :param workers: Number of processes to load saves with.
+    :return: The number of soldier rows written.
+    """
+    fmt = fmt or guess_format(output)
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format '{fmt}'")
+    if compress is None:
+        compress = output.lower().endswith(".gz")
+
+    count = 0
+
+    def counted(rows):
+        # The header is row 0, so the last index is the soldier count
+        nonlocal count
+        for i, row in enumerate(rows):
+            count = i
+            yield row
+
+    _WRITERS[fmt](
+        counted(iter_export_rows(save_paths, columns, game_dir, workers)),
+        output,
+        compress,
+    )
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export soldier rosters from OpenXCOM saves without the GUI."
+    )
+    parser.add_argument(
+        "saves",
+        nargs="+",
+        help="Save files, or directories to scan for *.sav/*.asav files.",
+    )
+    parser.add_argument("-o", "--output", required=True, help="Output file path.")
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=EXPORT_FORMATS,
+        default=None,
+        help="Output format (default: from the output extension, else csv).",
+    )
+    parser.add_argument(
+        "-c",
+        "--columns",
+        nargs="+",
+        default=None,
+        metavar="COLUMN",
+        help="Columns to export (default: all). Choices: "
+        + ", ".join(f'"{c}"' for c in reader.CSV_COLUMNS),
+    )
+    parser.add_argument(
+        "--game-dir",
+        default=None,
+        help="Game resource directory (containing 'common'); "
+        "used to resolve rank names.",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        default=None,
+        help="Gzip the output (implied by a .gz output name).",
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes to load saves with (0: one per CPU). "
+        "With more than one, saves are written in the order they finish.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Clear the ruleset and save caches before loading.",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
+
+    fmt = args.format or guess_format(args.output)
+    if fmt == "parquet":
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            parser.error("Parquet output requires pyarrow (pip install pyarrow).")
+
+    if args.columns:
+        unknown = [c for c in args.columns if c not in reader.CSV_COLUMNS]
+        if unknown:
+            parser.error(f"Unknown column(s): {', '.join(unknown)}")
+
+    if args.workers < 0:
+        parser.error("--workers must be 0 or more.")
+
+    if args.clear_cache:
+        GameDataManager(args.game_dir or "").clear_cache()
+
+    saves = find_saves(args.saves)
+    if not saves:
+        logger.error("No save files to export.")
+        return 1
+
+    count = export(
+        saves,
+        args.output,
+        fmt=fmt,
+        columns=args.columns,
+        game_dir=args.game_dir,
+        compress=args.gzip,
+        workers=args.workers or None,
+    )
+    logger.info(f"Wrote {count} soldiers from {len(saves)} save(s) to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+"""
+Parallel loading of many save files.
+
+YAML parsing is CPU-bound and holds the GIL, so saves are spread over a
+ProcessPoolExecutor. Each worker returns a compact, picklable SaveSummary
+(plain rows rather than the full object graph), and summaries are yielded in
+completion order.
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import reader
+from config import Config
+from data_manager import GameDataManager
+from translation_manager import TranslationManager
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Per-process managers, set up once by _init_worker
+_data_manager = None
+_translation_manager = None
+
+
+class SaveSummary:
+    """The parts of a loaded save needed for exports, cheap to pickle."""
+
+    __slots__ = (
+        "path",
+        "name",
+        "mods",
+        "base_count",
+        "mission_count",
+        "header",
+        "rows",
+        "error",
+    )
+
+    def __init__(self, path):
+        self.path = path
+        self.name = None
+        self.mods = ()
+        self.base_count = 0
+        self.mission_count = 0
+        self.header = ()
+        self.rows = []
+        self.error = None
+
+    @property
+    def soldier_count(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        if self.error:
+            return f"SaveSummary({self.path!r}, error={self.error!r})"
+        return f"SaveSummary({self.path!r}, soldiers={self.soldier_count})"
+
+
+def summarize_save(
+    file_path, columns=None, data_manager=None, translation_manager=None
+):
+    """
+    Load a save and reduce it to a SaveSummary.
+    Errors are recorded on the summary rather than raised.
+    :param file_path: Path to the save file.
+    :param columns: Headers from reader.CSV_COLUMNS to include in the rows.
+    :param data_manager: GameDataManager to load the save's rulesets into
+                         (optional).
+    :param translation_manager: TranslationManager used to resolve rank names
+                                (optional, requires data_manager).
+    :return: A SaveSummary.
+    """
+    summary = SaveSummary(file_path)
+    try:
+        cache_dir = data_manager._cache_dir if data_manager else None
+        meta, game = reader.load_save(file_path, cache_dir=cache_dir, lazy=True)
+        summary.name = meta.get("name")
+        summary.mods = tuple(meta.get("mods", []))
+
+        if data_manager:
+            data_manager.load_all(list(summary.mods))
+            if translation_manager:
+                translation_manager.load_all(list(summary.mods))
+
+        missions = reader.read_missions(game)
+        bases, soldiers, _ = reader.read_roster(game, missions)
+        if game.flush() and data_manager:
+            # The save cache grew; keep the directory in bounds
+            data_manager.prune_cache()
+        summary.base_count = len(bases)
+        summary.mission_count = len(missions)
+
+        rows = reader.iter_csv_rows(soldiers, columns=columns)
+        summary.header = tuple(next(rows))
+        rank = summary.header.index("Rank") if "Rank" in summary.header else None
+        for soldier, row in zip(soldiers, rows, strict=True):
+            if rank is not None and translation_manager:
+                row[rank] = translation_manager.get(
+                    translation_manager.get_rank_string(soldier.rank, soldier.type)
+                )
+            summary.rows.append(tuple(row))
+    except Exception as e:
+        logger.debug(f"Error loading {file_path}", exc_info=True)
+        summary.error = f"{type(e).__name__}: {e}"
+        summary.rows = []
+    return summary
+
+
+def _make_managers(game_dir, parse_workers=None, use_store=False):
+    if not game_dir:
+        return None, None
+    config = Config()
+    data_manager = GameDataManager(
+        game_dir,
+        parse_workers=parse_workers,
+        use_store=use_store,
+        cache_max_bytes=config.cache_max_bytes,
+        cache_max_entries=config.cache_max_entries,
+        verify_ruleset_files=config.verify_ruleset_files,
+    )
+    data_manager.index_mods()
+    return data_manager, TranslationManager(data_manager)
+
+
+def _init_worker(game_dir):
+    global _data_manager, _translation_manager
+    # Saves are already spread over the pool, so don't nest another one. The
+    # workers map the same ruleset store rather than each holding the dicts.
+    _data_manager, _translation_manager = _make_managers(
+        game_dir, parse_workers=1, use_store=True
+    )
+
+
+def _summarize_in_worker(file_path, columns):
+    return summarize_save(file_path, columns, _data_manager, _translation_manager)
+
+
+def load_saves(save_paths, workers=None, columns=None, game_dir=None):
+    """
+    Load many saves, yielding a SaveSummary for each as soon as it is ready.
+    :param save_paths: Iterable of save file paths.
+    :param workers: Number of worker processes. Defaults to the CPU count;
+                    1 loads the saves in this process, in order.
+    :param columns: Headers from reader.CSV_COLUMNS to include in the rows.
+    :param game_dir: Game resource directory used to resolve rank names.
+    :return: A generator of SaveSummary objects in completion order.
+    """
+    save_paths = list(save_paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = max(1, min(workers, len(save_paths)))
+
+    if workers == 1:
+        data_manager, translation_manager = _make_managers(game_dir)
+        for file_path in save_paths:
+            yield summarize_save(file_path, columns, data_manager, translation_manager)
+        return
+
+    logger.info(f"Loading {len(save_paths)} saves with {workers} worker processes.")
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(game_dir,)
+    ) as pool:
+        futures = [
+            pool.submit(_summarize_in_worker, file_path, columns)
+            for file_path in save_paths
+        ]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            # Stop queued loads if the consumer gives up early
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,208 @@
+"""
+Binary container for on-disk caches.
+
+Every cache file starts with a small header (magic bytes, container version,
+serializer id and the Python version that wrote it), followed by the payload
+encoded by one of the pluggable serializers below. Files with an unknown
+header, a different container version, or a marshal payload written by
+another Python version are rejected with CacheFormatError so callers can
+discard them and rebuild.
+
+Cache files live in a shared temp directory, so they are not trusted blindly:
+a file is only decoded with a serializer the caller allows (pickle can run
+code while loading, so it is never allowed by default), and only when the
+file and its directory belong to the current user and the directory is
+private to them.
+"""
+
+import json
+import logging
+import marshal
+import os
+import pickle
+import struct
+import sys
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+MAGIC = b"XSRC"
+FORMAT_VERSION = 1
+
+# magic, container version, serializer id, Python major, Python minor
+_HEADER = struct.Struct("<4sBBBB")
+
+# Cache file extension for files written by this module
+EXTENSION = ".cache"
+
+
+class CacheFormatError(ValueError):
+    """Raised when a cache file is corrupt, stale or of an unknown format."""
+
+
+class UntrustedCacheError(CacheFormatError):
+    """Raised when a cache file or directory may be writable by another user."""
+
+
+class Serializer:
+    __slots__ = ("name", "id", "dumps", "loads", "version_bound")
+
+    def __init__(self, name, id_, dumps, loads, version_bound=False):
+        self.name = name
+        self.id = id_
+        self.dumps = dumps
+        self.loads = loads
+        # Whether payloads are only readable by the Python version that wrote them
+        self.version_bound = version_bound
+
+
+def _json_dumps(obj):
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+SERIALIZERS = {
+    s.name: s
+    for s in (
+        # marshal is the fastest for plain dicts/lists/str/int, but its format
+        # may change between Python versions
+        Serializer("marshal", 1, marshal.dumps, marshal.loads, version_bound=True),
+        Serializer(
+            "pickle",
+            2,
+            lambda obj: pickle.dumps(obj, protocol=5),
+            pickle.loads,
+        ),
+        Serializer("json", 3, _json_dumps, json.loads),
+    )
+}
+_SERIALIZERS_BY_ID = {s.id: s for s in SERIALIZERS.values()}
+
+DEFAULT_SERIALIZER = "marshal"
+
+# Serializers loads() accepts unless the caller allows others
+SAFE_SERIALIZERS = ("marshal", "json")
+
+
+def _check_owner(st, path):
+    if st.st_uid != os.getuid():
+        raise UntrustedCacheError(f"{path} is owned by another user")
+
+
+def check_cache_dir(path):
+    """
+    Check that a cache directory belongs to the current user and is not
+    accessible to anyone else. Only enforced on POSIX systems; elsewhere the
+    temp directory is already per-user.
+    :raises UntrustedCacheError: If the directory cannot be trusted.
+    :raises OSError: If the directory cannot be stat'ed.
+    """
+    if not hasattr(os, "getuid"):
+        return
+    st = os.stat(path)
+    _check_owner(st, path)
+    if st.st_mode & 0o077:
+        raise UntrustedCacheError(f"{path} is accessible to other users")
+
+
+def ensure_cache_dir(path):
+    """
+    Create a cache directory private to the current user. An existing
+    directory is reused only if it belongs to the current user; its mode is
+    tightened to 0o700 if needed, since makedirs does not change it.
+    :raises UntrustedCacheError: If the directory belongs to another user.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    if not hasattr(os, "getuid"):
+        return
+    st = os.stat(path)
+    _check_owner(st, path)
+    if st.st_mode & 0o077:
+        os.chmod(path, 0o700)
+
+
+def dumps(obj, serializer=DEFAULT_SERIALIZER):
+    """
+    Encode an object into a cache file payload with a format header.
+    :param obj: The object to encode.
+    :param serializer: Name of a serializer in SERIALIZERS.
+    :return: The encoded bytes.
+    """
+    try:
+        backend = SERIALIZERS[serializer]
+    except KeyError:
+        raise ValueError(f"Unknown cache serializer '{serializer}'") from None
+
+    # Raises TypeError/ValueError for objects the serializer cannot encode,
+    # e.g. marshal and the datetime values YAML produces for timestamps
+    payload = backend.dumps(obj)
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, backend.id, *sys.version_info[:2])
+    return header + payload
+
+
+def loads(data, serializers=SAFE_SERIALIZERS):
+    """
+    Decode a cache file payload written by dumps().
+    :param data: The raw file contents.
+    :param serializers: Names of the serializers the payload may use.
+    :return: The decoded object.
+    :raises CacheFormatError: If the data is corrupt, stale, unknown or uses
+                              a serializer that is not allowed.
+    """
+    if len(data) < _HEADER.size:
+        raise CacheFormatError("file too short for a cache header")
+
+    magic, version, serializer_id, major, minor = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise CacheFormatError("not a cache file")
+    if version != FORMAT_VERSION:
+        raise CacheFormatError(f"unsupported cache format version {version}")
+
+    backend = _SERIALIZERS_BY_ID.get(serializer_id)
+    if backend is None:
+        raise CacheFormatError(f"unknown cache serializer id {serializer_id}")
+    if backend.name not in serializers:
+        raise UntrustedCacheError(f"{backend.name} cache payloads are not allowed")
+    if backend.version_bound and (major, minor) != sys.version_info[:2]:
+        raise CacheFormatError(
+            f"{backend.name} cache written by Python {major}.{minor}"
+        )
+
+    try:
+        return backend.loads(data[_HEADER.size :])
+    except Exception as e:
+        raise CacheFormatError(f"corrupt {backend.name} payload: {e}") from e
+
+
+def dump(obj, path, serializer=DEFAULT_SERIALIZER):
+    """
+    Write an object to a cache file. The file is written under a temporary
+    name and moved into place, so readers never see a partial file.
+    """
+    data = dumps(obj, serializer)
+    check_cache_dir(os.path.dirname(os.path.abspath(path)))
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def load(path, serializers=SAFE_SERIALIZERS):
+    """
+    Read an object from a cache file written by dump().
+    :param serializers: Names of the serializers the file may use.
+    :raises CacheFormatError: If the file is corrupt, stale, unknown or may
+                              have been written by another user.
+    :raises OSError: If the file cannot be read.
+    """
+    check_cache_dir(os.path.dirname(os.path.abspath(path)))
+    with open(path, "rb") as f:
+        if hasattr(os, "getuid"):
+            _check_owner(os.fstat(f.fileno()), path)
+        return loads(f.read(), serializers)
@@ -6,10 +6,17 @@ logger = logging.getLogger(__name__)
 
 CONFIG_FILE = "config.json"
 
+# Limits for the cache directory; 0 disables a limit
+DEFAULT_CACHE_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_CACHE_MAX_ENTRIES = 4096
+
 
 class Config:
     def __init__(self):
         self.game_dir = ""
+        self.cache_max_bytes = DEFAULT_CACHE_MAX_BYTES
+        self.cache_max_entries = DEFAULT_CACHE_MAX_ENTRIES
+        self.verify_ruleset_files = False
         self._load()
 
     def _get_config_path(self):
@@ -31,14 +38,44 @@ class Config:
                 with open(path, encoding="utf-8") as f:
                     data = json.load(f)
                     self.game_dir = data.get("game_dir", "")
+                    self.cache_max_bytes = self._get_limit(
+                        data, "cache_max_bytes", DEFAULT_CACHE_MAX_BYTES
+                    )
+                    self.cache_max_entries = self._get_limit(
+                        data, "cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES
+                    )
+                    self.verify_ruleset_files = self._get_flag(
+                        data, "verify_ruleset_files", False
+                    )
                     logger.info(f"Loaded config from {path}")
             except Exception as e:
                 logger.error(f"Failed to load user config: {e}")
 
+    @staticmethod
+    def _get_limit(data, key, default):
+        value = data.get(key, default)
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            logger.warning(f"Ignoring invalid {key} in config: {value!r}")
+            return default
+        return value
+
+    @staticmethod
+    def _get_flag(data, key, default):
+        value = data.get(key, default)
+        if not isinstance(value, bool):
+            logger.warning(f"Ignoring invalid {key} in config: {value!r}")
+            return default
+        return value
+
     def save(self):
         path = self._get_config_path()
         try:
-            data = {"game_dir": self.game_dir}
+            data = {
+                "game_dir": self.game_dir,
+                "cache_max_bytes": self.cache_max_bytes,
+                "cache_max_entries": self.cache_max_entries,
+                "verify_ruleset_files": self.verify_ruleset_files,
+            }
             with open(path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=4)
                 logger.info(f"Saved config to {path}")
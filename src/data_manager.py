@@ -1,17 +1,103 @@
 import hashlib
-import json
 import logging
 import os
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-import yaml
+import cache_format
+import ruleset_store
+import yaml_loader
+from config import DEFAULT_CACHE_MAX_BYTES, DEFAULT_CACHE_MAX_ENTRIES
 
 logger = logging.getLogger(__name__)
 
+# Ruleset sections kept from each .rul file
+RULESET_SECTIONS = ("items", "soldiers", "manufacture", "facilities", "extraSprites")
+
+# Below this many files, starting worker processes costs more than it saves
+PARALLEL_PARSE_MIN_FILES = 32
+
+
+def _read_ruleset(file_path):
+    """
+    Parse one .rul file without merging it.
+
+    Runs in worker processes, so it only returns plain data: a list with one
+    {section: entries} dict per non-empty document (only RULESET_SECTIONS are
+    kept), and an error message if parsing stopped early. Documents read
+    before an error are still returned.
+    """
+    docs = []
+    try:
+        with open(file_path, encoding="utf-8", errors="ignore") as f:
+            # Mod rulesets can have multiple documents separated by ---
+            for doc in yaml_loader.safe_load_all(f):
+                if not doc:
+                    continue
+                docs.append({k: doc[k] for k in RULESET_SECTIONS if doc.get(k)})
+    except Exception as e:
+        return docs, str(e)
+    return docs, None
+
+
+def _stat_key(path, size=True):
+    """
+    Return (mtime_ns, size) for a path, or just mtime_ns when size is False.
+    Returns None if the path cannot be stat'ed.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size) if size else st.st_mtime_ns
+
+
+def _touch(path):
+    """Mark a cache file as recently used for LRU eviction."""
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
 
 class GameDataManager:
-    def __init__(self, base_path):
+    def __init__(
+        self,
+        base_path,
+        parse_workers=None,
+        cache_serializer=cache_format.DEFAULT_SERIALIZER,
+        cache_max_bytes=DEFAULT_CACHE_MAX_BYTES,
+        cache_max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+        use_store=False,
+        verify_ruleset_files=False,
+    ):
+        """
+        :param base_path: Game resource directory (containing 'common').
+        :param parse_workers: Worker processes used to parse rulesets on a cold
+                              load. Defaults to the CPU count; 1 parses in
+                              this process.
+        :param cache_serializer: Name of the cache_format serializer used for
+                                 cache files written by this manager.
+        :param cache_max_bytes: Size cap for the cache directory (0: no cap).
+        :param cache_max_entries: File count cap for the cache directory
+                                  (0: no cap).
+        :param use_store: Serve the ruleset tables from a memory-mapped
+                          RulesetStore instead of holding them as dicts, so
+                          processes loading the same rulesets share one copy.
+        :param verify_ruleset_files: Stat every ruleset file on a warm load, so
+                                     files edited in place are noticed even
+                                     when their directory's mtime is unchanged.
+        """
         self.base_path = base_path
+        self.parse_workers = parse_workers
+        self.cache_serializer = cache_serializer
+        self.cache_max_bytes = cache_max_bytes
+        self.cache_max_entries = cache_max_entries
+        self.use_store = use_store
+        self.verify_ruleset_files = verify_ruleset_files
+        self._store = None
+        # Cache files the loaded data comes from, by role; never evicted
+        self._cache_in_use = {}
         self.mod_map = {}
         self.master_mod_map = {}
         self.master = "xcom1"
@@ -30,7 +116,7 @@ class GameDataManager:
         self.is_loaded = False
 
     def clear_cache(self):
-        """Remove all cached ruleset files."""
+        """Remove all cached files (compiled rulesets and parsed saves)."""
         if os.path.isdir(self._cache_dir):
             failures = 0
             for f in os.listdir(self._cache_dir):
@@ -46,12 +132,16 @@ class GameDataManager:
                     "could not be removed)."
                 )
             else:
-                logger.info("Ruleset cache cleared.")
+                logger.info("Cache cleared.")
 
     def index_mods(self):
         """
         Scans 'standard' and 'user/mods' to index available mods.
         Populates self.mod_map with {mod_id: mod_path}.
+
+        The result is cached: a search directory whose mtime is unchanged is
+        not listed again, and a metadata.yml whose mtime and size are
+        unchanged is not parsed again.
         """
         self.mod_map.clear()
         self.master_mod_map.clear()
@@ -60,35 +150,122 @@ class GameDataManager:
             os.path.join(self.base_path, "user", "mods"),
         ]
 
+        index_path = self._get_mod_index_path()
+        self._cache_in_use["mod_index"] = index_path
+        cached = self._load_mod_index(index_path)
+        index = {"dirs": {}, "metadata": {}}
+
         for search_dir in search_dirs:
-            if not os.path.isdir(search_dir):
+            mtime = _stat_key(search_dir, size=False)
+            cached_dir = cached["dirs"].get(search_dir)
+            if mtime is not None and cached_dir and cached_dir["mtime"] == mtime:
+                mod_paths = cached_dir["mods"]
+            else:
+                mod_paths = self._scan_mod_dir(search_dir)
+            if mtime is not None:
+                index["dirs"][search_dir] = {"mtime": mtime, "mods": mod_paths}
+
+            for mod_path in mod_paths:
+                metadata_path = os.path.join(mod_path, "metadata.yml")
+                stamp = _stat_key(metadata_path)
+                metadata = cached["metadata"].get(metadata_path)
+                # Serializers such as json return the cached stamp as a list
+                if stamp is None or not metadata or tuple(metadata["stamp"]) != stamp:
+                    metadata = self._read_mod_metadata(metadata_path)
+                    if metadata is None:
+                        continue
+                    metadata["stamp"] = stamp
+                if stamp is not None:
+                    index["metadata"][metadata_path] = metadata
+
+                mod_id = metadata["id"]
+                self.mod_map[mod_id] = mod_path
+                if metadata["is_master"]:
+                    self.master_mod_map[mod_id] = metadata["master"]
+
+        if index != cached:
+            self._save_mod_index(index_path, index)
+
+    @staticmethod
+    def _scan_mod_dir(search_dir):
+        """
+        List the mod folders directly inside a search directory, skipping
+        entries that resolve outside of it.
+        """
+        mod_paths = []
+        if not os.path.isdir(search_dir):
+            return mod_paths
+
+        for item in os.listdir(search_dir):
+            mod_path = os.path.join(search_dir, item)
+
+            search_root = os.path.realpath(search_dir)
+            candidate = os.path.realpath(mod_path)
+            if os.path.commonpath([search_root, candidate]) != search_root:
                 continue
 
-            for item in os.listdir(search_dir):
-                mod_path = os.path.join(search_dir, item)
+            if not os.path.isdir(mod_path):
+                continue
 
-                search_root = os.path.realpath(search_dir)
-                candidate = os.path.realpath(mod_path)
-                if os.path.commonpath([search_root, candidate]) != search_root:
-                    continue
+            mod_paths.append(mod_path)
+        return mod_paths
 
-                if not os.path.isdir(mod_path):
-                    continue
+    @staticmethod
+    def _read_mod_metadata(metadata_path):
+        """
+        Parse a mod's metadata.yml. Returns {"id", "is_master", "master"}, or
+        None if the file is missing, invalid or has no id.
+        """
+        if not os.path.exists(metadata_path):
+            return None
+        try:
+            with open(metadata_path, encoding="utf-8") as f:
+                metadata = yaml_loader.safe_load(f)
+        except Exception as e:
+            item = os.path.basename(os.path.dirname(metadata_path))
+            logger.error(f"Error reading metadata for {item}: {e}")
+            return None
+        if not metadata or "id" not in metadata:
+            return None
+        return {
+            "id": metadata["id"],
+            "is_master": bool(metadata.get("isMaster")),
+            "master": metadata.get("master", "xcom1"),
+        }
+
+    def _get_mod_index_path(self):
+        key = hashlib.sha256(self.base_path.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"mod_index_{key}{cache_format.EXTENSION}")
+
+    def _load_mod_index(self, path):
+        """
+        Load the cached mod index, or an empty one if it is missing or invalid.
+        """
+        empty = {"dirs": {}, "metadata": {}}
+        if not os.path.exists(path):
+            return empty
+        try:
+            index = cache_format.load(path, (self.cache_serializer,))
+            if not isinstance(index.get("dirs"), dict) or not isinstance(
+                index.get("metadata"), dict
+            ):
+                raise ValueError("unexpected mod index layout")
+        except Exception as e:
+            logger.warning(f"Mod index cache read failed, will rescan: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return empty
+        _touch(path)
+        return index
 
-                metadata_path = os.path.join(mod_path, "metadata.yml")
-                if os.path.exists(metadata_path):
-                    try:
-                        with open(metadata_path, encoding="utf-8") as f:
-                            metadata = yaml.safe_load(f)
-                            if metadata and "id" in metadata:
-                                mod_id = metadata["id"]
-                                self.mod_map[mod_id] = mod_path
-                                if metadata.get("isMaster"):
-                                    self.master_mod_map[mod_id] = metadata.get(
-                                        "master", "xcom1"
-                                    )
-                    except Exception as e:
-                        logger.error(f"Error reading metadata for {item}: {e}")
+    def _save_mod_index(self, path, index):
+        try:
+            cache_format.ensure_cache_dir(self._cache_dir)
+            cache_format.dump(index, path, self.cache_serializer)
+        except Exception as e:
+            logger.warning(f"Failed to save mod index cache: {e}")
 
     def determine_master(self, save_mod_list):
         """
@@ -103,20 +280,46 @@ class GameDataManager:
     def load_all(self, save_mod_list):
         """
         Loads ruleset data in order: Common -> Standard (Master) -> Mods.
-        Uses a persistent JSON cache keyed by the mod list hash.
+        Uses a persistent binary cache keyed by the mod list hash.
         """
         if not self.mod_map or not self.master_mod_map:
             self.index_mods()
 
         self.master = self.determine_master(save_mod_list)
 
-        # Try loading from cache first
-        cache_key = self._compute_cache_key(save_mod_list)
-        if self._load_cache(cache_key):
+        # Try loading from cache first. The stat manifest validates the cache
+        # key from directory mtimes; only the files of directories that
+        # changed are stat'ed, and files are only hashed when those differ.
+        sources = self._ruleset_sources(save_mod_list)
+        stamps = self._stat_sources(sources)
+        manifest_path = self._get_manifest_path(save_mod_list, sources)
+        cache_key = self._load_manifest(manifest_path, sources, stamps)
+        files = None
+        if cache_key is None:
+            files, file_stamps = self._collect_and_stat(save_mod_list, sources)
+            cache_key = self._compute_cache_key(save_mod_list, files)
+        self._cache_in_use.update(
+            manifest=manifest_path,
+            rulesets=self._get_cache_path(cache_key),
+            store=self._get_store_path(cache_key),
+        )
+
+        loaded = self.use_store and self._attach_store(cache_key)
+        if not loaded and self._load_cache(cache_key):
+            loaded = True
+            if self.use_store:
+                self._build_store(cache_key)
+                self.prune_cache()
+        if loaded:
             logger.info("Loaded ruleset data from cache.")
+            if files is not None:
+                self._save_manifest(manifest_path, stamps, cache_key, file_stamps)
             self.is_loaded = True
             return
 
+        if files is None:
+            files, file_stamps = self._collect_and_stat(save_mod_list, sources)
+
         # Reset data
         self.items = {}
         self.soldiers = {}
@@ -124,73 +327,171 @@ class GameDataManager:
         self.facilities = {}
         self.extraSprites = {}
 
-        # 1. Load Common
-        logger.info("Loading common rulesets...")
-        common_path = os.path.join(self.base_path, "common")
-        self._load_rulesets(os.path.join(common_path, "Ruleset"), common_path)
+        logger.info(f"Loading rulesets (master: {self.master})...")
+        if not self._load_ruleset_files(files):
+            # Retry the failed files next time rather than caching the result
+            self.is_loaded = True
+            return
 
-        # 2. Determine and Load Master
-        logger.info(f"Loading master rulesets ({self.master})...")
-        master_path = os.path.join(self.base_path, "standard", self.master)
-        self._load_rulesets(os.path.join(master_path, "Ruleset"), master_path)
+        # Save to cache (the manifest first, so pruning accounts for it)
+        self._save_manifest(manifest_path, stamps, cache_key, file_stamps)
+        self._save_cache(cache_key)
+        if self.use_store:
+            self._build_store(cache_key)
+        self.prune_cache()
+        self.is_loaded = True
 
-        # 3. Load Mods based on load order
-        logger.info("Loading user mod rulesets...")
-        for mod_entry in save_mod_list:
-            mod_id = mod_entry.split(" ver:", 1)[0].strip()
-            if mod_id in self.mod_map:
-                mod_path = self.mod_map[mod_id]
-                ruleset_dir = os.path.join(mod_path, "Ruleset")
+    @staticmethod
+    def _stat_sources(sources):
+        """
+        Snapshot the mtimes of ruleset directories and mod root .rul files.
+        Missing paths map to None.
 
-                # Check for individual ruleset files in mod root
-                # (OpenXcom supports a single ruleset named after the mod)
-                mod_rul = os.path.join(mod_path, f"{mod_id}.rul")
-                if os.path.exists(mod_rul):
-                    self._parse_file(mod_rul, mod_path)
+        Adding, removing or renaming a .rul file changes its directory's
+        mtime, but editing a file in place does not; use --clear-cache (or
+        Settings -> Clear Cache) after such edits, or set
+        verify_ruleset_files.
+        """
+        stamps = {}
+        for _, path, _ in sources:
+            try:
+                stamps[path] = os.stat(path).st_mtime_ns
+            except OSError:
+                stamps[path] = None
+        return stamps
 
-                # OR, check Ruleset directory if it exists
-                if os.path.isdir(ruleset_dir):
-                    self._load_rulesets(ruleset_dir, mod_path)
+    def _get_manifest_path(self, save_mod_list, sources):
+        raw = "|".join(
+            [self.base_path, *save_mod_list, *(path for _, path, _ in sources)]
+        )
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self._cache_dir, f"manifest_{key}{cache_format.EXTENSION}")
 
-        # Save to cache
-        self._save_cache(cache_key)
-        self.is_loaded = True
+    @staticmethod
+    def _stat_files(paths):
+        """
+        Snapshot the (mtime_ns, size) of ruleset files, keyed by path.
+        Missing files map to None.
+        """
+        stamps = {}
+        for fp in paths:
+            try:
+                st = os.stat(fp)
+                stamps[fp] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                stamps[fp] = None
+        return stamps
+
+    def _stat_source(self, is_dir, path):
+        """
+        Stamp the .rul files a ruleset source currently contributes, keyed
+        by path.
+        """
+        paths = [path]
+        if is_dir:
+            try:
+                paths = [
+                    os.path.join(path, fn)
+                    for fn in os.listdir(path)
+                    if fn.endswith(".rul")
+                ]
+            except OSError:
+                paths = []
+        return {
+            fp: stamp
+            for fp, stamp in self._stat_files(paths).items()
+            if stamp is not None
+        }
+
+    def _collect_and_stat(self, save_mod_list, sources):
+        """
+        List the ruleset files to load and stamp them, before any is parsed,
+        so that an edit made while parsing is not recorded as seen.
+        :return: (files, file_stamps), as _collect_ruleset_files and
+                 _stat_files return them.
+        """
+        files = self._collect_ruleset_files(save_mod_list, sources)
+        return files, self._stat_files(fp for fp, _ in files)
+
+    def _load_manifest(self, path, sources, stamps):
+        """
+        Return the cached ruleset key if the manifest still matches the
+        ruleset sources, otherwise None. Sources whose stamp is unchanged are
+        trusted; the files of the others are listed and stat'ed and must match
+        the recorded ones. With verify_ruleset_files, every recorded file is
+        stat'ed as well.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            data = cache_format.load(path, (self.cache_serializer,))
+        except Exception as e:
+            logger.warning(f"Manifest read failed, will re-validate: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        recorded_stamps = data.get("stamps")
+        files = data.get("files")
+        if not isinstance(recorded_stamps, dict) or not isinstance(files, dict):
+            return None
+        # (JSON manifests hold the file stamps as lists)
+        recorded = {fp: stamp and tuple(stamp) for fp, stamp in files.items()}
+
+        if self.verify_ruleset_files and self._stat_files(recorded) != recorded:
+            logger.info("Ruleset files changed; re-validating cache.")
+            return None
+
+        changed = False
+        for is_dir, source, _ in sources:
+            if recorded_stamps.get(source) == stamps[source]:
+                continue
+            changed = True
+            recorded_files = {
+                fp: stamp
+                for fp, stamp in recorded.items()
+                if (os.path.dirname(fp) if is_dir else fp) == source
+            }
+            if self._stat_source(is_dir, source) != recorded_files:
+                logger.info("Ruleset directories changed; re-validating cache.")
+                return None
+
+        cache_key = data.get("cache_key")
+        if changed:
+            # Only directory stamps moved, e.g. a temporary file came and went
+            self._save_manifest(path, stamps, cache_key, recorded)
+        else:
+            _touch(path)
+        return cache_key
+
+    def _save_manifest(self, path, stamps, cache_key, file_stamps):
+        data = {"stamps": stamps, "files": file_stamps, "cache_key": cache_key}
+        try:
+            cache_format.ensure_cache_dir(self._cache_dir)
+            cache_format.dump(data, path, self.cache_serializer)
+        except Exception as e:
+            logger.warning(f"Failed to save cache manifest: {e}")
 
-    def _compute_cache_key(self, save_mod_list):
+    def _compute_cache_key(self, save_mod_list, files=None):
         """
         Produce a hash from the base path, mod list, and
         modification times of all .rul files that would be loaded.
         """
         raw = self.base_path + "|" + "|".join(save_mod_list)
+        if files is None:
+            files = self._collect_ruleset_files(save_mod_list)
 
         # Collect mtimes from all ruleset files to detect on-disk changes
-        rul_dirs = [
-            os.path.join(self.base_path, "common", "Ruleset"),
-            os.path.join(self.base_path, "standard", self.master, "Ruleset"),
-        ]
-        for mod_entry in save_mod_list:
-            mod_id = mod_entry.split(" ver:", 1)[0].strip()
-            if mod_id in self.mod_map:
-                mod_path = self.mod_map[mod_id]
-                mod_rul = os.path.join(mod_path, f"{mod_id}.rul")
-                if os.path.exists(mod_rul):
-                    raw += f"|{mod_rul}:{os.path.getmtime(mod_rul)}"
-                rul_dir = os.path.join(mod_path, "Ruleset")
-                if os.path.isdir(rul_dir):
-                    rul_dirs.append(rul_dir)
-
-        for rul_dir in rul_dirs:
-            if not os.path.isdir(rul_dir):
-                continue
-            for fn in sorted(os.listdir(rul_dir)):
-                if fn.endswith(".rul"):
-                    fp = os.path.join(rul_dir, fn)
-                    raw += f"|{fp}:{os.path.getmtime(fp)}"
+        for fp, _ in files:
+            raw += f"|{fp}:{os.path.getmtime(fp)}"
 
         return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
 
     def _get_cache_path(self, cache_key):
-        return os.path.join(self._cache_dir, f"rulesets_{cache_key}.json")
+        return os.path.join(
+            self._cache_dir, f"rulesets_{cache_key}{cache_format.EXTENSION}"
+        )
 
     def _load_cache(self, cache_key):
         """
@@ -200,8 +501,8 @@ class GameDataManager:
         if not os.path.exists(path):
             return False
         try:
-            with open(path, encoding="utf-8") as f:
-                data = json.load(f)
+            data = cache_format.load(path, (self.cache_serializer,))
+            _touch(path)
             self.items = data.get("items", {})
             self.soldiers = data.get("soldiers", {})
             self.manufacture = data.get("manufacture", {})
@@ -219,10 +520,10 @@ class GameDataManager:
 
     def _save_cache(self, cache_key):
         """
-        Persist compiled ruleset data to a JSON cache file.
+        Persist compiled ruleset data to a binary cache file.
         """
         try:
-            os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+            cache_format.ensure_cache_dir(self._cache_dir)
             path = self._get_cache_path(cache_key)
             data = {
                 "items": self.items,
@@ -231,56 +532,316 @@ class GameDataManager:
                 "facilities": self.facilities,
                 "extraSprites": self.extraSprites,
             }
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(data, f)
+            cache_format.dump(data, path, self.cache_serializer)
             logger.info(f"Saved ruleset cache to {path}")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
 
-    def _load_rulesets(self, path, source_dir):
+    def _get_store_path(self, cache_key):
+        return os.path.join(
+            self._cache_dir, f"rulesets_{cache_key}{ruleset_store.EXTENSION}"
+        )
+
+    def _attach_store(self, cache_key):
         """
-        Loads all .rul files in a directory in alphabetical order.
+        Map the ruleset store for a cache key and serve the ruleset tables
+        from it. Returns True on success.
 
-        Alphabetical ordering guarantees deterministic merge precedence:
-        later files overwrite fields set by earlier ones.
+        The store already mapped for the same key is reused. A previous store
+        is not closed: tables handed out earlier keep its mapping open until
+        they are garbage collected.
         """
+        path = self._get_store_path(cache_key)
         if not os.path.exists(path):
-            return
+            return False
+        if (
+            self._store is not None
+            and not self._store.closed
+            and self._store.path == path
+        ):
+            store = self._store
+        else:
+            try:
+                store = ruleset_store.RulesetStore(path, (self.cache_serializer,))
+                # Raises KeyError if a table is missing
+                for section in RULESET_SECTIONS:
+                    store[section]
+            except Exception as e:
+                logger.warning(f"Ruleset store read failed, will rebuild: {e}")
+                try:
+                    os.remove(path)
+                    logger.info(f"Removed corrupt cache file: {path}")
+                except OSError:
+                    pass
+                return False
+
+        self._store = store
+        for section in RULESET_SECTIONS:
+            setattr(self, section, store[section])
+        _touch(path)
+        return True
 
-        for filename in sorted(os.listdir(path)):
-            if filename.endswith(".rul"):
-                self._parse_file(os.path.join(path, filename), source_dir)
+    def _build_store(self, cache_key):
+        """
+        Write the loaded ruleset tables to a store and switch to it, releasing
+        the in-memory dicts.
+        """
+        path = self._get_store_path(cache_key)
+        try:
+            cache_format.ensure_cache_dir(self._cache_dir)
+            ruleset_store.write_store(
+                path,
+                {section: getattr(self, section) for section in RULESET_SECTIONS},
+                self.cache_serializer,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save ruleset store: {e}")
+            return
+        logger.info(f"Saved ruleset store to {path}")
+        self._attach_store(cache_key)
 
-    def _parse_file(self, file_path, source_dir):
+    def prune_cache(self):
         """
-        Parses a single YAML ruleset file and merges it into the master data.
+        Evict least recently used cache files, one at a time, until the cache
+        directory is within cache_max_bytes and cache_max_entries. Files the
+        loaded rulesets come from (mod index, manifest, ruleset cache and
+        store) are never evicted.
+
+        Recency is the file mtime: entries are written fresh and touched on
+        every cache hit (saves, rulesets and fragments alike). Call this after
+        writing to the cache.
         """
+        max_bytes = self.cache_max_bytes or None
+        max_entries = self.cache_max_entries or None
+        if max_bytes is None and max_entries is None:
+            return
+
+        entries = []
         try:
-            with open(file_path, encoding="utf-8", errors="ignore") as f:
-                # Mod rulesets can have multiple documents separated by ---
-                docs = yaml.safe_load_all(f)
-                for doc in docs:
-                    if not doc:
+            with os.scandir(self._cache_dir) as it:
+                for entry in it:
+                    # Skip in-progress writes of other processes
+                    if entry.name.endswith(".tmp") or not entry.is_file():
                         continue
+                    try:
+                        st = entry.stat()
+                    except FileNotFoundError:
+                        continue  # Evicted by another process meanwhile
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            return
 
-                    self._merge_list_to_dict(
-                        doc.get("items", []), self.items, source_dir
-                    )
-                    self._merge_list_to_dict(
-                        doc.get("soldiers", []), self.soldiers, source_dir
-                    )
-                    self._merge_list_to_dict(
-                        doc.get("manufacture", []), self.manufacture, source_dir
-                    )
-                    self._merge_list_to_dict(
-                        doc.get("facilities", []), self.facilities, source_dir
-                    )
-                    self._merge_list_to_dict(
-                        doc.get("extraSprites", []), self.extraSprites, source_dir
-                    )
+        entries.sort()  # Least recently used first
+        count = len(entries)
+        total_bytes = sum(size for _, size, _ in entries)
+        in_use = set(self._cache_in_use.values())
+        evicted = 0
+        for _, size, path in entries:
+            if (max_entries is None or count <= max_entries) and (
+                max_bytes is None or total_bytes <= max_bytes
+            ):
+                break
+            if path in in_use:
+                continue
+            try:
+                os.remove(path)
+                evicted += 1
+            except FileNotFoundError:
+                pass  # Evicted by another process meanwhile
+            except OSError:
+                logger.warning(f"Failed to evict cache file: {path}")
+                continue
+            count -= 1
+            total_bytes -= size
+        if evicted:
+            logger.info(f"Evicted {evicted} least recently used cache file(s).")
 
+    def _ruleset_sources(self, save_mod_list):
+        """
+        List where rulesets are loaded from, in merge order: Common ->
+        Standard (Master) -> Mods in save load order. Each entry is an
+        (is_dir, path, source_dir) tuple; directories contribute their .rul
+        files. Touches no files.
+        """
+        common_path = os.path.join(self.base_path, "common")
+        master_path = os.path.join(self.base_path, "standard", self.master)
+        sources = [
+            (True, os.path.join(common_path, "Ruleset"), common_path),
+            (True, os.path.join(master_path, "Ruleset"), master_path),
+        ]
+
+        for mod_entry in save_mod_list:
+            mod_id = mod_entry.split(" ver:", 1)[0].strip()
+            if mod_id in self.mod_map:
+                mod_path = self.mod_map[mod_id]
+
+                # Check for individual ruleset files in mod root
+                # (OpenXcom supports a single ruleset named after the mod)
+                mod_rul = os.path.join(mod_path, f"{mod_id}.rul")
+                sources.append((False, mod_rul, mod_path))
+
+                # OR, check Ruleset directory if it exists
+                sources.append((True, os.path.join(mod_path, "Ruleset"), mod_path))
+
+        return sources
+
+    def _collect_ruleset_files(self, save_mod_list, sources=None):
+        """
+        List the .rul files to load as (file_path, source_dir) pairs, in merge
+        order.
+
+        Within a directory files are sorted alphabetically, which guarantees
+        deterministic merge precedence: later files overwrite fields set by
+        earlier ones.
+        """
+        if sources is None:
+            sources = self._ruleset_sources(save_mod_list)
+
+        files = []
+        for is_dir, path, source_dir in sources:
+            if not is_dir:
+                if os.path.exists(path):
+                    files.append((path, source_dir))
+            elif os.path.isdir(path):
+                for filename in sorted(os.listdir(path)):
+                    if filename.endswith(".rul"):
+                        files.append((os.path.join(path, filename), source_dir))
+        return files
+
+    def _read_ruleset_files(self, paths):
+        """
+        Parse ruleset files, in worker processes when there are enough of them.
+        Results are returned in the same order as `paths`.
+        """
+        workers = self.parse_workers or os.cpu_count() or 1
+        if workers > 1 and len(paths) >= PARALLEL_PARSE_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    chunksize = max(1, len(paths) // (workers * 4))
+                    return list(pool.map(_read_ruleset, paths, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(
+                    f"Parallel ruleset parsing failed, parsing serially: {e}"
+                )
+        return [_read_ruleset(path) for path in paths]
+
+    def _load_ruleset_files(self, files):
+        """
+        Parse (file_path, source_dir) pairs and merge them in the given order.
+        Files whose parsed fragment is cached are not parsed again.
+        Returns False if any file could not be read completely.
+        """
+        fragment_paths = [self._get_fragment_path(path) for path, _ in files]
+        results = [self._load_fragment(fp) if fp else None for fp in fragment_paths]
+
+        missing = [i for i, result in enumerate(results) if result is None]
+        logger.info(
+            f"Parsing {len(missing)} of {len(files)} ruleset files "
+            f"({len(files) - len(missing)} cached)..."
+        )
+        if missing:
+            parsed = self._read_ruleset_files([files[i][0] for i in missing])
+            for i, result in zip(missing, parsed, strict=True):
+                results[i] = result
+            # A failed read (e.g. a permission error) may not recur, and
+            # fixing it need not change the file's stamp, so don't cache it
+            self._save_fragments(
+                [
+                    (fragment_paths[i], results[i])
+                    for i in missing
+                    if fragment_paths[i] and results[i][1] is None
+                ]
+            )
+
+        complete = True
+        for (file_path, source_dir), (docs, error) in zip(files, results, strict=True):
+            self._merge_docs(docs, source_dir)
+            if error:
+                logger.error(f"Error parsing ruleset {file_path}: {error}")
+                complete = False
+        return complete
+
+    def _get_fragment_path(self, file_path):
+        """
+        Build the cache path for one parsed ruleset file, keyed by its path,
+        mtime and size. Returns None if the file cannot be stat'ed.
+        """
+        try:
+            real_path = os.path.realpath(file_path)
+            st = os.stat(real_path)
+        except OSError:
+            return None
+        path_key = hashlib.sha256(real_path.encode("utf-8")).hexdigest()[:16]
+        stat_key = hashlib.sha256(
+            f"{st.st_mtime_ns}|{st.st_size}".encode()
+        ).hexdigest()[:16]
+        return os.path.join(
+            self._cache_dir, f"fragment_{path_key}_{stat_key}{cache_format.EXTENSION}"
+        )
+
+    def _load_fragment(self, path):
+        """
+        Attempt to load a cached (docs, error) fragment. Returns None on a miss.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            data = cache_format.load(path, (self.cache_serializer,))
+            _touch(path)
+            return data["docs"], data["error"]
         except Exception as e:
-            logger.error(f"Error parsing ruleset {file_path}: {e}")
+            logger.warning(f"Fragment cache read failed, will re-parse: {e}")
+            try:
+                os.remove(path)
+                logger.info(f"Removed corrupt cache file: {path}")
+            except OSError:
+                pass
+            return None
+
+    def _save_fragments(self, fragments):
+        """
+        Persist parsed (docs, error) fragments, replacing older entries for
+        the same ruleset files.
+        """
+        if not fragments:
+            return
+        try:
+            cache_format.ensure_cache_dir(self._cache_dir)
+        except (OSError, cache_format.UntrustedCacheError) as e:
+            logger.warning(f"Failed to save fragment cache: {e}")
+            return
+
+        saved = set()
+        for path, (docs, error) in fragments:
+            try:
+                cache_format.dump(
+                    {"docs": docs, "error": error}, path, self.cache_serializer
+                )
+                saved.add(os.path.basename(path))
+            except Exception as e:
+                logger.warning(f"Failed to save fragment cache: {e}")
+
+        # Entries for earlier versions of these files can never be hit again
+        prefixes = tuple(fn.rsplit("_", 1)[0] + "_" for fn in saved)
+        if not prefixes:
+            return
+        for fn in os.listdir(self._cache_dir):
+            if fn.startswith(prefixes) and fn not in saved:
+                try:
+                    os.remove(os.path.join(self._cache_dir, fn))
+                except OSError:
+                    pass
+        logger.debug(f"Saved {len(saved)} ruleset fragments to the cache.")
+
+    def _merge_docs(self, docs, source_dir):
+        """
+        Merge parsed ruleset documents into the master data.
+        """
+        for doc in docs:
+            for section in RULESET_SECTIONS:
+                self._merge_list_to_dict(
+                    doc.get(section, []), getattr(self, section), source_dir
+                )
 
     def _merge_list_to_dict(self, source_list, target_dict, source_dir):
         """
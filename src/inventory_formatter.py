@@ -1,10 +1,15 @@
-def format_inventory_for_display(equipment_layout, translator=None):
+def format_inventory_for_display(
+    equipment_layout, translator=None, translate_many=None
+):
     """
     Formats the soldier's inventory data for display.
 
     Args:
         equipment_layout: A list of inventory items from the soldier data.
         translator: A callable that takes a key and returns a translated string.
+        translate_many: A callable that takes a list of keys and returns their
+            translations in order. When given, all keys are translated in one
+            batch and `translator` is ignored.
 
     Returns:
         A dictionary where keys are slot names and values are lists of
@@ -14,6 +19,18 @@ def format_inventory_for_display(equipment_layout, translator=None):
     if not equipment_layout:
         return {}
 
+    if translate_many:
+        keys = set()
+        for item in equipment_layout:
+            keys.add(item.get("slot", "Unslotted"))
+            keys.add(item["itemType"])
+            if "ammoItemSlots" in item and isinstance(item["ammoItemSlots"], list):
+                keys.update(item["ammoItemSlots"])
+            elif "ammoItem" in item:
+                keys.add(item["ammoItem"])
+        keys = list(keys)
+        translator = dict(zip(keys, translate_many(keys), strict=True)).__getitem__
+
     inventory_by_slot = {}
     for item in equipment_layout:
         slot = item.get("slot", "Unslotted")
@@ -30,13 +30,26 @@ class App(ctk.CTk):
         self.soldiers = []
         self.missions = {}
         self.mission_participants = {}
+        # Columnar stats of the roster; rows line up with self.soldiers
+        self.stats_store = reader.StatsStore()
+        # Lookup indexes rebuilt with the roster on every load
+        self.soldier_index = {}
+        self.base_index = {}
 
         # Initialize Config
         self.config = Config()
 
         # Initialize Game and Translation Managers
         resource_path = self._find_resource_path()
-        self.data_manager = GameDataManager(resource_path)
+        # Parse rulesets in this process: spawned workers would re-import
+        # this module and customtkinter (batch.py keeps the process pool)
+        self.data_manager = GameDataManager(
+            resource_path,
+            parse_workers=1,
+            cache_max_bytes=self.config.cache_max_bytes,
+            cache_max_entries=self.config.cache_max_entries,
+            verify_ruleset_files=self.config.verify_ruleset_files,
+        )
         self.data_manager.index_mods()
         self.translation_manager = TranslationManager(self.data_manager)
         self.resource_manager = ResourceManager(self.data_manager)
@@ -128,10 +141,21 @@ class App(ctk.CTk):
         if file_path:
             logger.info(f"Loading save file: {file_path}")
 
+            # Both documents come from a single streaming parse; the metadata
+            # is available before the (much larger) game document is read, and
+            # game sections are only parsed when the views ask for them.
+            documents = reader.iter_save_documents(
+                file_path,
+                json_dump=json_dump,
+                cache_dir=self.data_manager._cache_dir,
+                lazy=True,
+            )
+
             mod_list = []
+            header_read = True
             # Load metadata to get mods list
             try:
-                metadata = reader.load_data_from_yaml(file_path, section="meta")
+                metadata = next(documents)
                 mod_list = metadata.get("mods", [])
                 logger.info(
                     f"Index found {len(mod_list)} mods. Loading translations..."
@@ -145,6 +169,16 @@ class App(ctk.CTk):
                     f"Could not load save metadata/mods list.\nError: {e}\n\n"
                     "Translations may be incomplete.",
                 )
+                # The stream stops at a bad header; read the game data anyway
+                documents.close()
+                documents = reader.iter_save_documents(
+                    file_path,
+                    json_dump=json_dump,
+                    cache_dir=self.data_manager._cache_dir,
+                    lazy=True,
+                    check_meta=False,
+                )
+                header_read = False
 
             # Load rulesets and translations
             try:
@@ -161,14 +195,31 @@ class App(ctk.CTk):
 
             # Load game data
             try:
-                self.save_data = reader.load_data_from_yaml(
-                    file_path, json_dump=json_dump, section="game"
-                )
+                if not header_read:
+                    next(documents)
+                self.save_data = next(documents)
                 self.missions = reader.read_missions(self.save_data)
-                self.bases = reader.read_bases(self.save_data, self.missions)
-                self.soldiers, self.mission_participants = reader.read_soldiers(
-                    self.save_data, self.missions
+                self.stats_store = reader.StatsStore()
+                (
+                    self.bases,
+                    self.soldiers,
+                    self.mission_participants,
+                ) = reader.read_roster(
+                    self.save_data, self.missions, stats_store=self.stats_store
                 )
+                # Cache the sections read so far in one write
+                if (
+                    isinstance(self.save_data, reader.LazyGameDocument)
+                    and self.save_data.flush()
+                ):
+                    # The save cache grew; keep the directory in bounds
+                    self.data_manager.prune_cache()
+                self.soldier_index = {s.id: s for s in self.soldiers}
+                # Like a search of the base list, a repeated name finds the
+                # first base with it
+                self.base_index = {}
+                for base in self.bases:
+                    self.base_index.setdefault(base.name, base)
 
                 # Enable buttons on main menu
                 main_menu_frame = self.frames[MainMenu]
@@ -187,13 +238,12 @@ class App(ctk.CTk):
                     "Load Error",
                     f"Could not load save game data.\nError: {e}",
                 )
+            finally:
+                documents.close()
 
     def get_soldier_by_id(self, soldier_id):
         try:
-            sid = int(soldier_id)
-            for soldier in self.soldiers:
-                if soldier.id == sid:
-                    return soldier
+            return self.soldier_index.get(int(soldier_id))
         except ValueError:
             pass
         except TypeError:
@@ -203,6 +253,9 @@ class App(ctk.CTk):
     def get_mission_by_id(self, mission_id):
         return self.missions.get(mission_id)
 
+    def get_base_by_name(self, base_name):
+        return self.base_index.get(base_name)
+
     def get_mission_participants(self, mission_id):
         return self.mission_participants.get(mission_id, [])
 
@@ -243,7 +296,7 @@ if __name__ == "__main__":
     parser.add_argument(
         "--clear-cache",
         action="store_true",
-        help="Clear the ruleset cache before loading.",
+        help="Clear the ruleset and save caches before loading.",
     )
     args = parser.parse_args()
 
@@ -1,20 +1,87 @@
+import csv
+import gzip
+import hashlib
+import heapq
+import io
 import json
 import logging
+import operator
 import os
+import re
+from array import array
+from collections.abc import Mapping
 
-import yaml
+import cache_format
+import yaml_loader
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Bump when the layout of cached save data changes
+SAVE_CACHE_VERSION = 2
+
+# Top-level keys of the game document start at column 0
+_TOP_LEVEL_KEY = re.compile(rb"^([A-Za-z_][\w.-]*):(?=[ \t\r\n]|$)", re.MULTILINE)
+_DOCUMENT_SEPARATOR = re.compile(rb"^---[ \t]*\r?$", re.MULTILINE)
+
+# Stat attribute names, in save file order, and their save file keys
+STAT_NAMES = (
+    "tu",
+    "stamina",
+    "health",
+    "bravery",
+    "reactions",
+    "firing",
+    "throwing",
+    "strength",
+    "psistrength",
+    "psiskill",
+)
+_STAT_KEYS = (
+    "tu",
+    "stamina",
+    "health",
+    "bravery",
+    "reactions",
+    "firing",
+    "throwing",
+    "strength",
+    "psiStrength",
+    "psiSkill",
+)
+# Each StatsStore row holds the initial stats followed by the current stats
+_ROW_WIDTH = 2 * len(STAT_NAMES)
+
 
 class Soldier:
-    def __init__(self, data, base_name, mission_data):
+    # Slotted: rosters of long campaigns hold thousands of these
+    __slots__ = (
+        "type",
+        "id",
+        "name",
+        "stats_store",
+        "stats_row",
+        "rank",
+        "missions",
+        "kills",
+        "base",
+        "service_record",
+        "equipmentLayout",
+        "recovery",
+        "training",
+        "psi_training",
+        "death_info",
+    )
+
+    def __init__(self, data, base_name, mission_data, stats_store=None):
         self.type = data["type"]
         self.id = data["id"]
         self.name = data["name"]
-        self.initialstats = Stats(data["initialStats"])
-        self.currentstats = Stats(data["currentStats"])
+        # Stats live in a (usually roster-wide) columnar store
+        if stats_store is None:
+            stats_store = StatsStore()
+        self.stats_store = stats_store
+        self.stats_row = stats_store.add(data["initialStats"], data["currentStats"])
         self.rank = data["rank"]
         self.missions = data.get("missions", 0)
         self.kills = data.get("kills", 0)
@@ -30,7 +97,8 @@ class Soldier:
         # Death info
         self.death_info = None
         if "death" in data:
-            self.death_info = data["death"]
+            # Copy so formatting the time does not modify the parsed save data
+            self.death_info = dict(data["death"])
             # Format time if it's a dictionary
             if "time" in self.death_info and isinstance(self.death_info["time"], dict):
                 t = self.death_info["time"]
@@ -43,49 +111,148 @@ class Soldier:
             elif "time" not in self.death_info:
                 self.death_info["time"] = "Unknown"
 
+    @property
+    def initialstats(self):
+        return self.stats_store.view(self.stats_row, current=False)
+
+    @property
+    def currentstats(self):
+        return self.stats_store.view(self.stats_row)
+
+
+def _stat_values(stats):
+    """Return the 10 stats from a save file list or dict, in STAT_NAMES order."""
+    if type(stats) is list:
+        # A short list would shift every later row of a shared StatsStore
+        if len(stats) < len(STAT_NAMES):
+            raise ValueError(
+                f"Expected {len(STAT_NAMES)} stats, got {len(stats)}: {stats!r}"
+            )
+        return stats[: len(STAT_NAMES)]
+    return [stats[key] for key in _STAT_KEYS]
+
+
+def _stat_property(index):
+    return property(lambda self: self._values[self._offset + index])
+
 
 class Stats:
-    def __init__(self, stats):
-        if type(stats) is list:
-            self.tu = stats[0]
-            self.stamina = stats[1]
-            self.health = stats[2]
-            self.bravery = stats[3]
-            self.reactions = stats[4]
-            self.firing = stats[5]
-            self.throwing = stats[6]
-            self.strength = stats[7]
-            self.psistrength = stats[8]
-            self.psiskill = stats[9]
-        else:
-            self.tu = stats["tu"]
-            self.stamina = stats["stamina"]
-            self.health = stats["health"]
-            self.bravery = stats["bravery"]
-            self.reactions = stats["reactions"]
-            self.firing = stats["firing"]
-            self.throwing = stats["throwing"]
-            self.strength = stats["strength"]
-            self.psistrength = stats["psiStrength"]
-            self.psiskill = stats["psiSkill"]
+    """
+    Read-only view of one set of 10 stats. Backed by a slice of a StatsStore
+    array, or by its own small array when built directly from save data.
+    """
+
+    __slots__ = ("_values", "_offset")
+
+    def __init__(self, stats, values=None, offset=0):
+        if values is None:
+            values = array("i", _stat_values(stats))
+        self._values = values
+        self._offset = offset
+
+    tu = _stat_property(0)
+    stamina = _stat_property(1)
+    health = _stat_property(2)
+    bravery = _stat_property(3)
+    reactions = _stat_property(4)
+    firing = _stat_property(5)
+    throwing = _stat_property(6)
+    strength = _stat_property(7)
+    psistrength = _stat_property(8)
+    psiskill = _stat_property(9)
 
     @property
     def stat_list(self):
-        return [
-            self.tu,
-            self.stamina,
-            self.health,
-            self.bravery,
-            self.reactions,
-            self.firing,
-            self.throwing,
-            self.strength,
-            self.psistrength,
-            self.psiskill,
-        ]
+        return self._values[self._offset : self._offset + len(STAT_NAMES)].tolist()
+
+
+class StatsStore:
+    """
+    Columnar stats for a whole roster: one contiguous integer array with a row
+    per soldier, holding the 10 initial stats followed by the 10 current stats.
+    Whole-roster queries (columns, gains, top-N) run over array slices instead
+    of walking Soldier attributes.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self):
+        self.values = array("i")
+
+    def __len__(self):
+        return len(self.values) // _ROW_WIDTH
+
+    def add(self, initial, current):
+        """
+        Append a soldier's stats.
+        :param initial: Initial stats as a save file list or dict.
+        :param current: Current stats as a save file list or dict.
+        :return: The row index of the new soldier.
+        """
+        row = len(self)
+        # Read both sets before appending so a bad one leaves no partial row
+        values = _stat_values(initial) + _stat_values(current)
+        self.values.extend(values)
+        return row
+
+    def view(self, row, current=True):
+        """Return a Stats view of one row's current (or initial) stats."""
+        offset = row * _ROW_WIDTH + (len(STAT_NAMES) if current else 0)
+        return Stats(None, values=self.values, offset=offset)
+
+    def column(self, stat, current=True):
+        """
+        Return one stat for every row.
+        :param stat: A name from STAT_NAMES, e.g. "firing".
+        :param current: Current stats if True, initial stats otherwise.
+        :return: An array indexed by row.
+        """
+        offset = STAT_NAMES.index(stat) + (len(STAT_NAMES) if current else 0)
+        return self.values[offset::_ROW_WIDTH]
+
+    def gains(self, stat):
+        """Return current minus initial value of a stat for every row."""
+        return array(
+            "i",
+            (
+                now - then
+                for now, then in zip(
+                    self.column(stat), self.column(stat, current=False), strict=True
+                )
+            ),
+        )
+
+    def top(self, stat, n, rows=None, current=True):
+        """
+        Return the rows with the highest values of a stat.
+        :param stat: A name from STAT_NAMES.
+        :param n: Number of rows to return.
+        :param rows: Restrict the search to these rows (e.g. living soldiers).
+        :param current: Rank by current stats if True, initial stats otherwise.
+        :return: Row indices, best first.
+        """
+        values = self.column(stat, current=current)
+        candidates = range(len(values)) if rows is None else rows
+        return heapq.nlargest(n, candidates, key=values.__getitem__)
 
 
 class ServiceRecord:
+    __slots__ = (
+        "commendations",
+        "kill_list",
+        "mission_id_list",
+        "days_wounded_total",
+        "months_service",
+        "unconscious_total",
+        "shot_at_counter_total",
+        "hit_counter_total",
+        "shots_fired_counter_total",
+        "shots_landed_counter_total",
+        "times_wounded_total",
+        "stat_gain_total",
+        "missions",
+    )
+
     def __init__(self, diary_data, mission_data):
         self.commendations = diary_data.get("commendations", [])
         self.kill_list = diary_data.get("killList", [])
@@ -108,6 +275,17 @@ class ServiceRecord:
 
 
 class Mission:
+    __slots__ = (
+        "id",
+        "name",
+        "time",
+        "region",
+        "type",
+        "success",
+        "alien_race",
+        "injuries",
+    )
+
     def __init__(self, mission_data):
         self.id = mission_data.get("id")
         self.name = mission_data.get("markerName")
@@ -124,7 +302,19 @@ class Mission:
 
 
 class Base:
-    def __init__(self, data, mission_data):
+    __slots__ = (
+        "name",
+        "lon",
+        "lat",
+        "facilities",
+        "soldiers",
+        "items",
+        "research",
+        "manufacturing",
+        "transfers",
+    )
+
+    def __init__(self, data, mission_data, soldiers=None):
         self.name = data.get("name", "Unknown Base")
         self.lon = data.get("lon")
         self.lat = data.get("lat")
@@ -132,11 +322,12 @@ class Base:
         # Facilities
         self.facilities = [Facility(f) for f in data.get("facilities", [])]
 
-        # Soldiers (Create Soldier objects)
-        self.soldiers = []
-        if "soldiers" in data:
-            for s in data["soldiers"]:
-                self.soldiers.append(Soldier(s, self.name, mission_data))
+        # Soldiers (Create Soldier objects unless the roster already built them)
+        if soldiers is None:
+            soldiers = [
+                Soldier(s, self.name, mission_data) for s in data.get("soldiers", [])
+            ]
+        self.soldiers = soldiers
 
         # Items in storage
         self.items = data.get("items", {})
@@ -157,6 +348,8 @@ class Base:
 
 
 class Facility:
+    __slots__ = ("type", "x", "y", "build_time")
+
     def __init__(self, data):
         self.type = data.get("type")
         self.x = data.get("x")
@@ -165,6 +358,8 @@ class Facility:
 
 
 class ResearchProject:
+    __slots__ = ("project", "assigned", "spent", "cost")
+
     def __init__(self, data):
         self.project = data.get("project")
         self.assigned = data.get("assigned", 0)
@@ -173,6 +368,8 @@ class ResearchProject:
 
 
 class ManufacturingProject:
+    __slots__ = ("item", "assigned", "spent", "amount")
+
     def __init__(self, data):
         self.item = data.get("item")
         self.assigned = data.get("assigned", 0)
@@ -181,6 +378,8 @@ class ManufacturingProject:
 
 
 class Transfer:
+    __slots__ = ("hours", "soldier", "item_id", "item_qty")
+
     def __init__(self, data, mission_data):
         self.hours = data.get("hours", 0)
         self.soldier = None
@@ -199,6 +398,87 @@ class Transfer:
             self.item_qty = data.get("itemQty", 0)
 
 
+class LazyGameDocument(Mapping):
+    """
+    Read-only mapping over a save's game document that parses each top-level
+    section only when it is first accessed. The raw document is released once
+    every section has been parsed.
+    """
+
+    def __init__(self, body, offsets, sections=None, on_flush=None):
+        """
+        :param body: Raw bytes of the game document.
+        :param offsets: Dict of section name -> (start, end) byte offsets.
+        :param sections: Already-parsed sections (e.g. from the save cache).
+        :param on_flush: Called with this document by flush() when sections
+                         were parsed since the last flush.
+        """
+        self._body = body
+        self._offsets = offsets
+        self._sections = dict(sections or {})
+        self._on_flush = on_flush
+        self._dirty = False
+        if self.is_complete:
+            self._body = None
+
+    def __getitem__(self, key):
+        if key in self._sections:
+            return self._sections[key]
+        if key not in self._offsets:
+            raise KeyError(key)
+
+        start, end = self._offsets[key]
+        parsed = None
+        try:
+            parsed = yaml_loader.safe_load(self._body[start:end])
+        except Exception as e:
+            logger.warning(f"Could not parse section '{key}' on its own: {e}")
+
+        if isinstance(parsed, dict) and parsed.keys() == {key}:
+            self._sections[key] = parsed[key]
+        else:
+            # The index did not match the document structure; parse it whole
+            logger.warning(f"Falling back to a full parse for section '{key}'.")
+            self._sections = yaml_loader.safe_load(self._body)
+            self._offsets = dict.fromkeys(self._sections, (0, 0))
+
+        self._dirty = True
+        if self.is_complete:
+            self._body = None
+        return self._sections[key]
+
+    def __contains__(self, key):
+        return key in self._offsets
+
+    def __iter__(self):
+        return iter(self._offsets)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    @property
+    def parsed_sections(self):
+        """The sections parsed so far, keyed by name."""
+        return self._sections
+
+    @property
+    def is_complete(self):
+        """Whether every section has been parsed."""
+        return len(self._sections) == len(self._offsets)
+
+    def flush(self):
+        """
+        Hand the sections parsed since the last flush to on_flush (e.g. to
+        update the save cache once the caller has read what it needs).
+        :return: Whether on_flush was called.
+        """
+        if not self._dirty or not self._on_flush:
+            return False
+        self._dirty = False
+        self._on_flush(self)
+        return True
+
+
 def read_missions(data_):
     missions_ = {}
     logger.info("Reading mission data...")
@@ -208,38 +488,37 @@ def read_missions(data_):
     return missions_
 
 
-def read_bases(data_, mission_data):
+def read_roster(data_, mission_data, stats_store=None):
+    """
+    Build bases and the soldier roster in a single pass. Each soldier is
+    created once and the same instance is shared by its Base, the flat
+    soldier list and the mission participants map.
+    :param data_: The game document.
+    :param mission_data: Dict of mission ID -> Mission, from read_missions.
+    :param stats_store: StatsStore receiving every soldier's stats. When empty
+                        on entry, its rows line up with the returned soldiers.
+    :return: A (bases, soldiers, mission_participants) tuple.
+    """
+    if stats_store is None:
+        stats_store = StatsStore()
     bases_ = []
-    logger.info("Reading base data...")
-    if "bases" in data_:
-        for b in data_["bases"]:
-            bases_.append(Base(b, mission_data))
-    return bases_
-
-
-def read_soldiers(data_, mission_data):
-    # Backward compatibility wrapper if we still simply need all soldiers list
-    # But ideally valid usage is via read_bases now.
-    # However, existing main.py uses this. Let's maintain it by extracting from bases.
     soldiers_ = []
     mission_participants = {}
-    logger.info("Reading soldier data (flat list)...")
-
-    # Extract from active bases
-    if "bases" in data_:
-        for base in data_["bases"]:
-            try:
-                for s in base["soldiers"]:
-                    soldier_ = Soldier(s, base["name"], mission_data)
-                    soldiers_.append(soldier_)
-            except KeyError:
-                pass
-
-    # Extract dead soldiers
-    if "deadSoldiers" in data_:
-        for s in data_["deadSoldiers"]:
-            soldier_ = Soldier(s, "KIA", mission_data)
-            soldiers_.append(soldier_)
+    logger.info("Reading base and soldier data...")
+
+    # Soldiers at active bases
+    for b in data_.get("bases", []):
+        name = b.get("name", "Unknown Base")
+        base_soldiers = [
+            Soldier(s, name, mission_data, stats_store=stats_store)
+            for s in b.get("soldiers", [])
+        ]
+        bases_.append(Base(b, mission_data, soldiers=base_soldiers))
+        soldiers_.extend(base_soldiers)
+
+    # Dead soldiers
+    for s in data_.get("deadSoldiers", []):
+        soldiers_.append(Soldier(s, "KIA", mission_data, stats_store=stats_store))
 
     # Create a map of mission IDs to participating soldiers
     for soldier in soldiers_:
@@ -248,132 +527,399 @@ def read_soldiers(data_, mission_data):
                 mission_participants[mission_id] = []
             mission_participants[mission_id].append(soldier)
 
+    return bases_, soldiers_, mission_participants
+
+
+def read_bases(data_, mission_data):
+    bases_, _, _ = read_roster(data_, mission_data)
+    return bases_
+
+
+def read_soldiers(data_, mission_data):
+    _, soldiers_, mission_participants = read_roster(data_, mission_data)
     return soldiers_, mission_participants
 
 
+def _recovery_info(soldier):
+    recovery_info = ""
+    if soldier.recovery > 0:
+        recovery_info = f"Wounded ({soldier.recovery} days)"
+    if soldier.training:
+        recovery_info += " Training" if not recovery_info else ", Training"
+    if soldier.psi_training:
+        recovery_info += " Psi Training" if not recovery_info else ", Psi Training"
+    return recovery_info
+
+
+# CSV export columns: header -> value getter
+CSV_COLUMNS = {
+    "ID": operator.attrgetter("id"),
+    "Base": operator.attrgetter("base"),
+    "Type": operator.attrgetter("type"),
+    "Name": operator.attrgetter("name"),
+    "Rank": operator.attrgetter("rank"),
+    "Missions": operator.attrgetter("missions"),
+    "Kills": operator.attrgetter("kills"),
+    "TUs": operator.attrgetter("currentstats.tu"),
+    "Stamina": operator.attrgetter("currentstats.stamina"),
+    "Health": operator.attrgetter("currentstats.health"),
+    "Bravery": operator.attrgetter("currentstats.bravery"),
+    "Reactions": operator.attrgetter("currentstats.reactions"),
+    "Firing": operator.attrgetter("currentstats.firing"),
+    "Throwing": operator.attrgetter("currentstats.throwing"),
+    "Strength": operator.attrgetter("currentstats.strength"),
+    "PsiStrength": operator.attrgetter("currentstats.psistrength"),
+    "PsiSkill": operator.attrgetter("currentstats.psiskill"),
+    "Initial TUs": operator.attrgetter("initialstats.tu"),
+    "Initial Stamina": operator.attrgetter("initialstats.stamina"),
+    "Initial Health": operator.attrgetter("initialstats.health"),
+    "Initial Bravery": operator.attrgetter("initialstats.bravery"),
+    "Initial Reactions": operator.attrgetter("initialstats.reactions"),
+    "Initial Firing": operator.attrgetter("initialstats.firing"),
+    "Initial Throwing": operator.attrgetter("initialstats.throwing"),
+    "Initial Strength": operator.attrgetter("initialstats.strength"),
+    "Initial PsiStrength": operator.attrgetter("initialstats.psistrength"),
+    "Initial PsiSkill": operator.attrgetter("initialstats.psiskill"),
+    "Recovery Info": _recovery_info,
+}
+
+
+def iter_csv_rows(soldiers_, columns=None):
+    """
+    Lazily produce CSV rows for a roster, header first.
+    :param soldiers_: Iterable of Soldier objects; consumed one at a time.
+    :param columns: Headers from CSV_COLUMNS to include, in order.
+                    Defaults to all columns.
+    :return: A generator of row lists.
+    """
+    if columns is None:
+        columns = list(CSV_COLUMNS)
+    unknown = [c for c in columns if c not in CSV_COLUMNS]
+    if unknown:
+        raise ValueError(f"Unknown CSV column(s): {', '.join(unknown)}")
+
+    getters = [CSV_COLUMNS[c] for c in columns]
+    yield list(columns)
+    for soldier in soldiers_:
+        yield [get(soldier) for get in getters]
+
+
+def write_csv(soldiers_, sink, columns=None, compress=None):
+    """
+    Stream a roster to CSV without building the table in memory.
+    :param soldiers_: Iterable of Soldier objects.
+    :param sink: A file path, or a file-like object (text, or binary when
+                 compressing).
+    :param columns: Headers from CSV_COLUMNS to include (defaults to all).
+    :param compress: Gzip the output. Defaults to True for paths ending in
+                     ".gz" and False otherwise.
+    :return: The number of soldier rows written.
+    """
+    if isinstance(sink, (str, os.PathLike)):
+        if compress is None:
+            compress = os.fspath(sink).endswith(".gz")
+        if compress:
+            f = gzip.open(sink, "wt", encoding="utf-8", newline="")
+        else:
+            f = open(sink, "w", encoding="utf-8", newline="")
+        with f:
+            return write_csv(soldiers_, f, columns=columns)
+
+    if compress:
+        with (
+            gzip.GzipFile(fileobj=sink, mode="wb") as gz,
+            io.TextIOWrapper(gz, encoding="utf-8", newline="") as f,
+        ):
+            return write_csv(soldiers_, f, columns=columns)
+
+    writer = csv.writer(sink)
+    count = -1  # Header row
+    for row in iter_csv_rows(soldiers_, columns=columns):
+        writer.writerow(row)
+        count += 1
+    return count
+
+
 def make_csv(soldiers_):
-    csvlist = [
-        [
-            "ID",
-            "Base",
-            "Type",
-            "Name",
-            "Rank",
-            "Missions",
-            "Kills",
-            "TUs",
-            "Stamina",
-            "Health",
-            "Bravery",
-            "Reactions",
-            "Firing",
-            "Throwing",
-            "Strength",
-            "PsiStrength",
-            "PsiSkill",
-            "Initial TUs",
-            "Initial Stamina",
-            "Initial Health",
-            "Initial Bravery",
-            "Initial Reactions",
-            "Initial Firing",
-            "Initial Throwing",
-            "Initial Strength",
-            "Initial PsiStrength",
-            "Initial PsiSkill",
-            "Recovery Info",
-        ]
-    ]
-    for i in soldiers_:
-        recovery_info = ""
-        if i.recovery > 0:
-            recovery_info = f"Wounded ({i.recovery} days)"
-        if i.training:
-            recovery_info += " Training" if not recovery_info else ", Training"
-        if i.psi_training:
-            recovery_info += " Psi Training" if not recovery_info else ", Psi Training"
-
-        row = [
-            i.id,
-            i.base,
-            i.type,
-            i.name,
-            i.rank,
-            i.missions,
-            i.kills,
-            i.currentstats.tu,
-            i.currentstats.stamina,
-            i.currentstats.health,
-            i.currentstats.bravery,
-            i.currentstats.reactions,
-            i.currentstats.firing,
-            i.currentstats.throwing,
-            i.currentstats.strength,
-            i.currentstats.psistrength,
-            i.currentstats.psiskill,
-            i.initialstats.tu,
-            i.initialstats.stamina,
-            i.initialstats.health,
-            i.initialstats.bravery,
-            i.initialstats.reactions,
-            i.initialstats.firing,
-            i.initialstats.throwing,
-            i.initialstats.strength,
-            i.initialstats.psistrength,
-            i.initialstats.psiskill,
-            recovery_info,
-        ]
-        csvlist.append(row)
-    return csvlist
+    """
+    Build the full CSV table (header included) as a list of rows.
+    Prefer write_csv/iter_csv_rows for large rosters.
+    """
+    return list(iter_csv_rows(soldiers_))
 
 
-def load_data_from_yaml(file_path, json_dump=False, section="game"):
+def _read_header(file):
     """
-    Load data from a YAML file.
-    :param file_path: Path to the YAML file.
-    :param json_dump: Whether to dump the loaded data to a JSON file (debug).
-    :param section: "game" to return the document with 'difficulty',
-                    "meta" to return the document with 'name'.
-    :return: The requested document dictionary.
+    Read the metadata block at the start of an open save file, stopping at the
+    first '---' document separator. The file is left positioned at the start of
+    the game document.
+    :param file: A binary file object opened at the start of the save.
+    :return: The raw YAML bytes of the metadata document.
     """
-    logger.info(
-        f'Loading data from "{os.path.basename(file_path)}" (section: {section})...'
-    )
+    lines = []
+    while True:
+        line = file.readline()
+        if not line:
+            break
+        if line.rstrip() == b"---":
+            # A separator before any content is an explicit start marker
+            if any(ln.strip() and not ln.lstrip().startswith(b"#") for ln in lines):
+                break
+            continue
+        lines.append(line)
+    return b"".join(lines)
+
 
-    found_data = None
+def read_save_header(file_path):
+    """
+    Load only the metadata document (name, version, mods, time) of a save file.
+    Reading stops at the first document separator, so the game document is
+    never read or parsed.
+    :param file_path: Path to the save file.
+    :return: The metadata dictionary.
+    """
+    with open(file_path, "rb") as file:
+        meta = yaml_loader.safe_load(_read_header(file))
 
-    with open(file_path, encoding="utf-8") as file:
-        # Load all documents; yaml.load_all returns a generator
-        documents = list(yaml.safe_load_all(file))
+    _check_meta(file_path, meta)
+    return meta
+
+
+def _check_meta(file_path, meta):
+    """Raise ValueError unless meta is a metadata document with a 'name'."""
+    if not isinstance(meta, dict) or "name" not in meta:
+        raise ValueError(f"Could not find section 'meta' in {file_path}")
+
+
+def _index_game_document(file_path, body):
+    """
+    Find the byte offsets of each top-level section of the game document.
+    :param file_path: Path to the save file (for error messages).
+    :param body: Raw bytes of everything after the metadata document.
+    :return: Dict of section name -> (start, end) byte offsets.
+    """
+    if not body.strip():
+        raise ValueError(f"Expected 2 YAML documents in {file_path}, found 1")
 
     # Fail if not exactly 2 documents (healthy saves always have 2 documents)
-    if len(documents) != 2:
-        raise ValueError(
-            f"Expected 2 YAML documents in {file_path}, found {len(documents)}"
+    extra = len(_DOCUMENT_SEPARATOR.findall(body))
+    if extra:
+        raise ValueError(f"Expected 2 YAML documents in {file_path}, found {2 + extra}")
+
+    matches = list(_TOP_LEVEL_KEY.finditer(body))
+    offsets = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(body)
+        offsets[match.group(1).decode("utf-8")] = (match.start(), end)
+    return offsets
+
+
+def _parse_game_document(file_path, body):
+    """
+    Fully parse the game document, checking that it is the last document.
+    """
+    missing = object()
+    documents = yaml_loader.safe_load_all(body)
+    game = next(documents, missing)
+    if game is missing:
+        raise ValueError(f"Expected 2 YAML documents in {file_path}, found 1")
+
+    # Fail if not exactly 2 documents (healthy saves always have 2 documents)
+    extra = sum(1 for _ in documents)
+    if extra:
+        raise ValueError(f"Expected 2 YAML documents in {file_path}, found {2 + extra}")
+    return game
+
+
+def _get_save_cache_path(file_path, raw, cache_dir):
+    """
+    Build the cache file path for a save. The name is keyed by the save's path
+    plus its size, mtime and content hash, so any change produces a new entry.
+    :param file_path: Path to the save file.
+    :param raw: The raw bytes of the save file.
+    :param cache_dir: Directory holding cache files.
+    :return: The cache file path.
+    """
+    real_path = os.path.realpath(file_path)
+    st = os.stat(real_path)
+    path_key = hashlib.sha256(real_path.encode("utf-8")).hexdigest()[:16]
+    content_key = hashlib.sha256(
+        f"{st.st_size}|{st.st_mtime_ns}|{hashlib.sha256(raw).hexdigest()}".encode()
+    ).hexdigest()[:16]
+    return os.path.join(
+        cache_dir, f"save_{path_key}_{content_key}{cache_format.EXTENSION}"
+    )
+
+
+def _load_save_cache(cache_path):
+    """
+    Attempt to load cached game sections. Returns (sections, complete) or None.
+    """
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        data = cache_format.load(cache_path)
+        if data.get("version") != SAVE_CACHE_VERSION:
+            raise ValueError(f"unsupported cache version {data.get('version')}")
+        try:
+            # Mark the entry as recently used for the cache's LRU eviction
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return data["sections"], data["complete"]
+    except Exception as e:
+        logger.warning(f"Save cache read failed, will re-parse: {e}")
+        try:
+            os.remove(cache_path)
+            logger.info(f"Removed corrupt save cache file: {cache_path}")
+        except OSError:
+            pass
+        return None
+
+
+def _save_save_cache(cache_path, sections, complete):
+    """
+    Persist parsed game sections, replacing older entries for the same save.
+    :param sections: Dict of section name -> parsed data.
+    :param complete: Whether sections holds the entire game document.
+    """
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        cache_format.ensure_cache_dir(cache_dir)
+        data = {
+            "version": SAVE_CACHE_VERSION,
+            "sections": sections,
+            "complete": complete,
+        }
+        cache_format.dump(data, cache_path)
+
+        # Entries for earlier versions of this save can never be hit again
+        prefix = os.path.basename(cache_path).rsplit("_", 1)[0] + "_"
+        for fn in os.listdir(cache_dir):
+            fp = os.path.join(cache_dir, fn)
+            if fn.startswith(prefix) and fp != cache_path:
+                try:
+                    os.remove(fp)
+                except OSError:
+                    pass
+        logger.debug(f"Saved parsed save cache to {cache_path}")
+    except Exception as e:
+        logger.warning(f"Failed to save save cache: {e}")
+
+
+def _dump_json(game):
+    logger.info('Writing converted json data to "data.json"...')
+    with open("data.json", "w") as outfile:
+        json.dump(dict(game), outfile)
+
+
+def iter_save_documents(
+    file_path, json_dump=False, cache_dir=None, lazy=False, check_meta=True
+):
+    """
+    Parse a save file in a single pass, yielding its two documents in order.
+    The metadata document is yielded as soon as the header has been parsed, so
+    callers can act on it (e.g. load the mod list) before the game document is
+    parsed.
+    :param file_path: Path to the save file.
+    :param json_dump: Whether to dump the game document to a JSON file (debug).
+    :param cache_dir: Directory for the parsed save cache. When given, sections
+                      that have been parsed before are loaded from the cache.
+    :param lazy: Return the game document as a LazyGameDocument that parses
+                 each top-level section on first access. Sections it parses
+                 are written to the save cache when its flush() is called.
+    :param check_meta: Raise ValueError if the metadata document has no
+                       'name'. Pass False to read the game document of such a
+                       save anyway.
+    :return: A generator yielding the metadata dict, then the game data mapping.
+    """
+    logger.info(f'Loading save data from "{os.path.basename(file_path)}"...')
+
+    with open(file_path, "rb") as file:
+        raw = file.read()
+
+    file = io.BytesIO(raw)
+    header = _read_header(file)
+    if not header.strip():
+        raise ValueError(f"Expected 2 YAML documents in {file_path}, found 0")
+    meta = yaml_loader.safe_load(header)
+    if check_meta:
+        _check_meta(file_path, meta)
+    yield meta
+    body = raw[file.tell() :]
+
+    cache_path = None
+    cached = None
+    if cache_dir:
+        cache_path = _get_save_cache_path(file_path, raw, cache_dir)
+        cached = _load_save_cache(cache_path)
+        if cached is not None:
+            logger.info("Loaded save data from cache.")
+
+    if lazy:
+        on_flush = None
+        if cache_path:
+
+            def on_flush(doc):
+                _save_save_cache(cache_path, doc.parsed_sections, doc.is_complete)
+
+        game = LazyGameDocument(
+            body,
+            _index_game_document(file_path, body),
+            sections=cached[0] if cached else None,
+            on_flush=on_flush,
         )
+    elif cached and cached[1]:
+        game = cached[0]
+    else:
+        game = _parse_game_document(file_path, body)
+        if cache_path and isinstance(game, dict):
+            _save_save_cache(cache_path, game, complete=True)
 
-    for doc in documents:
-        if not isinstance(doc, dict):
-            continue
+    if not isinstance(game, Mapping) or "difficulty" not in game:
+        raise ValueError(f"Could not find section 'game' in {file_path}")
+
+    if json_dump:
+        _dump_json(game)
+
+    yield game
 
-        if section == "game":
-            if "difficulty" in doc:
-                found_data = doc
-                break
-        elif section == "meta":
-            if "name" in doc:
-                found_data = doc
-                break
 
-    if found_data is None:
-        # Fallback/Error handling: if we couldn't find the specific section,
-        # checking if the file only had one document might be relevant,
-        # but strictly adhering to the plan:
+def load_save(file_path, json_dump=False, cache_dir=None, lazy=False, check_meta=True):
+    """
+    Load both documents of a save file from a single parse.
+    :param file_path: Path to the save file.
+    :param json_dump: Whether to dump the game document to a JSON file (debug).
+    :param cache_dir: Directory for the parsed save cache (optional).
+    :param lazy: Parse game document sections on first access.
+    :param check_meta: Require a 'name' in the metadata document.
+    :return: A (metadata, game data) tuple.
+    """
+    meta, game = iter_save_documents(
+        file_path,
+        json_dump=json_dump,
+        cache_dir=cache_dir,
+        lazy=lazy,
+        check_meta=check_meta,
+    )
+    return meta, game
+
+
+def load_data_from_yaml(file_path, json_dump=False, section="game"):
+    """
+    Load a single document from a save file.
+    :param file_path: Path to the YAML file.
+    :param json_dump: Whether to dump the loaded data to a JSON file (debug).
+    :param section: "game" to return the document with 'difficulty',
+                    "meta" to return the document with 'name'.
+    :return: The requested document dictionary.
+    """
+    if section not in ("game", "meta"):
         raise ValueError(f"Could not find section '{section}' in {file_path}")
 
-    if json_dump:
-        logger.info('Writing converted json data to "data.json"...')
-        with open("data.json", "w") as outfile:
-            json.dump(found_data, outfile)
+    if section == "meta" and not json_dump:
+        # The game document is not needed, so don't read or parse it
+        return read_save_header(file_path)
 
-    return found_data
+    meta, game = load_save(file_path, json_dump=json_dump, check_meta=section == "meta")
+    return game if section == "game" else meta
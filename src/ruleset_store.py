@@ -0,0 +1,258 @@
+"""
+Read-only, memory-mapped store for merged ruleset tables.
+
+The merged ruleset dicts (items, soldiers, ...) are written once to a single
+file. Readers map the file instead of loading it: lookups binary-search a
+sorted hash index directly in the mapping and decode only the requested
+entry, so any number of processes share one copy of the data through the OS
+page cache.
+
+File layout (little-endian):
+    header      MAGIC, format version, table count
+    directory   per table: name length, name, index offset, entry count
+    indexes     per table: entry_count x (key hash, payload offset, length),
+                sorted by key hash
+    payloads    cache_format-encoded (key, value) pairs
+"""
+
+import hashlib
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+
+import cache_format
+
+MAGIC = b"XSRS"
+FORMAT_VERSION = 1
+
+# Store file extension
+EXTENSION = ".store"
+
+_HEADER = struct.Struct("<4sII")
+_TABLE_NAME = struct.Struct("<H")
+_TABLE = struct.Struct("<QI")
+_INDEX_ENTRY = struct.Struct("<QQI")
+
+
+class StoreFormatError(ValueError):
+    """Raised when a store file is corrupt or of an unknown format."""
+
+
+def _key_hash(key):
+    return int.from_bytes(
+        hashlib.blake2b(repr(key).encode("utf-8"), digest_size=8).digest(), "little"
+    )
+
+
+def write_store(path, tables, serializer=cache_format.DEFAULT_SERIALIZER):
+    """
+    Write ruleset tables to a store file. The file is written under a
+    temporary name and moved into place, so readers never see a partial file.
+    :param path: Destination file path.
+    :param tables: Dict of table name -> dict of entries.
+    :param serializer: cache_format serializer used for each entry.
+    """
+    names = list(tables)
+    directory_size = sum(
+        _TABLE_NAME.size + len(name.encode("utf-8")) + _TABLE.size for name in names
+    )
+    offset = _HEADER.size + directory_size
+    index_offsets = []
+    for name in names:
+        index_offsets.append(offset)
+        offset += len(tables[name]) * _INDEX_ENTRY.size
+
+    directory = bytearray()
+    indexes = bytearray()
+    payloads = []
+    for name, index_offset in zip(names, index_offsets, strict=True):
+        encoded = name.encode("utf-8")
+        directory += _TABLE_NAME.pack(len(encoded)) + encoded
+        directory += _TABLE.pack(index_offset, len(tables[name]))
+
+        entries = []
+        for key, value in tables[name].items():
+            payload = cache_format.dumps((key, value), serializer)
+            entries.append((_key_hash(key), offset, len(payload)))
+            payloads.append(payload)
+            offset += len(payload)
+        for entry in sorted(entries):
+            indexes += _INDEX_ENTRY.pack(*entry)
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(MAGIC, FORMAT_VERSION, len(names)))
+            f.write(directory)
+            f.write(indexes)
+            for payload in payloads:
+                f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class RulesetTable(Mapping):
+    """
+    A read-only mapping over one table of a RulesetStore. An entry is decoded
+    the first time it is looked up and kept for later lookups, so only the
+    entries a process actually uses are held in Python objects.
+    """
+
+    __slots__ = (
+        "name",
+        "_buffer",
+        "_index_offset",
+        "_count",
+        "_serializers",
+        "_decoded",
+    )
+
+    def __init__(self, name, buffer, index_offset, count, serializers):
+        self.name = name
+        self._buffer = buffer
+        self._index_offset = index_offset
+        self._count = count
+        self._serializers = serializers
+        self._decoded = {}
+
+    def _entry(self, i):
+        return _INDEX_ENTRY.unpack_from(
+            self._buffer, self._index_offset + i * _INDEX_ENTRY.size
+        )
+
+    def _decode(self, offset, length):
+        return cache_format.loads(
+            self._buffer[offset : offset + length], self._serializers
+        )
+
+    def _lookup(self, key):
+        target = _key_hash(key)
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._entry(mid)[0] < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        # Hash collisions are adjacent; confirm against the stored key
+        for i in range(lo, self._count):
+            key_hash, offset, length = self._entry(i)
+            if key_hash != target:
+                break
+            stored_key, value = self._decode(offset, length)
+            if stored_key == key:
+                return value
+        raise KeyError(key)
+
+    def __getitem__(self, key):
+        try:
+            return self._decoded[key]
+        except KeyError:
+            pass
+        value = self._decoded[key] = self._lookup(key)
+        return value
+
+    def __contains__(self, key):
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self):
+        for i in range(self._count):
+            _, offset, length = self._entry(i)
+            yield self._decode(offset, length)[0]
+
+    def __len__(self):
+        return self._count
+
+    def __repr__(self):
+        return f"<RulesetTable {self.name!r} ({self._count} entries)>"
+
+
+class RulesetStore:
+    """
+    A memory-mapped store file opened read-only. Tables are available as
+    RulesetTable mappings by name.
+    """
+
+    def __init__(self, path, serializers=cache_format.SAFE_SERIALIZERS):
+        """
+        :param path: Path of the store file.
+        :param serializers: Names of the serializers entries may use.
+        :raises StoreFormatError: If the file is not a valid store.
+        :raises cache_format.UntrustedCacheError: If the file or its directory
+                                                  may be writable by others.
+        """
+        self.path = path
+        self._serializers = tuple(serializers)
+        cache_format.check_cache_dir(os.path.dirname(os.path.abspath(path)))
+        with open(path, "rb") as f:
+            if hasattr(os, "getuid") and os.fstat(f.fileno()).st_uid != os.getuid():
+                raise cache_format.UntrustedCacheError(
+                    f"{path} is owned by another user"
+                )
+            try:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:
+                # Raised for empty files
+                raise StoreFormatError(f"cannot map store: {e}") from e
+        try:
+            self.tables = self._read_directory()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _read_directory(self):
+        buffer = self._mmap
+        if len(buffer) < _HEADER.size:
+            raise StoreFormatError("file too short for a store header")
+        magic, version, table_count = _HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise StoreFormatError("not a ruleset store")
+        if version != FORMAT_VERSION:
+            raise StoreFormatError(f"unsupported store format version {version}")
+
+        tables = {}
+        pos = _HEADER.size
+        try:
+            for _ in range(table_count):
+                (name_length,) = _TABLE_NAME.unpack_from(buffer, pos)
+                pos += _TABLE_NAME.size
+                name = bytes(buffer[pos : pos + name_length]).decode("utf-8")
+                pos += name_length
+                index_offset, count = _TABLE.unpack_from(buffer, pos)
+                pos += _TABLE.size
+                if index_offset + count * _INDEX_ENTRY.size > len(buffer):
+                    raise StoreFormatError(f"truncated index for table {name!r}")
+                tables[name] = RulesetTable(
+                    name, buffer, index_offset, count, self._serializers
+                )
+        except struct.error as e:
+            raise StoreFormatError(f"truncated store directory: {e}") from e
+        return tables
+
+    def __getitem__(self, name):
+        return self.tables[name]
+
+    @property
+    def closed(self):
+        return self._mmap.closed
+
+    def close(self):
+        # Tables hold the mapping; drop them so nothing reads a closed map
+        self.tables = {}
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,157 @@
+"""
+Model behind the soldier tables.
+
+Holds every row of a soldier table in plain Python, with typed sort keys
+computed once when the rows are built, and tracks how many of them, in
+display order, have been materialized into the ttk.Treeview. The soldier
+list inserts one page of rows at a time as the user scrolls towards the end,
+so showing a roster of thousands of soldiers costs a page of Tk inserts
+rather than one per soldier. Sorting and filtering reorder the model; the
+view then applies the new order to the tree in a single set_children call,
+which detaches filtered-out rows and reattaches them later by id.
+"""
+
+# Rows inserted into the tree at a time
+PAGE_SIZE = 100
+
+
+def stripe(position):
+    """Row tag for the alternating background at a display position."""
+    return "even" if position % 2 == 0 else "odd"
+
+
+def text_key(value):
+    """Sort key for text cells: case-insensitive, tolerating missing values."""
+    return "" if value is None else str(value).casefold()
+
+
+class TableRow:
+    """One row of a SoldierTable."""
+
+    __slots__ = ("iid", "values", "keys", "tags")
+
+    def __init__(self, iid, values, keys, tags=()):
+        self.iid = iid
+        # Display values, in column order
+        self.values = tuple(values)
+        # Typed sort keys, in column order
+        self.keys = tuple(keys)
+        # Extra tree tags, added to the stripe
+        self.tags = tuple(tags)
+
+
+class SoldierTable:
+    """
+    Rows of a soldier table and the leading window of them shown in a tree.
+    Rows are identified by their tree item id.
+    """
+
+    def __init__(self, columns, page_size=PAGE_SIZE):
+        """
+        :param columns: Column names, in display order.
+        :param page_size: Rows added to the window per page; None shows every
+                          row on the first page.
+        """
+        self.columns = tuple(columns)
+        self.page_size = page_size
+        self._rows = {}
+        # Item ids of every row in sort order, and of the rows passing the
+        # filter (the display order)
+        self._sorted = []
+        self.order = []
+        self._filter = None
+        # Number of leading rows of `order` materialized in the tree
+        self.shown = 0
+        # Tags each materialized row was last given in the tree
+        self._tree_tags = {}
+
+    def set_rows(self, rows):
+        """
+        Replace the rows of the table. The current filter still applies.
+        The shown window is emptied and the tree is assumed to be cleared by
+        the caller.
+        :param rows: Iterable of TableRow, in their initial order.
+        """
+        self._rows = {row.iid: row for row in rows}
+        self._sorted = list(self._rows)
+        self._apply_filter()
+        self.shown = 0
+        self._tree_tags = {}
+
+    def __len__(self):
+        return len(self.order)
+
+    def values(self, iid):
+        return self._rows[iid].values
+
+    @property
+    def has_more(self):
+        """Whether rows remain beyond the shown window."""
+        return self.shown < len(self.order)
+
+    def next_page(self):
+        """Grow the shown window by up to a page."""
+        if self.page_size is None:
+            self.shown = len(self.order)
+        else:
+            self.shown = min(len(self.order), self.shown + self.page_size)
+
+    def window(self):
+        """:return: Item ids of the shown rows, in display order."""
+        return self.order[: self.shown]
+
+    def materialized(self):
+        """:return: Item ids of every row inserted into the tree so far."""
+        return list(self._tree_tags)
+
+    def sort(self, column, reverse=False):
+        """
+        Reorder the rows by the sort keys of a column, keeping the size of
+        the shown window and the filter. The sort is stable.
+        :param column: Name of the column to sort by.
+        :param reverse: Sort in descending order.
+        """
+        index = self.columns.index(column)
+        rows = self._rows
+        self._sorted.sort(key=lambda iid: rows[iid].keys[index], reverse=reverse)
+        self._apply_filter()
+
+    def set_filter(self, predicate):
+        """
+        Show only the rows a predicate accepts, keeping the sort order. Rows
+        keep their ids, so the tree can detach and reattach them instead of
+        rebuilding. The shown window keeps its size, but covers at least a
+        page when enough rows pass.
+        :param predicate: Callable taking a TableRow, or None to show all rows.
+        """
+        self._filter = predicate
+        self._apply_filter()
+        page = len(self.order) if self.page_size is None else self.page_size
+        self.shown = min(len(self.order), max(self.shown, page))
+
+    def _apply_filter(self):
+        if self._filter is None:
+            self.order = list(self._sorted)
+        else:
+            rows = self._rows
+            self.order = [iid for iid in self._sorted if self._filter(rows[iid])]
+        self.shown = min(self.shown, len(self.order))
+
+    def sync(self):
+        """
+        Work out the tree updates that bring the materialized rows in line with
+        the shown window, and record them as applied. After applying them the
+        caller reorders the tree with set_children("", *window()).
+        :return: (new, retagged) lists of (iid, tags) pairs: rows to insert,
+                 and existing rows whose tags changed.
+        """
+        new = []
+        retagged = []
+        for position, iid in enumerate(self.window()):
+            tags = (stripe(position), *self._rows[iid].tags)
+            current = self._tree_tags.get(iid)
+            if current == tags:
+                continue
+            self._tree_tags[iid] = tags
+            (new if current is None else retagged).append((iid, tags))
+        return new, retagged
@@ -1,11 +1,24 @@
+import hashlib
 import logging
 import os
 
-import yaml
+import cache_format
+import yaml_loader
 
 # Configure logger for this module
 logger = logging.getLogger(__name__)
 
+# Bump when the layout of the cached translation table changes
+TABLE_VERSION = 2
+
+
+def _stat_key(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
 
 class TranslationManager:
     def __init__(self, data_manager, language="en-US"):
@@ -16,43 +29,123 @@ class TranslationManager:
     def load_all(self, save_mod_list):
         """
         Loads translations in order: Common -> Standard (Master) -> Mods.
+        The merged table is cached, keyed by the language, the mod list and
+        the mtimes and sizes of the language files. List variants are
+        collapsed to their first entry before caching.
         """
+        paths = self._language_files(save_mod_list)
+        stamps = [_stat_key(path) for path in paths]
+        cache_path = self._get_cache_path(save_mod_list, paths, stamps)
+        cached = self._load_cache(cache_path)
+        if cached is not None:
+            logger.info(f"Loaded {self.language} translations from cache.")
+            self.translations = cached
+            return
+
+        logger.info(f"Loading {self.language} translations...")
         self.translations = {}
+        complete = True
+        for path, stamp in zip(paths, stamps, strict=True):
+            if stamp is not None:
+                logger.debug(f"  - Loading translations from: {path}")
+                if not self._load_file(path):
+                    complete = False
+
+        # Resolve list variants (randomized strings) once, to their first entry,
+        # so lookups are a plain dict access
+        self.translations = {
+            key: value[0] if isinstance(value, list) and value else value
+            for key, value in self.translations.items()
+        }
+
+        # Don't cache a table with a broken file in it; retry (and log) next time
+        if complete:
+            self._save_cache(cache_path)
+
+    def _language_files(self, save_mod_list):
+        """List candidate language files in load order (they may not exist)."""
         base_path = self.data_manager.base_path
         master = self.data_manager.master
         mod_map = self.data_manager.mod_map
+        filename = f"{self.language}.yml"
 
-        logger.info(f"Loading common translations ({self.language})...")
-        common_lang = os.path.join(
-            base_path, "common", "Language", f"{self.language}.yml"
-        )
-        self._load_file(common_lang)
-
-        # 2. Determine and Load Master
-        logger.info(f"Loading master translations ({master})...")
-        master_lang = os.path.join(
-            base_path, "standard", master, "Language", f"{self.language}.yml"
-        )
-        self._load_file(master_lang)
-
-        # 3. Load Mods
-        logger.info("Loading mod translations...")
+        paths = [
+            os.path.join(base_path, "common", "Language", filename),
+            os.path.join(base_path, "standard", master, "Language", filename),
+        ]
         for mod_entry in save_mod_list:
             mod_id = mod_entry.split(" ver:", 1)[0].strip()
             if mod_id in mod_map:
-                logger.debug(f"  - Loading translations for: {mod_id}")
-                mod_lang = os.path.join(
-                    mod_map[mod_id], "Language", f"{self.language}.yml"
-                )
-                self._load_file(mod_lang)
+                paths.append(os.path.join(mod_map[mod_id], "Language", filename))
+        return paths
 
-    def _load_file(self, path):
+    def _get_cache_path(self, save_mod_list, paths, stamps):
+        raw = "|".join(
+            [
+                str(TABLE_VERSION),
+                self.language,
+                self.data_manager.base_path,
+                *save_mod_list,
+            ]
+        )
+        for path, stamp in zip(paths, stamps, strict=True):
+            raw += f"|{path}:{stamp}"
+        key = hashlib.sha256(raw.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(
+            self.data_manager._cache_dir,
+            f"translations_{key}{cache_format.EXTENSION}",
+        )
+
+    def _load_cache(self, path):
+        """
+        Attempt to load a cached translation table. Returns None on a miss.
+        """
         if not os.path.exists(path):
+            return None
+        try:
+            translations = cache_format.load(
+                path, (self.data_manager.cache_serializer,)
+            )
+            if not isinstance(translations, dict):
+                raise ValueError("unexpected translation cache layout")
+        except Exception as e:
+            logger.warning(f"Translation cache read failed, will re-parse: {e}")
+            try:
+                os.remove(path)
+                logger.info(f"Removed corrupt cache file: {path}")
+            except OSError:
+                pass
+            return None
+        try:
+            # Mark the entry as recently used for the cache's LRU eviction
+            os.utime(path)
+        except OSError:
+            pass
+        return translations
+
+    def _save_cache(self, path):
+        try:
+            cache_format.ensure_cache_dir(self.data_manager._cache_dir)
+            cache_format.dump(
+                self.translations, path, self.data_manager.cache_serializer
+            )
+            logger.debug(f"Saved translation cache to {path}")
+        except Exception as e:
+            logger.warning(f"Failed to save translation cache: {e}")
             return
+        self.data_manager.prune_cache()
+
+    def _load_file(self, path):
+        """
+        Merge one language file into the table. Returns False if it failed to
+        load.
+        """
+        if not os.path.exists(path):
+            return True
 
         try:
             with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+                data = yaml_loader.safe_load(f)
                 # Structure is usually { "en-US": { "STR_KEY": "Value" } }
                 if data and self.language in data:
                     payload = data[self.language]
@@ -60,6 +153,8 @@ class TranslationManager:
                         self.translations.update(payload)
         except Exception as e:
             logger.error(f"Error loading translation file {path}: {e}")
+            return False
+        return True
 
     def get(self, key):
         """
@@ -67,14 +162,17 @@ class TranslationManager:
         """
         if not key:
             return ""
+        return self.translations.get(key, key)
 
-        val = self.translations.get(key, key)
-
-        # Handle list variants (randomized strings) - just take the first one
-        if isinstance(val, list) and len(val) > 0:
-            return val[0]
-
-        return val
+    def translate_many(self, keys):
+        """
+        Translate a batch of keys in one pass.
+        :param keys: Iterable of translation keys.
+        :return: A list of translated strings, in the same order; keys that
+                 are not found are returned unchanged, empty keys as "".
+        """
+        table = self.translations
+        return [table.get(key, key) if key else "" for key in keys]
 
     def get_rank_string(self, rank_index, soldier_type):
         """
@@ -4,9 +4,12 @@ from tkinter import ttk
 import customtkinter as ctk
 
 import view_utils
+from soldier_table import SoldierTable, TableRow, text_key
 
 logger = logging.getLogger(__name__)
 
+SOLDIER_COLUMNS = ["Rank", "Name", "Missions", "Kills", "Status"]
+
 
 class BaseView(ctk.CTkFrame):
     def __init__(self, parent, controller):
@@ -18,6 +21,8 @@ class BaseView(ctk.CTkFrame):
         # Sort state for soldier list
         self.soldier_sort_col = "Rank"
         self.soldier_sort_reverse = False
+        # Model of the soldier tree shown in the Soldiers tab
+        self.soldier_table = SoldierTable(SOLDIER_COLUMNS, page_size=None)
 
         # Configure grid
         self.grid_rowconfigure(1, weight=1)
@@ -43,7 +48,7 @@ class BaseView(ctk.CTkFrame):
         self.base_selector.grid(row=0, column=3, padx=10)
 
         # Content Area (Tab View)
-        self.tab_view = ctk.CTkTabview(self)
+        self.tab_view = ctk.CTkTabview(self, command=self.on_tab_change)
         self.tab_view.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
 
         # Tabs
@@ -54,12 +59,40 @@ class BaseView(ctk.CTkFrame):
         self.tab_manufacturing = self.tab_view.add("Manufacturing")
         self.tab_transfers = self.tab_view.add("Transfers")
 
+        # Tabs are rendered when first shown, once per base
+        self.tab_renderers = {
+            "Overview": (self.tab_overview, self.render_overview),
+            "Soldiers": (self.tab_soldiers, self.render_soldiers),
+            "Storage": (self.tab_storage, self.render_storage),
+            "Research": (self.tab_research, self.render_research),
+            "Manufacturing": (self.tab_manufacturing, self.render_manufacturing),
+            "Transfers": (self.tab_transfers, self.render_transfers),
+        }
+        # Rendered content frames by (tab name, id of the base), the key of the
+        # one packed in each tab, and the soldier tree and table of each base.
+        # Base names may repeat, so bases are told apart by identity; the
+        # caches are cleared whenever a new save is loaded.
+        self.tab_cache = {}
+        self.shown_tabs = {}
+        self.soldier_trees = {}
+
         # Current Base Data matches
         self.current_base = None
+        # Bases list the cached tabs were rendered from
+        self.rendered_bases = None
 
     def update_view(self):
         # Populate base selector
         bases = self.controller.bases
+        if bases is not self.rendered_bases:
+            # A new save was loaded
+            self.clear_tab_cache()
+            self.rendered_bases = bases
+            if self.current_base:
+                self.current_base = self.controller.get_base_by_name(
+                    self.current_base.name
+                )
+
         if not bases:
             self.base_selector.set("No Bases Found")
             self.base_selector.configure(state="disabled")
@@ -78,26 +111,59 @@ class BaseView(ctk.CTkFrame):
             self.render_base_details(self.current_base)
 
     def on_base_select(self, base_name):
-        for b in self.controller.bases:
-            if b.name == base_name:
-                self.current_base = b
-                self.render_base_details(b)
-                break
+        base = self.controller.get_base_by_name(base_name)
+        if base:
+            self.current_base = base
+            self.render_base_details(base)
 
     def render_base_details(self, base):
-        self.render_overview(base)
-        self.render_soldiers(base)
-        self.render_storage(base)
-        self.render_research(base)
-        self.render_manufacturing(base)
-        self.render_transfers(base)
+        # Only the visible tab; the others render when they are selected
+        self.show_tab(self.tab_view.get(), base)
+
+    def on_tab_change(self):
+        if self.current_base:
+            self.show_tab(self.tab_view.get(), self.current_base)
+
+    def show_tab(self, name, base):
+        key = (name, id(base))
+        if self.shown_tabs.get(name) == key:
+            return
+
+        tab, render = self.tab_renderers[name]
+        previous = self.tab_cache.get(self.shown_tabs.get(name))
+        if previous is not None:
+            previous.pack_forget()
+
+        content = self.tab_cache.get(key)
+        if content is None:
+            content = ctk.CTkFrame(tab, fg_color="transparent")
+            render(base, content)
+            self.tab_cache[key] = content
+        content.pack(fill="both", expand=True)
+        self.shown_tabs[name] = key
+
+        if name == "Soldiers":
+            # Sorting and selection act on the tree of the shown base
+            self.soldier_tree, self.soldier_table = self.soldier_trees[id(base)]
+            # The sort may have changed while another base was shown
+            self.soldier_table.sort(
+                self.soldier_sort_col, reverse=self.soldier_sort_reverse
+            )
+            self.refresh_soldier_tree()
+
+    def clear_tab_cache(self):
+        for content in self.tab_cache.values():
+            content.destroy()
+        self.tab_cache = {}
+        self.shown_tabs = {}
+        self.soldier_trees = {}
 
     def clear_frame(self, frame):
         for widget in frame.winfo_children():
             widget.destroy()
 
-    def render_overview(self, base):
-        frame = self.tab_overview
+    def render_overview(self, base, frame=None):
+        frame = self.tab_overview if frame is None else frame
         self.clear_frame(frame)
 
         # Facilities List (Scrollable)
@@ -119,8 +185,8 @@ class BaseView(ctk.CTkFrame):
         for ftype, count in counts.items():
             ctk.CTkLabel(scroll, text=f"{ftype}: {count}").pack(anchor="w", padx=10)
 
-    def render_soldiers(self, base):
-        frame = self.tab_soldiers
+    def render_soldiers(self, base, frame=None):
+        frame = self.tab_soldiers if frame is None else frame
         self.clear_frame(frame)
 
         total = len(base.soldiers)
@@ -157,14 +223,16 @@ class BaseView(ctk.CTkFrame):
         self.soldier_tree = self.create_soldier_tree(frame)
         self.soldier_tree.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
+        # Bases are small enough to show every soldier at once
+        self.soldier_table = SoldierTable(SOLDIER_COLUMNS, page_size=None)
+        self.soldier_trees[id(base)] = (self.soldier_tree, self.soldier_table)
         self.populate_soldier_tree(base.soldiers)
 
     def create_soldier_tree(self, parent):
-        columns = ["Rank", "Name", "Missions", "Kills", "Status"]
-        tree = ttk.Treeview(parent, columns=columns, show="headings")
+        tree = ttk.Treeview(parent, columns=SOLDIER_COLUMNS, show="headings")
 
         # Configure headers
-        for col in columns:
+        for col in SOLDIER_COLUMNS:
             tree.heading(col, text=col, command=lambda c=col: self.sort_soldier_tree(c))
 
             if col == "Name":
@@ -193,21 +261,24 @@ class BaseView(ctk.CTkFrame):
         for i in self.soldier_tree.get_children():
             self.soldier_tree.delete(i)
 
-        data = []
-        for s in soldiers:
-            # Rank translation
-            rank_key = self.controller.translation_manager.get_rank_string(
-                s.rank, s.type
-            )
-            rank_str = self.controller.translation_manager.get(rank_key)
+        self.soldier_table.set_rows(self.build_soldier_rows(soldiers))
+        self.soldier_table.sort(
+            self.soldier_sort_col, reverse=self.soldier_sort_reverse
+        )
+        self.soldier_table.next_page()
+        self.refresh_soldier_tree()
 
+    def build_soldier_rows(self, soldiers):
+        translation_manager = self.controller.translation_manager
+        ranks = translation_manager.translate_many(
+            translation_manager.get_rank_string(s.rank, s.type) for s in soldiers
+        )
+        for s, rank_str in zip(soldiers, ranks, strict=True):
             # Status
             status_parts = []
-            is_wounded = False
             if s.recovery > 0:
                 rec_str = view_utils.format_recovery_time(s.recovery)
                 status_parts.append(f"Wounded ({rec_str})")
-                is_wounded = True
             if s.training:
                 status_parts.append("Training")
             if s.psi_training:
@@ -215,33 +286,26 @@ class BaseView(ctk.CTkFrame):
 
             status_str = ", ".join(status_parts) if status_parts else "Active"
 
-            data.append(
-                {
-                    "id": s.id,
-                    "values": [rank_str, s.name, s.missions, s.kills, status_str],
-                    "wounded": is_wounded,
-                    "raw_sort": {  # For smarter sorting
-                        "Rank": s.rank,
-                        "Name": s.name,
-                        "Missions": s.missions,
-                        "Kills": s.kills,
-                        "Status": s.recovery,  # Sort status by recovery days roughly
-                    },
-                }
+            yield TableRow(
+                s.id,
+                (rank_str, s.name, s.missions, s.kills, status_str),
+                # Rank sorts by its index in the ruleset and status roughly by
+                # recovery days
+                (s.rank, text_key(s.name), s.missions, s.kills, s.recovery),
+                tags=("wounded",) if s.recovery > 0 else (),
             )
 
-        # Sort
-        self.sort_data_list(data)
-
-        # Insert
-        for i, item in enumerate(data):
-            tags = ["even" if i % 2 == 0 else "odd"]
-            if item["wounded"]:
-                tags.append("wounded")
-
+    def refresh_soldier_tree(self):
+        # Insert new rows, restripe moved ones, then apply the order in one call
+        table = self.soldier_table
+        new, retagged = table.sync()
+        for iid, tags in new:
             self.soldier_tree.insert(
-                "", "end", iid=item["id"], values=item["values"], tags=tuple(tags)
+                "", "end", iid=iid, values=table.values(iid), tags=tags
             )
+        for iid, tags in retagged:
+            self.soldier_tree.item(iid, tags=tags)
+        self.soldier_tree.set_children("", *table.window())
 
     def sort_soldier_tree(self, col):
         if self.soldier_sort_col == col:
@@ -250,53 +314,8 @@ class BaseView(ctk.CTkFrame):
             self.soldier_sort_reverse = False
             self.soldier_sort_col = col
 
-        # Repopulate (using current base soldiers, but we need access to them.
-        # Easier to re-read from tree or just re-render.
-        # But render_soldiers creates new tree.
-        # Let's re-sort the existing items in the tree.
-
-        items = []
-        for child in self.soldier_tree.get_children(""):
-            values = self.soldier_tree.item(child, "values")
-            # We loose raw data if we just pull values.
-            # But we can assume typical string/int sorting for now.
-            items.append((values, child))
-
-        # Helper to get sort key
-        def get_key(item):
-            # Map column name to index
-            col_idx = ["Rank", "Name", "Missions", "Kills", "Status"].index(col)
-            val = item[0][col_idx]
-            # Try float
-            try:
-                return float(val)
-            except ValueError:
-                return val
-
-        items.sort(key=get_key, reverse=self.soldier_sort_reverse)
-
-        for index, (_, child) in enumerate(items):
-            self.soldier_tree.move(child, "", index)
-            # Re-stripe
-            current_tags = list(self.soldier_tree.item(child, "tags"))
-            # Remove old striping
-            if "even" in current_tags:
-                current_tags.remove("even")
-            if "odd" in current_tags:
-                current_tags.remove("odd")
-
-            new_stripe = "even" if index % 2 == 0 else "odd"
-            current_tags.append(new_stripe)
-            self.soldier_tree.item(child, tags=tuple(current_tags))
-
-    def sort_data_list(self, data):
-        # Sort the raw data dictionary list based on self.soldier_sort_col
-        key_name = self.soldier_sort_col
-
-        def get_sort_val(item):
-            return item["raw_sort"].get(key_name, "")
-
-        data.sort(key=get_sort_val, reverse=self.soldier_sort_reverse)
+        self.soldier_table.sort(col, reverse=self.soldier_sort_reverse)
+        self.refresh_soldier_tree()
 
     def on_soldier_select(self, event):
         selected = self.soldier_tree.selection()
@@ -304,8 +323,8 @@ class BaseView(ctk.CTkFrame):
             soldier_id = selected[0]
             self.controller.show_soldier_view(soldier_id, previous_view=BaseView)
 
-    def render_storage(self, base):
-        frame = self.tab_storage
+    def render_storage(self, base, frame=None):
+        frame = self.tab_storage if frame is None else frame
         self.clear_frame(frame)
 
         scroll = ctk.CTkScrollableFrame(frame)
@@ -316,12 +335,10 @@ class BaseView(ctk.CTkFrame):
             return
 
         # Sort items by name (translated)
-        items_list = []
-        for item_key, qty in base.items.items():
-            name = self.controller.translation_manager.get(item_key)
-            items_list.append((name, qty))
-
-        items_list.sort(key=lambda x: x[0])
+        names = self.controller.translation_manager.translate_many(base.items)
+        items_list = sorted(
+            zip(names, base.items.values(), strict=True), key=lambda x: x[0]
+        )
 
         for name, qty in items_list:
             row = ctk.CTkFrame(scroll, fg_color="transparent")
@@ -329,8 +346,8 @@ class BaseView(ctk.CTkFrame):
             ctk.CTkLabel(row, text=name).pack(side="left", padx=10)
             ctk.CTkLabel(row, text=str(qty)).pack(side="right", padx=10)
 
-    def render_research(self, base):
-        frame = self.tab_research
+    def render_research(self, base, frame=None):
+        frame = self.tab_research if frame is None else frame
         self.clear_frame(frame)
 
         scroll = ctk.CTkScrollableFrame(frame)
@@ -365,8 +382,8 @@ class BaseView(ctk.CTkFrame):
                 prog_text = f"{r.spent}/?"
             ctk.CTkLabel(row, text=prog_text, width=150).pack(side="left", padx=5)
 
-    def render_manufacturing(self, base):
-        frame = self.tab_manufacturing
+    def render_manufacturing(self, base, frame=None):
+        frame = self.tab_manufacturing if frame is None else frame
         self.clear_frame(frame)
 
         scroll = ctk.CTkScrollableFrame(frame)
@@ -399,8 +416,8 @@ class BaseView(ctk.CTkFrame):
                 width=80,
             ).pack(side="left", padx=5)
 
-    def render_transfers(self, base):
-        frame = self.tab_transfers
+    def render_transfers(self, base, frame=None):
+        frame = self.tab_transfers if frame is None else frame
         self.clear_frame(frame)
 
         scroll = ctk.CTkScrollableFrame(frame)
@@ -120,7 +120,7 @@ class SettingsView(ctk.CTkToplevel):
                 shutil.rmtree(cache_dir)
             messagebox.showinfo(
                 "Cache Cleared",
-                "Ruleset cache has been cleared.",
+                "Ruleset and save caches have been cleared.",
             )
         except Exception as e:
             messagebox.showerror(
@@ -2,6 +2,15 @@ from tkinter import ttk
 
 import customtkinter as ctk
 
+from soldier_table import SoldierTable, TableRow, text_key
+
+COLUMNS = ["ID", "Name", "Rank", "Missions", "Kills", "Base"]
+_BASE = COLUMNS.index("Base")
+
+
+def _not_kia(row):
+    return row.values[_BASE] != "KIA"
+
 
 class SoldierListView(ctk.CTkFrame):
     def __init__(self, parent, controller):
@@ -10,6 +19,10 @@ class SoldierListView(ctk.CTkFrame):
         self.sort_column = "Name"  # Default sort column
         self.sort_reverse = False
         self.show_kia = ctk.BooleanVar(value=False)
+        # Rows live in the model; the tree only holds the ones scrolled into view
+        self.table = SoldierTable(COLUMNS)
+        # Roster the table rows were built from
+        self.roster = None
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
@@ -25,7 +38,7 @@ class SoldierListView(ctk.CTkFrame):
 
         # Kia Toggle
         kia_switch = ctk.CTkSwitch(
-            self, text="Show KIA", variable=self.show_kia, command=self.update_view
+            self, text="Show KIA", variable=self.show_kia, command=self.apply_filter
         )
         kia_switch.grid(row=0, column=2, padx=20, pady=20, sticky="e")
 
@@ -77,7 +90,23 @@ class SoldierListView(ctk.CTkFrame):
 
         style.map("Treeview.Heading", background=[("active", "#4a4e54")])
 
-        tree = ttk.Treeview(self, show="headings")
+        tree = ttk.Treeview(self, columns=COLUMNS, show="headings")
+        tree.configure(yscrollcommand=self.on_tree_scroll)
+
+        # Configure columns
+        for col in COLUMNS:
+            tree.heading(
+                col, text=col, anchor="w", command=lambda c=col: self.sort_by_column(c)
+            )
+            if col == "Name":
+                tree.column(col, anchor="w", stretch=True, minwidth=150)
+            elif col == "Base":
+                tree.column(col, anchor="w", stretch=True, minwidth=100)
+            else:
+                tree.column(col, anchor="w", stretch=False, width=80, minwidth=60)
+
+        # Add event handler for row selection
+        tree.bind("<<TreeviewSelect>>", self.on_soldier_select)
 
         # Configure alternating row colors
         tree.tag_configure("odd", background="#2b2b2b")
@@ -91,55 +120,76 @@ class SoldierListView(ctk.CTkFrame):
         self.controller.show_frame(MainMenu)
 
     def update_view(self):
-        # Clear existing data
-        for i in self.tree.get_children():
-            self.tree.delete(i)
-
-        # Get data from controller
+        # Rebuild the rows only when a different roster (save) was loaded;
+        # otherwise keep them, with their sort order, and refresh the filter
         soldiers = self.controller.soldiers
-        if not soldiers:
-            return
-
-        # Filter logic
-        filtered_soldiers = []
-        for s in soldiers:
-            if not self.show_kia.get() and s.base == "KIA":
-                continue
-            filtered_soldiers.append(s)
-
-        soldiers = filtered_soldiers
-
-        # Define columns
-        columns = ["ID", "Name", "Rank", "Missions", "Kills", "Base"]
-        self.tree["columns"] = columns
+        if soldiers is not self.roster:
+            self.clear_tree()
+            self.roster = soldiers
+            self.table.set_rows(self.build_rows(soldiers or []))
+        self.apply_filter()
+
+    def apply_filter(self):
+        # Filter logic; rows that fail it are detached from the tree by id
+        self.table.set_filter(None if self.show_kia.get() else _not_kia)
+        self.refresh_tree()
+
+    def build_rows(self, soldiers):
+        translation_manager = self.controller.translation_manager
+        ranks = translation_manager.translate_many(
+            translation_manager.get_rank_string(s.rank, s.type) for s in soldiers
+        )
+        for soldier, rank in zip(soldiers, ranks, strict=True):
+            yield TableRow(
+                soldier.id,
+                (
+                    soldier.id,
+                    soldier.name,
+                    rank,
+                    soldier.missions,
+                    soldier.kills,
+                    soldier.base,
+                ),
+                # Ranks sort by their index in the ruleset, not by name
+                (
+                    soldier.id,
+                    text_key(soldier.name),
+                    soldier.rank,
+                    soldier.missions,
+                    soldier.kills,
+                    text_key(soldier.base),
+                ),
+            )
 
-        # Configure columns
-        for col in columns:
-            self.tree.heading(
-                col, text=col, anchor="w", command=lambda c=col: self.sort_by_column(c)
+    def clear_tree(self):
+        # Rows detached by a sort or filter still exist in the tree, so delete every
+        # row the table has materialized rather than the visible children
+        rows = self.table.materialized()
+        if rows:
+            self.tree.delete(*rows)
+        self.table.set_rows(())
+
+    def refresh_tree(self):
+        # Insert rows entering the window, restripe rows that moved, then
+        # apply the order in one call
+        new, retagged = self.table.sync()
+        for iid, tags in new:
+            self.tree.insert(
+                "", "end", iid=iid, values=self.table.values(iid), tags=tags
             )
-            if col == "Name":
-                self.tree.column(col, anchor="w", stretch=True, minwidth=150)
-            elif col == "Base":
-                self.tree.column(col, anchor="w", stretch=True, minwidth=100)
-            else:
-                self.tree.column(col, anchor="w", stretch=False, width=80, minwidth=60)
+        for iid, tags in retagged:
+            self.tree.item(iid, tags=tags)
+        self.tree.set_children("", *self.table.window())
 
-        # Insert data with striped rows
-        for i, soldier in enumerate(soldiers):
-            values = [
-                soldier.id,
-                soldier.name,
-                self.controller.translation_manager.get(soldier.rank),
-                soldier.missions,
-                soldier.kills,
-                soldier.base,
-            ]
-            tag = "even" if i % 2 == 0 else "odd"
-            self.tree.insert("", "end", values=values, iid=soldier.id, tags=(tag,))
+    def show_next_page(self):
+        self.table.next_page()
+        self.refresh_tree()
 
-        # Add event handler for row selection
-        self.tree.bind("<<TreeviewSelect>>", self.on_soldier_select)
+    def on_tree_scroll(self, first, last):
+        # Materialize another page once the last shown row scrolls into view.
+        # This also fills the tree when a page is shorter than the widget.
+        if float(last) >= 1.0 and self.table.has_more:
+            self.show_next_page()
 
     def sort_by_column(self, col):
         # Determine sort order
@@ -149,24 +199,8 @@ class SoldierListView(ctk.CTkFrame):
             self.sort_reverse = False
         self.sort_column = col
 
-        # Get data from treeview
-        data = [
-            (self.tree.set(child, col), child) for child in self.tree.get_children("")
-        ]
-
-        # Sort data
-        # Attempt to convert to a number for sorting, otherwise use string
-        try:
-            data.sort(key=lambda t: float(t[0]), reverse=self.sort_reverse)
-        except ValueError:
-            data.sort(key=lambda t: t[0], reverse=self.sort_reverse)
-
-        # Repopulate treeview
-        for index, (_, child) in enumerate(data):
-            self.tree.move(child, "", index)
-            # Re-stripe
-            tag = "even" if index % 2 == 0 else "odd"
-            self.tree.item(child, tags=(tag,))
+        self.table.sort(col, reverse=self.sort_reverse)
+        self.refresh_tree()
 
     def on_soldier_select(self, event):
         selected_item = self.tree.selection()
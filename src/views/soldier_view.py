@@ -160,7 +160,8 @@ class SoldierView(ctk.CTkFrame):
             widget.destroy()
 
         inventory_data = format_inventory_for_display(
-            getattr(soldier, "equipmentLayout", None), translator=tr
+            getattr(soldier, "equipmentLayout", None),
+            translate_many=self.controller.translation_manager.translate_many,
         )
 
         if inventory_data:
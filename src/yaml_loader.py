@@ -0,0 +1,45 @@
+import logging
+
+import yaml
+
+# Configure logger for this module
+logger = logging.getLogger(__name__)
+
+# Prefer libyaml's C implementation; PyYAML only ships it when built against
+# libyaml, so fall back to the pure-Python loader when it is missing.
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+    BACKEND = "libyaml"
+except ImportError:
+    from yaml import SafeLoader
+
+    BACKEND = "pure-python"
+
+_backend_logged = False
+
+
+def _get_loader():
+    global _backend_logged
+    if not _backend_logged:
+        logger.info(f"Using {BACKEND} YAML loader.")
+        _backend_logged = True
+    return SafeLoader
+
+
+def safe_load(stream):
+    """
+    Parse the first YAML document in a stream using the fastest safe loader.
+    :param stream: A string, bytes or open file object.
+    :return: The parsed document.
+    """
+    return yaml.load(stream, Loader=_get_loader())
+
+
+def safe_load_all(stream):
+    """
+    Lazily parse all YAML documents in a stream using the fastest safe loader.
+    :param stream: A string, bytes or open file object.
+    :return: A generator yielding each parsed document.
+    """
+    return yaml.load_all(stream, Loader=_get_loader())
@@ -1,7 +1,7 @@
 import os
 import sys
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -19,6 +19,9 @@ class DummyCTkFrame:
     def pack(self, **kwargs):
         pass
 
+    def pack_forget(self):
+        pass
+
     def grid_rowconfigure(self, index, weight=1):
         pass
 
@@ -75,6 +78,8 @@ class DummyCTkOptionMenu:
 class DummyCTkTabview:
     def __init__(self, master=None, **kwargs):
         self.tabs = {}
+        self.command = kwargs.get("command")
+        self.current = None
 
     def grid(self, **kwargs):
         pass
@@ -82,7 +87,16 @@ class DummyCTkTabview:
     def pack(self, **kwargs):
         pass
 
+    def get(self):
+        return self.current
+
+    def set(self, name):
+        self.current = name
+
     def add(self, name):
+        # The first tab added is selected, as in CTkTabview
+        if self.current is None:
+            self.current = name
         self.tabs[name] = MagicMock()
         # Mock winfo_children for the tab frame
         self.tabs[name].winfo_children = MagicMock(return_value=[])
@@ -144,6 +158,9 @@ class DummyTreeview:
     def move(self, item, parent, index):
         pass
 
+    def set_children(self, item, *newchildren):
+        pass
+
     def selection(self):
         return [1]
 
@@ -220,8 +237,14 @@ class TestBaseView(unittest.TestCase):
         self.mock_parent = MagicMock()
         self.mock_controller = MagicMock()
         self.mock_controller.bases = []
+        self.mock_controller.get_base_by_name.side_effect = lambda name: next(
+            (b for b in self.mock_controller.bases if b.name == name), None
+        )
         self.mock_controller.translation_manager = MagicMock()
         self.mock_controller.translation_manager.get.side_effect = lambda x: f"TR[{x}]"
+        self.mock_controller.translation_manager.translate_many.side_effect = (
+            lambda keys: [f"TR[{x}]" for x in keys]
+        )
         self.mock_controller.translation_manager.get_rank_string.return_value = (
             "STR_RANK"
         )
@@ -518,59 +541,73 @@ class TestBaseView(unittest.TestCase):
             texts = [c.kwargs.get("text") for c in MockLabel.call_args_list]
             self.assertIn("No incoming transfers.", texts)
 
-    def test_sort_data_list(self):
-        """Test data list sorting logic"""
-        data = [
-            {"raw_sort": {"Rank": 1, "Name": "B"}},
-            {"raw_sort": {"Rank": 2, "Name": "A"}},
-            {"raw_sort": {"Rank": 0, "Name": "C"}},
+    def _soldier(self, id_, rank, name, recovery=0):
+        s = MagicMock()
+        s.id = id_
+        s.rank = rank
+        s.type = "STR_SOLDIER"
+        s.name = name
+        s.missions = id_
+        s.kills = 0
+        s.recovery = recovery
+        s.training = False
+        s.psi_training = False
+        return s
+
+    def test_populate_soldier_tree_sorts_by_rank_index(self):
+        """Rows are ordered by rank index, not by the translated rank"""
+        self.view.soldier_tree = MagicMock()
+        self.view.soldier_tree.get_children.return_value = []
+        soldiers = [
+            self._soldier(1, 2, "alice"),
+            self._soldier(2, 10, "Bob", recovery=3),
+            self._soldier(3, 0, "carol"),
         ]
 
         self.view.soldier_sort_col = "Rank"
         self.view.soldier_sort_reverse = False
-        self.view.sort_data_list(data)
-        self.assertEqual(data[0]["raw_sort"]["Rank"], 0)
-        self.assertEqual(data[1]["raw_sort"]["Rank"], 1)
-        self.assertEqual(data[2]["raw_sort"]["Rank"], 2)
-
-        self.view.soldier_sort_col = "Name"
-        self.view.soldier_sort_reverse = True
-        self.view.sort_data_list(data)
-        self.assertEqual(data[0]["raw_sort"]["Name"], "C")
-        self.assertEqual(data[1]["raw_sort"]["Name"], "B")
-        self.assertEqual(data[2]["raw_sort"]["Name"], "A")
+        self.view.populate_soldier_tree(soldiers)
+
+        tree = self.view.soldier_tree
+        tree.set_children.assert_called_once_with("", 3, 1, 2)
+        inserted = {c.kwargs["iid"]: c.kwargs["tags"] for c in tree.insert.mock_calls}
+        self.assertEqual(inserted, {3: ("even",), 1: ("odd",), 2: ("even", "wounded")})
 
     def test_sort_soldier_tree(self):
-        """Test treeview sorting mechanism"""
+        """Sorting reorders the model and the tree in one call"""
         self.view.soldier_tree = MagicMock()
-        self.view.soldier_tree.get_children.return_value = ["item1", "item2"]
-
-        # We need realistic item values
-        def mock_item(child, option=None, **kwargs):
-            if option == "values":
-                if child == "item1":
-                    return ["Rank 2", "Alice", 5, 10, "Active"]
-                else:
-                    return ["Rank 1", "Bob", 10, 5, "Wounded"]
-            if option == "tags":
-                if child == "item1":
-                    return ["even"]
-                else:
-                    return ["odd"]
-            return None
-
-        self.view.soldier_tree.item = MagicMock(side_effect=mock_item)
-
-        # Toggle reverse flag if same column
+        self.view.soldier_tree.get_children.return_value = []
+        soldiers = [
+            self._soldier(1, 2, "alice"),
+            self._soldier(2, 10, "Bob"),
+            self._soldier(3, 0, "carol"),
+        ]
         self.view.soldier_sort_col = "Rank"
         self.view.soldier_sort_reverse = False
+        self.view.populate_soldier_tree(soldiers)
+        tree = self.view.soldier_tree
+        tree.reset_mock()
+
+        # Toggle reverse flag if same column
         self.view.sort_soldier_tree("Rank")
         self.assertTrue(self.view.soldier_sort_reverse)
+        tree.set_children.assert_called_once_with("", 2, 1, 3)
 
-        # Change column
+        # Change column; names compare case-insensitively
+        tree.reset_mock()
         self.view.sort_soldier_tree("Name")
         self.assertEqual(self.view.soldier_sort_col, "Name")
         self.assertFalse(self.view.soldier_sort_reverse)
+        tree.set_children.assert_called_once_with("", 1, 2, 3)
+
+        # Nothing is read back from the tree, rows are not moved one by one,
+        # and only rows whose stripe changed are retagged
+        self.assertEqual(
+            tree.item.mock_calls,
+            [call(1, tags=("even",)), call(2, tags=("odd",))],
+        )
+        tree.move.assert_not_called()
+        tree.insert.assert_not_called()
 
     def test_on_soldier_select(self):
         """Test soldier selection handler"""
@@ -583,6 +620,125 @@ class TestBaseView(unittest.TestCase):
             1, previous_view=BaseView
         )
 
+    def _mock_renderers(self):
+        renderers = {}
+        for name, (tab, _) in self.view.tab_renderers.items():
+            renderers[name] = MagicMock()
+            self.view.tab_renderers[name] = (tab, renderers[name])
+        return renderers
+
+    def _bases(self, *names):
+        bases = []
+        for name in names:
+            base = MagicMock()
+            base.name = name
+            bases.append(base)
+        self.mock_controller.bases = bases
+        return bases
+
+    def test_tabs_render_lazily_and_once_per_base(self):
+        """Only the visible tab renders; revisited tabs come from the cache"""
+        renderers = self._mock_renderers()
+        alpha, beta = self._bases("Base Alpha", "Base Beta")
+
+        self.view.update_view()
+        renderers["Overview"].assert_called_once()
+        self.assertIs(renderers["Overview"].call_args.args[0], alpha)
+        renderers["Storage"].assert_not_called()
+
+        # Selecting a tab renders it for the current base
+        self.view.tab_view.set("Storage")
+        self.view.on_tab_change()
+        renderers["Storage"].assert_called_once()
+
+        # Switching bases renders only the visible tab for the new base
+        self.view.on_base_select("Base Beta")
+        self.assertEqual(renderers["Storage"].call_count, 2)
+        self.assertIs(renderers["Storage"].call_args.args[0], beta)
+        renderers["Overview"].assert_called_once()
+
+        # Going back to a base reuses its rendered tab
+        self.view.on_base_select("Base Alpha")
+        self.view.update_view()
+        self.assertEqual(renderers["Storage"].call_count, 2)
+        self.assertEqual(self.view.shown_tabs["Storage"], ("Storage", id(alpha)))
+
+    def test_bases_with_the_same_name_are_cached_apart(self):
+        """Two bases sharing a name each get their own tabs and soldier tree"""
+        renderers = self._mock_renderers()
+        first, second = self._bases("Base Alpha", "Base Alpha")
+
+        self.view.show_tab("Overview", first)
+        self.view.show_tab("Overview", second)
+        self.assertEqual(renderers["Overview"].call_count, 2)
+        self.assertIs(renderers["Overview"].call_args.args[0], second)
+        self.assertEqual(len(self.view.tab_cache), 2)
+
+        first.soldiers = []
+        second.soldiers = []
+        self.view.render_soldiers(first, MagicMock())
+        first_tree = self.view.soldier_tree
+        self.view.render_soldiers(second, MagicMock())
+        self.assertIsNot(self.view.soldier_trees[id(first)][0], self.view.soldier_tree)
+        self.assertIs(self.view.soldier_trees[id(first)][0], first_tree)
+
+    def test_new_save_clears_tab_cache(self):
+        """Tabs cached for the previous save are destroyed and re-rendered"""
+        renderers = self._mock_renderers()
+        self._bases("Base Alpha")
+        self.view.update_view()
+        cached = list(self.view.tab_cache.values())
+        for content in cached:
+            content.destroy = MagicMock()
+
+        # A new save with a base of the same name
+        (alpha,) = self._bases("Base Alpha")
+        self.view.update_view()
+
+        for content in cached:
+            content.destroy.assert_called_once()
+        self.assertIs(self.view.current_base, alpha)
+        self.assertEqual(renderers["Overview"].call_count, 2)
+        self.assertIs(renderers["Overview"].call_args.args[0], alpha)
+
+    def test_soldiers_tab_restores_base_tree(self):
+        """Sorting acts on the soldier tree of the base being shown"""
+        alpha, beta = self._bases("Base Alpha", "Base Beta")
+        alpha.soldiers = []
+        beta.soldiers = []
+        self.view.tab_view.set("Soldiers")
+
+        self.view.update_view()
+        alpha_tree = self.view.soldier_tree
+        self.view.on_base_select("Base Beta")
+        self.assertIsNot(self.view.soldier_tree, alpha_tree)
+
+        self.view.on_base_select("Base Alpha")
+        self.assertIs(self.view.soldier_tree, alpha_tree)
+
+    def test_soldiers_tab_keeps_sort_across_bases(self):
+        """A cached soldier tree follows a sort chosen on another base"""
+        alpha, beta = self._bases("Base Alpha", "Base Beta")
+        alpha.soldiers = [self._soldier(1, 0, "bob"), self._soldier(2, 1, "alice")]
+        beta.soldiers = [self._soldier(3, 0, "dave"), self._soldier(4, 1, "carol")]
+        self.view.tab_view.set("Soldiers")
+
+        self.view.update_view()
+        alpha_table = self.view.soldier_table
+        self.assertEqual(alpha_table.window(), [1, 2])
+
+        self.view.on_base_select("Base Beta")
+        self.view.sort_soldier_tree("Name")
+        self.assertEqual(self.view.soldier_table.window(), [4, 3])
+
+        self.view.on_base_select("Base Alpha")
+        self.assertIs(self.view.soldier_table, alpha_table)
+        self.assertEqual(alpha_table.window(), [2, 1])
+
+        # The next click on the same header reverses the shown base's order
+        self.view.sort_soldier_tree("Name")
+        self.assertEqual(alpha_table.window(), [1, 2])
+
     def test_back_to_menu(self):
         """Test back to menu button"""
         from views.main_menu import MainMenu
@@ -0,0 +1,131 @@
+import csv
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import batch
+import reader
+
+TEST_SAVE_FILE = os.path.join(os.path.dirname(__file__), "Test Save.sav")
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..", "src")
+
+
+@pytest.fixture
+def save_dir(tmp_path):
+    saves = tmp_path / "saves"
+    saves.mkdir()
+    shutil.copy(TEST_SAVE_FILE, saves / "one.sav")
+    shutil.copy(TEST_SAVE_FILE, saves / "_autosave_.asav")
+    (saves / "notes.txt").write_text("not a save")
+    return saves
+
+
+def _soldier_count():
+    _, game = reader.load_save(TEST_SAVE_FILE)
+    _, soldiers, _ = reader.read_roster(game, reader.read_missions(game))
+    return len(soldiers)
+
+
+class TestBatch:
+    def test_find_saves(self, save_dir):
+        saves = batch.find_saves([str(save_dir), TEST_SAVE_FILE, "missing.sav"])
+        names = [os.path.basename(p) for p in saves]
+        assert names == ["_autosave_.asav", "one.sav", "Test Save.sav"]
+
+    def test_guess_format(self):
+        assert batch.guess_format("out.csv") == "csv"
+        assert batch.guess_format("out.JSON.gz") == "json"
+        assert batch.guess_format("out.parquet") == "parquet"
+        assert batch.guess_format("out.txt") == "csv"
+
+    def test_csv_export(self, save_dir, tmp_path):
+        output = tmp_path / "roster.csv"
+        assert batch.main([str(save_dir), "-o", str(output)]) == 0
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["Save", *reader.CSV_COLUMNS]
+        assert len(rows) == 2 * _soldier_count() + 1
+        assert {row[0] for row in rows[1:]} == {"one.sav", "_autosave_.asav"}
+
+    def test_json_export_gzip_with_columns(self, save_dir, tmp_path):
+        output = tmp_path / "roster.json.gz"
+        count = batch.export(
+            batch.find_saves([str(save_dir / "one.sav")]),
+            str(output),
+            columns=["ID", "Name"],
+        )
+        with gzip.open(output, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        assert count == len(data) == _soldier_count()
+        assert set(data[0]) == {"Save", "ID", "Name"}
+
+    def test_game_dir_resolves_rank_names(self, tmp_path):
+        game_dir = tmp_path / "game"
+        lang_dir = game_dir / "common" / "Language"
+        lang_dir.mkdir(parents=True)
+        (lang_dir / "en-US.yml").write_text(
+            "en-US:\n  STR_ROOKIE: Rookie\n  STR_SQUADDIE: Squaddie\n"
+        )
+        output = tmp_path / "roster.json"
+        batch.export(
+            [TEST_SAVE_FILE],
+            str(output),
+            columns=["Rank"],
+            game_dir=str(game_dir),
+        )
+        with open(output, encoding="utf-8") as f:
+            ranks = {row["Rank"] for row in json.load(f)}
+        assert "Rookie" in ranks
+        assert not any(isinstance(rank, int) for rank in ranks)
+
+    def test_parallel_export(self, save_dir, tmp_path):
+        output = tmp_path / "roster.csv"
+        args = [str(save_dir), "-o", str(output), "-w", "2", "-c", "ID"]
+        assert batch.main(args) == 0
+        with open(output, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["Save", "ID"]
+        assert len(rows) == 2 * _soldier_count() + 1
+
+    def test_bad_save_is_skipped(self, save_dir, tmp_path):
+        (save_dir / "broken.sav").write_text("not: [valid")
+        output = tmp_path / "roster.csv"
+        count = batch.export(batch.find_saves([str(save_dir)]), str(output))
+        assert count == 2 * _soldier_count()
+
+    def test_unknown_column_is_rejected(self, tmp_path):
+        with pytest.raises(SystemExit):
+            batch.main([TEST_SAVE_FILE, "-o", str(tmp_path / "x.csv"), "-c", "Bogus"])
+
+    def test_parquet_requires_pyarrow(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        with pytest.raises(SystemExit):
+            batch.main([TEST_SAVE_FILE, "-o", str(tmp_path / "x.parquet")])
+        assert "pyarrow" in capsys.readouterr().err
+
+    def test_runs_without_gui_modules(self, tmp_path):
+        """The batch entry point must never import the GUI toolkit."""
+        output = tmp_path / "roster.csv"
+        script = (
+            "import sys, batch\n"
+            f"code = batch.main([{TEST_SAVE_FILE!r}, '-o', {str(output)!r}])\n"
+            "loaded = {'customtkinter', 'tkinter'} & set(sys.modules)\n"
+            "assert not loaded, loaded\n"
+            "sys.exit(code)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=SRC_DIR,
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+        assert output.exists()
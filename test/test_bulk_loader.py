@@ -0,0 +1,99 @@
+import os
+import pickle
+import shutil
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import bulk_loader
+import reader
+from data_manager import GameDataManager
+
+TEST_SAVE_FILE = os.path.join(os.path.dirname(__file__), "Test Save.sav")
+
+
+@pytest.fixture
+def saves(tmp_path):
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"save{i}.sav"
+        shutil.copy(TEST_SAVE_FILE, path)
+        paths.append(str(path))
+    return paths
+
+
+class TestBulkLoader:
+    def test_summarize_save(self):
+        summary = bulk_loader.summarize_save(TEST_SAVE_FILE, columns=["ID", "Name"])
+        _, game = reader.load_save(TEST_SAVE_FILE)
+        missions = reader.read_missions(game)
+        bases, soldiers, _ = reader.read_roster(game, missions)
+
+        assert summary.error is None
+        assert summary.name
+        assert summary.base_count == len(bases)
+        assert summary.mission_count == len(missions)
+        assert summary.header == ("ID", "Name")
+        assert summary.rows == [(s.id, s.name) for s in soldiers]
+
+    def test_summary_pickles_compactly(self):
+        summary = bulk_loader.summarize_save(TEST_SAVE_FILE)
+        restored = pickle.loads(pickle.dumps(summary))
+        assert restored.rows == summary.rows
+        assert restored.soldier_count == summary.soldier_count
+        assert not hasattr(summary, "__dict__")
+
+    def test_error_is_recorded(self, tmp_path):
+        broken = tmp_path / "broken.sav"
+        broken.write_text("not: [valid")
+        summary = bulk_loader.summarize_save(str(broken))
+        assert summary.error
+        assert summary.rows == []
+
+    def test_sequential_keeps_order(self, saves):
+        summaries = list(bulk_loader.load_saves(saves, workers=1))
+        assert [s.path for s in summaries] == saves
+
+    def test_process_pool(self, saves):
+        summaries = list(bulk_loader.load_saves(saves, workers=2, columns=["ID"]))
+        assert sorted(s.path for s in summaries) == sorted(saves)
+        expected = bulk_loader.summarize_save(TEST_SAVE_FILE, columns=["ID"]).rows
+        for summary in summaries:
+            assert summary.error is None
+            assert summary.rows == expected
+
+    def test_no_saves(self):
+        assert list(bulk_loader.load_saves([], workers=4)) == []
+
+    def test_summaries_keep_cache_in_bounds(self, tmp_path):
+        game_dir = tmp_path / "game"
+        game_dir.mkdir()
+        data_manager = GameDataManager(
+            str(game_dir), parse_workers=1, cache_max_entries=3
+        )
+        data_manager._cache_dir = str(tmp_path / "cache")
+        for i in range(6):
+            path = tmp_path / f"save{i}.sav"
+            shutil.copy(TEST_SAVE_FILE, path)
+            # Distinct contents, so every save gets its own cache entry
+            with open(path, "a") as f:
+                f.write(f"\n# {i}\n")
+            summary = bulk_loader.summarize_save(str(path), data_manager=data_manager)
+            assert summary.error is None
+
+        assert len(os.listdir(data_manager._cache_dir)) <= 3
+
+    def test_managers_use_config_limits(self, tmp_path):
+        with patch.object(bulk_loader, "Config") as mock_config:
+            mock_config.return_value.cache_max_bytes = 1024
+            mock_config.return_value.cache_max_entries = 7
+            mock_config.return_value.verify_ruleset_files = True
+            data_manager, _ = bulk_loader._make_managers(str(tmp_path))
+
+        assert data_manager.cache_max_bytes == 1024
+        assert data_manager.cache_max_entries == 7
+        assert data_manager.verify_ruleset_files is True
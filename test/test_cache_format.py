@@ -0,0 +1,123 @@
+import datetime
+import os
+import pickle
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import cache_format
+
+SAMPLE = {
+    "items": {"STR_RIFLE": {"weight": 8, "costs": {1: 10}, "tags": ["a", None]}},
+    "ratio": 0.5,
+    "enabled": True,
+}
+
+
+class TestCacheFormat:
+    @pytest.mark.parametrize("serializer", ["marshal", "pickle"])
+    def test_round_trip(self, serializer):
+        data = cache_format.dumps(SAMPLE, serializer)
+        assert data.startswith(cache_format.MAGIC)
+        assert cache_format.loads(data, (serializer,)) == SAMPLE
+
+    def test_json_round_trip(self):
+        sample = {"items": {"STR_RIFLE": {"weight": 8}}, "list": [1, "x", None]}
+        assert cache_format.loads(cache_format.dumps(sample, "json")) == sample
+
+    def test_unknown_serializer(self):
+        with pytest.raises(ValueError, match="Unknown cache serializer"):
+            cache_format.dumps(SAMPLE, "yaml")
+
+    def test_unencodable_data_raises(self):
+        """marshal cannot encode dates; there is no fallback to pickle."""
+        with pytest.raises(ValueError):
+            cache_format.dumps({"date": datetime.date(2024, 1, 1)}, "marshal")
+
+    def test_rejects_pickle_by_default(self):
+        """A planted pickle payload is never unpickled unless allowed."""
+
+        class Exploit:
+            def __reduce__(self):
+                return (os.system, ("echo pwned",))
+
+        data = cache_format.dumps(Exploit(), "pickle")
+        with (
+            patch("pickle.loads", wraps=pickle.loads) as mock_loads,
+            pytest.raises(cache_format.UntrustedCacheError),
+        ):
+            cache_format.loads(data)
+        mock_loads.assert_not_called()
+
+        # Nor when another serializer is the configured one
+        with pytest.raises(cache_format.UntrustedCacheError):
+            cache_format.loads(cache_format.dumps(SAMPLE, "json"), ("marshal",))
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"XSRC",
+            b'{"items": {}}',
+            cache_format.MAGIC + bytes([99, 1, 3, 11]) + b"x",
+            cache_format.MAGIC + bytes([cache_format.FORMAT_VERSION, 99, 3, 11]),
+        ],
+        ids=["empty", "truncated", "json", "version", "serializer"],
+    )
+    def test_rejects_invalid_headers(self, data):
+        with pytest.raises(cache_format.CacheFormatError):
+            cache_format.loads(data)
+
+    def test_rejects_corrupt_payload(self):
+        data = cache_format.dumps(SAMPLE, "marshal")
+        with pytest.raises(cache_format.CacheFormatError, match="corrupt"):
+            cache_format.loads(data[:-5])
+
+    def test_rejects_marshal_from_other_python(self):
+        data = bytearray(cache_format.dumps(SAMPLE, "marshal"))
+        data[7] = (data[7] + 1) % 256  # Python minor version
+        with pytest.raises(cache_format.CacheFormatError, match="Python"):
+            cache_format.loads(bytes(data))
+
+    def test_dump_and_load_file(self, tmp_path):
+        path = tmp_path / "entry.cache"
+        cache_format.dump(SAMPLE, path)
+        assert cache_format.load(path) == SAMPLE
+        assert os.listdir(tmp_path) == ["entry.cache"]
+
+    def test_load_rejects_shared_directory(self, tmp_path):
+        cache_format.dump(SAMPLE, tmp_path / "entry.cache")
+        os.chmod(tmp_path, 0o777)
+        try:
+            with pytest.raises(cache_format.UntrustedCacheError, match="other users"):
+                cache_format.load(tmp_path / "entry.cache")
+        finally:
+            os.chmod(tmp_path, 0o700)
+
+    def test_load_rejects_files_of_other_users(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        cache_format.ensure_cache_dir(cache_dir)
+        cache_format.dump(SAMPLE, cache_dir / "entry.cache")
+        with (
+            patch("os.getuid", return_value=os.getuid() + 1),
+            pytest.raises(cache_format.UntrustedCacheError, match="another user"),
+        ):
+            cache_format.load(cache_dir / "entry.cache")
+
+    def test_ensure_cache_dir_makes_existing_dir_private(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        os.makedirs(cache_dir, mode=0o755)
+        os.chmod(cache_dir, 0o755)
+
+        cache_format.ensure_cache_dir(cache_dir)
+        assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+
+        with (
+            patch("os.getuid", return_value=os.getuid() + 1),
+            pytest.raises(cache_format.UntrustedCacheError),
+        ):
+            cache_format.ensure_cache_dir(cache_dir)
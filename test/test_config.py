@@ -8,7 +8,7 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 )
 
-from config import Config
+from config import DEFAULT_CACHE_MAX_BYTES, DEFAULT_CACHE_MAX_ENTRIES, Config
 
 
 class TestConfig:
@@ -18,20 +18,49 @@ class TestConfig:
         mock_exists.return_value = False
         config = Config()
         assert config.game_dir == ""
+        assert config.cache_max_bytes == DEFAULT_CACHE_MAX_BYTES
+        assert config.cache_max_entries == DEFAULT_CACHE_MAX_ENTRIES
+        assert config.verify_ruleset_files is False
 
     @patch("os.path.exists")
     @patch(
         "builtins.open",
         new_callable=mock_open,
-        read_data='{"game_dir": "/path/to/game"}',
+        read_data='{"game_dir": "/path/to/game", "verify_ruleset_files": true}',
     )
     def test_load_success(self, mock_file, mock_exists):
         """Verify Config() loads game_dir correctly when file exists."""
         mock_exists.return_value = True
         config = Config()
         assert config.game_dir == "/path/to/game"
+        assert config.verify_ruleset_files is True
         mock_file.assert_called_once()
 
+    @patch("os.path.exists")
+    @patch(
+        "builtins.open",
+        new_callable=mock_open,
+        read_data='{"cache_max_bytes": 1024, "cache_max_entries": -1}',
+    )
+    def test_load_cache_limits(self, mock_file, mock_exists):
+        """Verify cache limits are loaded and invalid values fall back."""
+        mock_exists.return_value = True
+        config = Config()
+        assert config.cache_max_bytes == 1024
+        assert config.cache_max_entries == DEFAULT_CACHE_MAX_ENTRIES
+
+    @patch("os.path.exists")
+    @patch(
+        "builtins.open",
+        new_callable=mock_open,
+        read_data='{"verify_ruleset_files": "yes"}',
+    )
+    def test_load_verify_ruleset_files(self, mock_file, mock_exists):
+        """Verify a non-boolean verify_ruleset_files falls back to False."""
+        mock_exists.return_value = True
+        config = Config()
+        assert config.verify_ruleset_files is False
+
     @patch("os.path.exists")
     @patch("builtins.open", side_effect=Exception("Read error"))
     def test_load_failure(self, mock_file, mock_exists):
@@ -55,7 +84,12 @@ class TestConfig:
             handle = mock_file()
             # Join all calls to write()
             written_data = "".join(call.args[0] for call in handle.write.call_args_list)
-            assert json.loads(written_data) == {"game_dir": "/new/path"}
+            assert json.loads(written_data) == {
+                "game_dir": "/new/path",
+                "cache_max_bytes": DEFAULT_CACHE_MAX_BYTES,
+                "cache_max_entries": DEFAULT_CACHE_MAX_ENTRIES,
+                "verify_ruleset_files": False,
+            }
 
     @patch("os.path.exists")
     def test_save_failure(self, mock_exists):
@@ -2,12 +2,19 @@ import os
 import shutil
 import sys
 import tempfile
+from unittest.mock import patch
 
+import pytest
 import yaml
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
+import cache_format
+import ruleset_store
+from src import data_manager
 from src.data_manager import GameDataManager
 
 
@@ -176,3 +183,508 @@ class TestGameDataManager:
         key_b = dm._compute_cache_key(list_b)
 
         assert key_a != key_b
+
+    def _indexed_manager(self, cache_dir=None, **kwargs):
+        """
+        Build a manager that parses in this process and caches to cache_dir
+        (default: a "cache" folder in the test directory), and index the mods.
+        """
+        kwargs.setdefault("parse_workers", 1)
+        dm = GameDataManager(self.test_dir, **kwargs)
+        dm._cache_dir = cache_dir or os.path.join(self.test_dir, "cache")
+        dm.index_mods()
+        return dm
+
+    def _create_ruleset_files(self, mod_dir, count):
+        """Write `count` rulesets that each override STR_RIFLE's weight."""
+        ruleset_dir = os.path.join(mod_dir, "Ruleset")
+        os.makedirs(ruleset_dir, exist_ok=True)
+        for i in range(count):
+            with open(os.path.join(ruleset_dir, f"r{i:03d}.rul"), "w") as f:
+                yaml.dump(
+                    {
+                        "items": [
+                            {"type": "STR_RIFLE", "weight": i},
+                            {"type": f"STR_ITEM_{i}", "weight": i},
+                        ]
+                    },
+                    f,
+                )
+
+    def test_parallel_parse_matches_serial(self):
+        """Parsing in worker processes must merge in the same order."""
+        self._create_ruleset_files(self.mod1_dir, 40)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+
+        results = []
+        for workers in (1, 2):
+            dm = self._indexed_manager(
+                os.path.join(self.test_dir, f"cache{workers}"), parse_workers=workers
+            )
+            dm.load_all(mod_list)
+            results.append(dm.items)
+
+        serial, parallel = results
+        assert parallel == serial
+        # The alphabetically last file wins
+        assert parallel["STR_RIFLE"]["weight"] == 39
+        assert len(parallel) == 41
+
+    def test_parse_error_keeps_earlier_documents(self, caplog):
+        """Documents before a YAML error are merged and the error is logged."""
+        ruleset_dir = os.path.join(self.mod1_dir, "Ruleset")
+        os.makedirs(ruleset_dir)
+        with open(os.path.join(ruleset_dir, "broken.rul"), "w") as f:
+            f.write("items:\n  - type: STR_GOOD\n---\nitems: [unclosed\n")
+
+        dm = self._indexed_manager()
+        dm.load_all(["xcom1 ver: 1.0", "mod1 ver: 1.0"])
+
+        assert "STR_GOOD" in dm.items
+        assert "Error parsing ruleset" in caplog.text
+
+    def test_fragment_cache_reparses_only_changed_files(self):
+        """Touching one ruleset only reparses that file; the merge is redone."""
+        self._create_ruleset_files(self.mod1_dir, 3)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+
+        dm = self._indexed_manager(cache_dir)
+        dm.load_all(mod_list)
+        fragments = [f for f in os.listdir(cache_dir) if f.startswith("fragment_")]
+        assert len(fragments) == 3
+
+        changed = os.path.join(self.mod1_dir, "Ruleset", "r001.rul")
+        with open(changed, "w") as f:
+            yaml.dump({"items": [{"type": "STR_ITEM_1", "weight": 99}]}, f)
+        st = os.stat(changed)
+        os.utime(changed, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        # The directory's mtime is unchanged, so ask for the files to be stat'ed
+        dm2 = self._indexed_manager(cache_dir, verify_ruleset_files=True)
+        with patch.object(
+            data_manager, "_read_ruleset", wraps=data_manager._read_ruleset
+        ) as mock_read:
+            dm2.load_all(mod_list)
+
+        mock_read.assert_called_once_with(changed)
+        assert dm2.items["STR_ITEM_1"]["weight"] == 99
+        assert dm2.items["STR_RIFLE"]["weight"] == 2
+        # The stale fragment for the changed file was replaced
+        fragments = [f for f in os.listdir(cache_dir) if f.startswith("fragment_")]
+        assert len(fragments) == 3
+
+    def test_failed_file_is_reparsed(self):
+        """A read error is not cached, so the next load reads the file again."""
+        self._create_ruleset(self.mod1_dir, {"items": [{"type": "STR_RIFLE"}]})
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        path = os.path.join(self.mod1_dir, "Ruleset", "test.rul")
+
+        dm = self._indexed_manager()
+        with patch.object(
+            data_manager, "_read_ruleset", return_value=([], "Permission denied")
+        ):
+            dm.load_all(mod_list)
+        assert "STR_RIFLE" not in dm.items
+        assert not os.path.exists(dm._get_fragment_path(path))
+        assert not os.path.exists(dm._get_cache_path(dm._compute_cache_key(mod_list)))
+
+        dm2 = self._indexed_manager()
+        with patch.object(
+            data_manager, "_read_ruleset", wraps=data_manager._read_ruleset
+        ) as mock_read:
+            dm2.load_all(mod_list)
+        mock_read.assert_called_once_with(path)
+        assert "STR_RIFLE" in dm2.items
+
+    def test_corrupt_fragment_is_reparsed(self):
+        self._create_ruleset(self.mod1_dir, {"items": [{"type": "STR_RIFLE"}]})
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+
+        dm = self._indexed_manager(cache_dir)
+        path = dm._get_fragment_path(os.path.join(self.mod1_dir, "Ruleset", "test.rul"))
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path, "w") as f:
+            f.write("{not json")
+
+        dm.load_all(mod_list)
+        assert "STR_RIFLE" in dm.items
+        fragment = cache_format.load(path)
+        assert fragment["docs"][0]["items"][0]["type"] == "STR_RIFLE"
+
+    def test_cache_is_binary_and_keeps_key_types(self):
+        """The merged cache round-trips through the binary format unchanged."""
+        self._create_ruleset(
+            self.mod1_dir,
+            {"items": [{"type": "STR_RIFLE", "costs": {1: 10, 2: 20}}]},
+        )
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+
+        dm = self._indexed_manager(cache_dir)
+        dm.load_all(mod_list)
+        path = dm._get_cache_path(dm._compute_cache_key(mod_list))
+        with open(path, "rb") as f:
+            assert f.read(4) == cache_format.MAGIC
+
+        dm2 = self._indexed_manager(cache_dir)
+        assert dm2._load_cache(dm._compute_cache_key(mod_list))
+        assert dm2.items == dm.items
+        assert dm2.items["STR_RIFLE"]["costs"] == {1: 10, 2: 20}
+
+    def test_stale_cache_is_rejected_and_removed(self):
+        mod_list = ["xcom1 ver: 1.0"]
+        dm = self._indexed_manager()
+        dm.load_all(mod_list)
+        path = dm._get_cache_path(dm._compute_cache_key(mod_list))
+
+        # A cache written with another container version must not be trusted
+        with open(path, "r+b") as f:
+            f.seek(4)
+            f.write(bytes([cache_format.FORMAT_VERSION + 1]))
+
+        assert not dm._load_cache(dm._compute_cache_key(mod_list))
+        assert not os.path.exists(path)
+
+    def _make_cache_files(self, cache_dir, sizes):
+        """Write cache files of the given sizes, oldest first."""
+        os.makedirs(cache_dir, exist_ok=True)
+        paths = []
+        for i, size in enumerate(sizes):
+            path = os.path.join(cache_dir, f"entry{i}.cache")
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+            os.utime(path, ns=(i * 10**9, i * 10**9))
+            paths.append(path)
+        return paths
+
+    def test_prune_cache_max_entries(self):
+        dm = GameDataManager(self.test_dir, cache_max_bytes=0, cache_max_entries=2)
+        dm._cache_dir = os.path.join(self.test_dir, "cache")
+        paths = self._make_cache_files(dm._cache_dir, [10, 10, 10, 10])
+
+        dm.prune_cache()
+
+        assert [os.path.exists(p) for p in paths] == [False, False, True, True]
+
+    def test_prune_cache_max_bytes_is_lru(self):
+        dm = GameDataManager(self.test_dir, cache_max_bytes=25, cache_max_entries=0)
+        dm._cache_dir = os.path.join(self.test_dir, "cache")
+        paths = self._make_cache_files(dm._cache_dir, [10, 10, 10, 10])
+
+        # Using the oldest entry makes it the most recently used
+        os.utime(paths[0])
+        dm.prune_cache()
+
+        assert [os.path.exists(p) for p in paths] == [True, False, False, True]
+
+    def test_prune_cache_unlimited(self):
+        dm = GameDataManager(self.test_dir, cache_max_bytes=0, cache_max_entries=0)
+        dm._cache_dir = os.path.join(self.test_dir, "cache")
+        paths = self._make_cache_files(dm._cache_dir, [10, 10, 10])
+        dm.prune_cache()
+        assert all(os.path.exists(p) for p in paths)
+
+    def test_save_cache_enforces_limits(self):
+        """A cold load evicts stale entries, keeping the new one."""
+        dm = GameDataManager(self.test_dir, parse_workers=1, cache_max_entries=3)
+        dm._cache_dir = os.path.join(self.test_dir, "cache")
+        stale = self._make_cache_files(dm._cache_dir, [10] * 5)
+
+        dm.index_mods()
+        mod_list = ["xcom1 ver: 1.0"]
+        dm.load_all(mod_list)
+
+        remaining = os.listdir(dm._cache_dir)
+        assert len(remaining) == 3
+        cache_path = dm._get_cache_path(dm._compute_cache_key(mod_list))
+        assert os.path.basename(cache_path) in remaining
+        assert not os.path.exists(stale[0])
+
+    def test_prune_cache_keeps_files_in_use(self):
+        """Files the loaded rulesets come from survive even a tight limit."""
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        self._create_ruleset(self.mod1_dir, {"items": [{"type": "STR_RIFLE"}]})
+        dm = self._indexed_manager(use_store=True, cache_max_entries=1)
+        dm.load_all(mod_list)
+        stale = self._make_cache_files(dm._cache_dir, [10] * 3)
+
+        dm.prune_cache()
+
+        in_use = set(dm._cache_in_use.values())
+        assert len(in_use) == 4
+        assert all(os.path.exists(path) for path in in_use)
+        # Everything else goes, least recently used first
+        assert not any(os.path.exists(path) for path in stale)
+        assert dm.items["STR_RIFLE"]["type"] == "STR_RIFLE"
+
+    def test_warm_load_does_not_prune(self):
+        """Nothing is written on a cache hit, so nothing needs evicting."""
+        mod_list = ["xcom1 ver: 1.0"]
+        self._indexed_manager().load_all(mod_list)
+
+        dm2 = self._indexed_manager(cache_max_entries=1)
+        with patch.object(dm2, "prune_cache") as mock_prune:
+            dm2.load_all(mod_list)
+        mock_prune.assert_not_called()
+
+    def _bump_mtime(self, path):
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    def test_manifest_skips_file_scan_on_warm_load(self):
+        """An unchanged manifest validates the cache without listing files."""
+        self._create_ruleset_files(self.mod1_dir, 3)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+
+        dm = self._indexed_manager(cache_dir)
+        dm.load_all(mod_list)
+
+        dm2 = self._indexed_manager(cache_dir)
+        with (
+            patch.object(
+                dm2, "_collect_ruleset_files", wraps=dm2._collect_ruleset_files
+            ) as mock_collect,
+            patch.object(dm2, "_stat_files", wraps=dm2._stat_files) as mock_stat,
+        ):
+            dm2.load_all(mod_list)
+
+        mock_collect.assert_not_called()
+        mock_stat.assert_not_called()
+        assert dm2.items == dm.items
+
+    def test_manifest_stats_only_changed_directories(self):
+        """A directory whose mtime moved is listed; the others are trusted."""
+        self._create_ruleset_files(self.mod1_dir, 3)
+        self._create_ruleset_files(self.mod2_dir, 3)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0", "mod2 ver: 1.0"]
+        dm = self._indexed_manager()
+        dm.load_all(mod_list)
+
+        # A temporary file came and went, leaving the rulesets as they were
+        ruleset_dir = os.path.join(self.mod1_dir, "Ruleset")
+        self._bump_mtime(ruleset_dir)
+
+        dm2 = self._indexed_manager()
+        with (
+            patch.object(
+                dm2, "_collect_ruleset_files", wraps=dm2._collect_ruleset_files
+            ) as mock_collect,
+            patch.object(dm2, "_stat_source", wraps=dm2._stat_source) as mock_stat,
+        ):
+            dm2.load_all(mod_list)
+        mock_collect.assert_not_called()
+        mock_stat.assert_called_once_with(True, ruleset_dir)
+        assert dm2.items == dm.items
+
+        # The manifest took the new directory stamp
+        dm3 = self._indexed_manager()
+        with patch.object(dm3, "_stat_source") as mock_stat:
+            dm3.load_all(mod_list)
+        mock_stat.assert_not_called()
+
+    def test_manifest_detects_added_ruleset(self):
+        self._create_ruleset_files(self.mod1_dir, 2)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+
+        dm = self._indexed_manager(cache_dir)
+        dm.load_all(mod_list)
+
+        ruleset_dir = os.path.join(self.mod1_dir, "Ruleset")
+        with open(os.path.join(ruleset_dir, "zz.rul"), "w") as f:
+            yaml.dump({"items": [{"type": "STR_NEW"}]}, f)
+        self._bump_mtime(ruleset_dir)
+
+        dm2 = self._indexed_manager(cache_dir)
+        dm2.load_all(mod_list)
+        assert "STR_NEW" in dm2.items
+
+    def test_manifest_detects_mod_root_ruleset(self):
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+        mod_rul = os.path.join(self.mod1_dir, "mod1.rul")
+        with open(mod_rul, "w") as f:
+            yaml.dump({"items": [{"type": "STR_ROOT", "weight": 1}]}, f)
+
+        dm = self._indexed_manager(cache_dir)
+        dm.load_all(mod_list)
+
+        # Root rulesets are stat'ed individually, so in-place edits are seen
+        with open(mod_rul, "w") as f:
+            yaml.dump({"items": [{"type": "STR_ROOT", "weight": 2}]}, f)
+        self._bump_mtime(mod_rul)
+
+        dm2 = self._indexed_manager(cache_dir)
+        dm2.load_all(mod_list)
+        assert dm2.items["STR_ROOT"]["weight"] == 2
+
+    def test_manifest_stamps_files_before_parsing(self):
+        """A ruleset edited while the rulesets are parsed is not seen as fresh."""
+        self._create_ruleset(self.mod1_dir, {"items": [{"type": "STR_RIFLE"}]})
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        read_ruleset = data_manager._read_ruleset
+
+        def read_then_edit(file_path):
+            result = read_ruleset(file_path)
+            with open(file_path, "w") as f:
+                yaml.dump({"items": [{"type": "STR_RIFLE", "weight": 5}]}, f)
+            self._bump_mtime(file_path)
+            return result
+
+        dm = self._indexed_manager(verify_ruleset_files=True)
+        with patch.object(data_manager, "_read_ruleset", side_effect=read_then_edit):
+            dm.load_all(mod_list)
+        assert "weight" not in dm.items["STR_RIFLE"]
+
+        dm2 = self._indexed_manager(verify_ruleset_files=True)
+        dm2.load_all(mod_list)
+        assert dm2.items["STR_RIFLE"]["weight"] == 5
+
+    @pytest.mark.parametrize("serializer", ["marshal", "json"])
+    def test_manifest_verifies_files_on_request(self, serializer):
+        """
+        With verify_ruleset_files, editing a ruleset without touching its
+        directory is seen; by default only the directory is checked.
+        """
+        self._create_ruleset_files(self.mod1_dir, 2)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+        ruleset_dir = os.path.join(self.mod1_dir, "Ruleset")
+        changed = os.path.join(ruleset_dir, "r001.rul")
+
+        dm = self._indexed_manager(cache_dir, cache_serializer=serializer)
+        dm.load_all(mod_list)
+
+        dir_stat = os.stat(ruleset_dir)
+        with open(changed, "w") as f:
+            yaml.dump({"items": [{"type": "STR_ITEM_1", "weight": 99}]}, f)
+        self._bump_mtime(changed)
+        os.utime(ruleset_dir, ns=(dir_stat.st_atime_ns, dir_stat.st_mtime_ns))
+
+        dm2 = self._indexed_manager(cache_dir, cache_serializer=serializer)
+        dm2.load_all(mod_list)
+        assert dm2.items["STR_ITEM_1"]["weight"] == 1
+
+        dm2 = self._indexed_manager(
+            cache_dir, cache_serializer=serializer, verify_ruleset_files=True
+        )
+        dm2.load_all(mod_list)
+        assert dm2.items["STR_ITEM_1"]["weight"] == 99
+
+        # The rewritten manifest validates the next load again
+        dm3 = self._indexed_manager(
+            cache_dir, cache_serializer=serializer, verify_ruleset_files=True
+        )
+        with patch.object(
+            dm3, "_collect_ruleset_files", wraps=dm3._collect_ruleset_files
+        ) as mock_collect:
+            dm3.load_all(mod_list)
+        mock_collect.assert_not_called()
+        assert dm3.items == dm2.items
+
+    @pytest.mark.parametrize("serializer", ["marshal", "json"])
+    def test_mod_index_cache_skips_unchanged_mods(self, serializer):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        dm = self._indexed_manager(cache_dir, cache_serializer=serializer)
+
+        dm2 = GameDataManager(self.test_dir, cache_serializer=serializer)
+        dm2._cache_dir = cache_dir
+        with (
+            patch.object(
+                GameDataManager, "_scan_mod_dir", wraps=dm2._scan_mod_dir
+            ) as mock_scan,
+            patch.object(
+                GameDataManager, "_read_mod_metadata", wraps=dm2._read_mod_metadata
+            ) as mock_read,
+            patch.object(GameDataManager, "_save_mod_index") as mock_save,
+        ):
+            dm2.index_mods()
+
+        mock_scan.assert_not_called()
+        mock_read.assert_not_called()
+        # An unchanged index is not written again
+        mock_save.assert_not_called()
+        assert dm2.mod_map == dm.mod_map
+        assert dm2.master_mod_map == dm.master_mod_map
+
+    def test_mod_index_cache_detects_changes(self):
+        cache_dir = os.path.join(self.test_dir, "cache")
+        self._indexed_manager(cache_dir)
+
+        # Edited metadata is re-read even though its directory is unchanged
+        metadata_path = os.path.join(self.mod1_dir, "metadata.yml")
+        with open(metadata_path, "w") as f:
+            yaml.dump({"id": "mod1-renamed"}, f)
+        self._bump_mtime(metadata_path)
+
+        # New mod folders are found once their search directory changes
+        mod3_dir = os.path.join(self.test_dir, "user", "mods", "Mod3")
+        os.makedirs(mod3_dir)
+        with open(os.path.join(mod3_dir, "metadata.yml"), "w") as f:
+            yaml.dump({"id": "mod3"}, f)
+        self._bump_mtime(os.path.dirname(mod3_dir))
+
+        dm = self._indexed_manager(cache_dir)
+        assert "mod1" not in dm.mod_map
+        assert dm.mod_map["mod1-renamed"] == self.mod1_dir
+        assert dm.mod_map["mod3"] == mod3_dir
+
+    def test_ruleset_store_is_shared(self):
+        """With use_store, tables are served from the mapped store file."""
+        self._create_ruleset(
+            self.mod1_dir,
+            {
+                "items": [{"type": "STR_RIFLE", "weight": 8}],
+                "soldiers": [{"type": "STR_SOLDIER", "rankStrings": ["STR_A"]}],
+            },
+        )
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        cache_dir = os.path.join(self.test_dir, "cache")
+
+        dm = self._indexed_manager(cache_dir, use_store=True)
+        dm.load_all(mod_list)
+        assert isinstance(dm.items, ruleset_store.RulesetTable)
+        store_path = dm._get_store_path(dm._compute_cache_key(mod_list))
+        assert os.path.exists(store_path)
+
+        dm2 = self._indexed_manager(cache_dir, use_store=True)
+        with patch.object(dm2, "_load_cache") as mock_load_cache:
+            dm2.load_all(mod_list)
+        mock_load_cache.assert_not_called()
+
+        assert dm2.get_item("STR_RIFLE")["weight"] == 8
+        assert dm2.get_item("STR_MISSING") == {}
+        assert dm2.get_soldier_rank_string("STR_SOLDIER", 0) == "STR_A"
+
+    def test_ruleset_store_switch_keeps_old_tables(self):
+        """Tables of a previous store stay readable; the same store is reused."""
+        self._create_ruleset(self.mod1_dir, {"items": [{"type": "STR_RIFLE"}]})
+        dm = self._indexed_manager(use_store=True)
+
+        dm.load_all(["xcom1 ver: 1.0", "mod1 ver: 1.0"])
+        old_items, old_store = dm.items, dm._store
+        dm.load_all(["xcom1 ver: 1.0", "mod1 ver: 1.0"])
+        assert dm._store is old_store
+
+        dm.load_all(["xcom1 ver: 1.0"])
+        assert dm._store is not old_store
+        assert "STR_RIFLE" not in dm.items
+        assert old_items["STR_RIFLE"]["type"] == "STR_RIFLE"
+
+    def test_corrupt_ruleset_store_is_rebuilt(self):
+        self._create_ruleset(self.mod1_dir, {"items": [{"type": "STR_RIFLE"}]})
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+        dm = self._indexed_manager(use_store=True)
+        dm.load_all(mod_list)
+        store_path = dm._get_store_path(dm._compute_cache_key(mod_list))
+        dm._store.close()
+        with open(store_path, "wb") as f:
+            f.write(b"garbage")
+
+        dm.load_all(mod_list)
+        assert "STR_RIFLE" in dm.items
+        with open(store_path, "rb") as f:
+            assert f.read(4) == ruleset_store.MAGIC
@@ -5,6 +5,8 @@ from unittest.mock import patch
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from src.data_manager import GameDataManager
 
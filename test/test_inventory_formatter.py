@@ -57,3 +57,35 @@ def test_format_inventory_fuse_timer_zero():
     equipment_layout = [{"itemType": "STR_GRENADE", "slot": "STR_BELT", "fuseTimer": 0}]
     expected_output = {"STR_BELT": ["  - STR_GRENADE | Active[0]"]}
     assert format_inventory_for_display(equipment_layout) == expected_output
+
+
+def test_format_inventory_translate_many():
+    """All keys are translated in a single batch call."""
+    equipment_layout = [
+        {
+            "itemType": "STR_RIFLE",
+            "slot": "STR_RIGHT_HAND",
+            "ammoItemSlots": ["STR_RIFLE_CLIP"],
+        },
+        {"itemType": "STR_PISTOL", "slot": "STR_BELT", "ammoItem": "STR_PISTOL_CLIP"},
+        {"itemType": "STR_RIFLE_CLIP", "slot": "STR_BELT"},
+    ]
+    calls = []
+
+    def translate_many(keys):
+        calls.append(list(keys))
+        return [key.lower() for key in keys]
+
+    result = format_inventory_for_display(
+        equipment_layout, translate_many=translate_many
+    )
+
+    assert len(calls) == 1
+    assert sorted(calls[0]) == sorted(set(calls[0]))
+    assert result == {
+        "str_right_hand": ["  - str_rifle (Loaded with: str_rifle_clip)"],
+        "str_belt": [
+            "  - str_pistol (Loaded with: str_pistol_clip)",
+            "  - str_rifle_clip",
+        ],
+    }
@@ -33,6 +33,11 @@ def tearDownModule():
             sys.modules.pop(mod, None)
 
 
+def _documents(*docs):
+    """Stand-in for reader.iter_save_documents' generator."""
+    yield from docs
+
+
 class TestMain(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -106,6 +111,7 @@ class TestMain(unittest.TestCase):
                 self.AppClass.get_soldier_by_id
             )  # From HEAD, adapted to use AppClass
             get_mission_by_id = self.AppClass.get_mission_by_id  # From incoming
+            get_base_by_name = self.AppClass.get_base_by_name
             show_soldier_view = self.AppClass.show_soldier_view
             show_mission_view = self.AppClass.show_mission_view
 
@@ -121,6 +127,14 @@ class TestMain(unittest.TestCase):
         self.s2 = DummySoldier(2)
 
         self.app.soldiers = [self.s1, self.s2]
+        self.app.soldier_index = {1: self.s1, 2: self.s2}
+
+        class DummyBase:
+            def __init__(self, name):
+                self.name = name
+
+        self.b1 = DummyBase("Base Alpha")
+        self.app.base_index = {"Base Alpha": self.b1}
 
     # Tests from HEAD branch
     def test_get_soldier_by_id_valid_int(self):
@@ -143,6 +157,10 @@ class TestMain(unittest.TestCase):
         soldier = self.app.get_soldier_by_id(None)
         self.assertIsNone(soldier)
 
+    def test_get_base_by_name(self):
+        self.assertEqual(self.app.get_base_by_name("Base Alpha"), self.b1)
+        self.assertIsNone(self.app.get_base_by_name("Base Omega"))
+
     # Tests from incoming branch
     def test_get_mission_by_id_existing(self):
         mission = self.app.get_mission_by_id(101)
@@ -190,22 +208,91 @@ class TestMain(unittest.TestCase):
         app.translation_manager = MagicMock()
         app.frames = {main.MainMenu: MagicMock()}
 
-        with unittest.mock.patch("reader.load_data_from_yaml") as mock_load:
-            mock_load.return_value = {"mods": [], "difficulty": 0}
+        with unittest.mock.patch("reader.iter_save_documents") as mock_load:
+            mock_load.return_value = _documents({"mods": []}, {"difficulty": 0})
             with unittest.mock.patch("reader.read_missions", return_value={}):
-                with unittest.mock.patch("reader.read_bases", return_value=[]):
-                    with unittest.mock.patch(
-                        "reader.read_soldiers", return_value=([], {})
-                    ):
-                        app.load_save_file(file_path="test/Test Save.sav")
-
-            # Verify load_data_from_yaml was called with the path
-            mock_load.assert_any_call("test/Test Save.sav", section="meta")
-            mock_load.assert_any_call(
+                with unittest.mock.patch(
+                    "reader.read_roster",
+                    return_value=([self.b1], [self.s1, self.s2], {}),
+                ) as mock_roster:
+                    app.load_save_file(file_path="test/Test Save.sav")
+
+            # Verify the save was parsed once, with the path
+            mock_load.assert_called_once_with(
                 "test/Test Save.sav",
                 json_dump=False,
-                section="game",
+                cache_dir=app.data_manager._cache_dir,
+                lazy=True,
+            )
+            self.assertEqual(app.save_data, {"difficulty": 0})
+            app.data_manager.load_all.assert_called_once_with([])
+            mock_roster.assert_called_once_with(
+                {"difficulty": 0}, {}, stats_store=app.stats_store
             )
+            self.assertEqual(app.soldier_index, {1: self.s1, 2: self.s2})
+            self.assertEqual(app.base_index, {"Base Alpha": self.b1})
+
+    def test_load_save_file_duplicate_base_names(self):
+        """The first of several bases sharing a name is found by name."""
+        import main
+
+        app = self.AppClass.__new__(self.AppClass)
+        app.data_manager = MagicMock()
+        app.translation_manager = MagicMock()
+        app.frames = {main.MainMenu: MagicMock()}
+        twin = MagicMock()
+        twin.name = "Base Alpha"
+
+        with unittest.mock.patch("reader.iter_save_documents") as mock_load:
+            mock_load.return_value = _documents({"mods": []}, {"difficulty": 0})
+            with unittest.mock.patch("reader.read_missions", return_value={}):
+                with unittest.mock.patch(
+                    "reader.read_roster", return_value=([self.b1, twin], [], {})
+                ):
+                    app.load_save_file(file_path="test.sav")
+
+        self.assertIs(app.get_base_by_name("Base Alpha"), self.b1)
+
+    def test_load_save_file_metadata_error_keeps_loading(self):
+        """A bad header warns, and the game data is still loaded."""
+        import main
+
+        app = self.AppClass.__new__(self.AppClass)
+        app.data_manager = MagicMock()
+        app.translation_manager = MagicMock()
+        app.frames = {main.MainMenu: MagicMock()}
+
+        def bad_header():
+            raise ValueError("Could not find section 'meta'")
+            yield
+
+        messagebox = sys.modules["tkinter"].messagebox
+        messagebox.reset_mock()
+        with unittest.mock.patch("reader.iter_save_documents") as mock_load:
+            mock_load.side_effect = [
+                bad_header(),
+                _documents({"mods": []}, {"difficulty": 0}),
+            ]
+            with unittest.mock.patch("reader.read_missions", return_value={}):
+                with unittest.mock.patch(
+                    "reader.read_roster", return_value=([self.b1], [self.s1], {})
+                ):
+                    app.load_save_file(file_path="test.sav")
+
+        messagebox.showwarning.assert_called_once()
+        messagebox.showerror.assert_not_called()
+        app.data_manager.load_all.assert_called_once_with([])
+        self.assertEqual(
+            mock_load.call_args.kwargs,
+            {
+                "json_dump": False,
+                "cache_dir": app.data_manager._cache_dir,
+                "lazy": True,
+                "check_meta": False,
+            },
+        )
+        self.assertEqual(app.save_data, {"difficulty": 0})
+        self.assertEqual(app.soldiers, [self.s1])
 
     def test_load_save_file_with_json_dump(self):
         """Test load_save_file passes json_dump flag through."""
@@ -221,16 +308,20 @@ class TestMain(unittest.TestCase):
         app.translation_manager = MagicMock()
         app.frames = {main.MainMenu: MagicMock()}
 
-        with unittest.mock.patch("reader.load_data_from_yaml") as mock_load:
-            mock_load.return_value = {"mods": [], "difficulty": 0}
+        with unittest.mock.patch("reader.iter_save_documents") as mock_load:
+            mock_load.return_value = _documents({"mods": []}, {"difficulty": 0})
             with unittest.mock.patch("reader.read_missions", return_value={}):
-                with unittest.mock.patch("reader.read_bases", return_value=[]):
-                    with unittest.mock.patch(
-                        "reader.read_soldiers", return_value=([], {})
-                    ):
-                        app.load_save_file(file_path="test.sav", json_dump=True)
-
-            mock_load.assert_any_call("test.sav", json_dump=True, section="game")
+                with unittest.mock.patch(
+                    "reader.read_roster", return_value=([], [], {})
+                ):
+                    app.load_save_file(file_path="test.sav", json_dump=True)
+
+            mock_load.assert_called_once_with(
+                "test.sav",
+                json_dump=True,
+                cache_dir=app.data_manager._cache_dir,
+                lazy=True,
+            )
 
     def test_load_save_file_opens_dialog_when_no_path(self):
         """Test that file dialog opens when no file_path is given."""
@@ -250,21 +341,21 @@ class TestMain(unittest.TestCase):
         mock_filedialog = sys.modules["tkinter"].filedialog
         mock_filedialog.askopenfilename = MagicMock(return_value="selected.sav")
 
-        with unittest.mock.patch("reader.load_data_from_yaml") as mock_load:
-            mock_load.return_value = {
-                "mods": [],
-                "difficulty": 0,
-            }
+        with unittest.mock.patch("reader.iter_save_documents") as mock_load:
+            mock_load.return_value = _documents({"mods": []}, {"difficulty": 0})
             with unittest.mock.patch("reader.read_missions", return_value={}):
-                with unittest.mock.patch("reader.read_bases", return_value=[]):
-                    with unittest.mock.patch(
-                        "reader.read_soldiers",
-                        return_value=([], {}),
-                    ):
-                        app.load_save_file()
+                with unittest.mock.patch(
+                    "reader.read_roster", return_value=([], [], {})
+                ):
+                    app.load_save_file()
 
             mock_filedialog.askopenfilename.assert_called_once()
-            mock_load.assert_any_call("selected.sav", section="meta")
+            mock_load.assert_called_once_with(
+                "selected.sav",
+                json_dump=False,
+                cache_dir=app.data_manager._cache_dir,
+                lazy=True,
+            )
 
     def test_load_save_file_dialog_cancelled(self):
         """Test that cancelling the dialog does nothing."""
@@ -275,7 +366,7 @@ class TestMain(unittest.TestCase):
         mock_filedialog = sys.modules["tkinter"].filedialog
         mock_filedialog.askopenfilename = MagicMock(return_value="")
 
-        with unittest.mock.patch("reader.load_data_from_yaml") as mock_load:
+        with unittest.mock.patch("reader.iter_save_documents") as mock_load:
             app.load_save_file()
             mock_load.assert_not_called()
 
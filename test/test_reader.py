@@ -1,18 +1,34 @@
+import csv
+import gzip
+import io
 import os
 import sys
+from unittest.mock import patch
 
 import pytest
 
 # Add src directory to path to allow import of reader
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
+import yaml_loader
 from src.reader import (
+    LazyGameDocument,
     ServiceRecord,
     Soldier,
+    Stats,
+    StatsStore,
+    iter_csv_rows,
+    iter_save_documents,
     load_data_from_yaml,
+    load_save,
     make_csv,
     read_missions,
+    read_roster,
+    read_save_header,
     read_soldiers,
+    write_csv,
 )
 
 TEST_SAVE_FILE = os.path.join(os.path.dirname(__file__), "..", "test", "Test Save.sav")
@@ -53,6 +69,47 @@ class TestReader:
         assert len(csv_data) > 1  # Header + at least one soldier
         assert len(csv_data[0]) == 28  # Check for correct number of columns
 
+    def test_write_csv_streams_rows(self):
+        yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
+        mission_data = read_missions(yaml_data)
+        soldier_list, _ = read_soldiers(yaml_data, mission_data)
+        sink = io.StringIO()
+        count = write_csv(iter(soldier_list), sink)
+        assert count == len(soldier_list)
+        rows = list(csv.reader(io.StringIO(sink.getvalue())))
+        expected = [[str(v) for v in row] for row in make_csv(soldier_list)]
+        assert rows == expected
+
+    def test_iter_csv_rows_column_selection(self):
+        yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
+        mission_data = read_missions(yaml_data)
+        soldier_list, _ = read_soldiers(yaml_data, mission_data)
+        rows = iter_csv_rows(soldier_list, columns=["Name", "Initial TUs"])
+        assert next(rows) == ["Name", "Initial TUs"]
+        first = next(rows)
+        assert first == [soldier_list[0].name, soldier_list[0].initialstats.tu]
+
+    def test_iter_csv_rows_unknown_column(self):
+        with pytest.raises(ValueError, match="Bogus"):
+            next(iter_csv_rows([], columns=["Name", "Bogus"]))
+
+    def test_write_csv_gzip(self, tmp_path):
+        yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
+        mission_data = read_missions(yaml_data)
+        soldier_list, _ = read_soldiers(yaml_data, mission_data)
+        path = tmp_path / "roster.csv.gz"
+        write_csv(soldier_list, path, columns=["ID", "Name"])
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["ID", "Name"]
+        assert len(rows) == len(soldier_list) + 1
+
+        # Binary file-like sinks can be compressed explicitly
+        buffer = io.BytesIO()
+        write_csv(soldier_list, buffer, columns=["ID"], compress=True)
+        text = gzip.decompress(buffer.getvalue()).decode("utf-8")
+        assert text.splitlines()[0] == "ID"
+
     def test_read_service_record(self):
         """Test that service record data is read correctly"""
         yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
@@ -92,6 +149,108 @@ class TestReader:
         assert "Ethan Ferguson" in participant_names
         assert "Haruitike" in participant_names
 
+    def test_read_roster_shares_soldiers(self):
+        """Test that bases, the flat list and participants share instances"""
+        yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
+        mission_data = read_missions(yaml_data)
+        bases, soldier_list, mission_participants = read_roster(yaml_data, mission_data)
+
+        base_soldiers = [s for b in bases for s in b.soldiers]
+        assert len(base_soldiers) > 0
+        for base_soldier, soldier in zip(base_soldiers, soldier_list, strict=False):
+            assert base_soldier is soldier
+
+        # Dead soldiers follow the base soldiers in the flat list
+        assert all(s.base == "KIA" for s in soldier_list[len(base_soldiers) :])
+
+        for participants in mission_participants.values():
+            for p in participants:
+                assert any(p is s for s in soldier_list)
+
+    def test_model_objects_are_slotted(self):
+        """Test that roster objects carry no per-instance __dict__"""
+        yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
+        mission_data = read_missions(yaml_data)
+        bases, soldier_list, _ = read_roster(yaml_data, mission_data)
+
+        soldier = soldier_list[0]
+        objects = [
+            soldier,
+            soldier.currentstats,
+            soldier.service_record,
+            next(iter(mission_data.values())),
+            bases[0],
+            bases[0].facilities[0],
+        ]
+        for obj in objects:
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    def test_stats_views(self):
+        """Test that soldier stats are views into the shared store"""
+        yaml_data = load_data_from_yaml(TEST_SAVE_FILE)
+        mission_data = read_missions(yaml_data)
+        store = StatsStore()
+        _, soldier_list, _ = read_roster(yaml_data, mission_data, stats_store=store)
+
+        assert len(store) == len(soldier_list)
+        xena = soldier_list[0]
+        assert xena.name == "Xena"
+        assert xena.stats_store is store
+        assert xena.stats_row == 0
+        assert xena.initialstats.tu == 66
+        assert xena.currentstats.tu == 84
+        assert xena.currentstats.stat_list == [84, 102, 45, 20, 84, 0, 0, 3, 40, 0]
+
+    def test_stats_from_list_and_dict(self):
+        """Test that standalone Stats accept both save file layouts"""
+        values = [50, 60, 35, 40, 45, 55, 50, 30, 20, 10, 70, 80]
+        from_list = Stats(values)
+        from_dict = Stats(
+            {
+                "tu": 50,
+                "stamina": 60,
+                "health": 35,
+                "bravery": 40,
+                "reactions": 45,
+                "firing": 55,
+                "throwing": 50,
+                "strength": 30,
+                "psiStrength": 20,
+                "psiSkill": 10,
+            }
+        )
+        assert from_list.stat_list == values[:10]
+        assert from_dict.stat_list == values[:10]
+        assert from_dict.psistrength == 20
+
+    def test_stats_store_rejects_short_stat_lists(self):
+        """Test that a short stats list raises instead of shifting later rows"""
+        store = StatsStore()
+        store.add([50] * 10, [60] * 10)
+        with pytest.raises(ValueError):
+            store.add([40] * 10, [45] * 9)
+        with pytest.raises(ValueError):
+            Stats([1, 2, 3])
+
+        # The failed soldier left no partial row behind
+        assert len(store.values) == 20
+        assert store.add([30] * 10, [35] * 10) == 1
+        assert list(store.column("tu")) == [60, 35]
+
+    def test_stats_store_columns(self):
+        """Test column, gain and top-N queries on the stats store"""
+        store = StatsStore()
+        store.add([50] * 10, [60, 60, 60, 60, 60, 70, 60, 60, 60, 60])
+        store.add([40] * 10, [45, 45, 45, 45, 45, 90, 45, 45, 45, 45])
+        store.add([30] * 10, [35, 35, 35, 35, 35, 80, 35, 35, 35, 35])
+
+        assert list(store.column("firing")) == [70, 90, 80]
+        assert list(store.column("firing", current=False)) == [50, 40, 30]
+        assert list(store.gains("firing")) == [20, 50, 50]
+        assert store.top("firing", 2) == [1, 2]
+        assert store.top("firing", 2, rows=[0, 2]) == [2, 0]
+        assert store.view(2).firing == 80
+
     def test_load_data_sections(self):
         """Test loading specific sections from YAML"""
         # Test Save.sav has both metadata (first doc) and game data (second doc)
@@ -115,6 +274,185 @@ class TestReader:
         except ValueError:
             pass
 
+    def test_load_save_single_parse(self):
+        """Test that load_save returns both documents from one parse"""
+        meta, game = load_save(TEST_SAVE_FILE)
+        assert "mods" in meta
+        assert "difficulty" in game
+        assert "bases" in game
+
+    def test_iter_save_documents_yields_meta_first(self):
+        """Test that the metadata is available before the game document"""
+        documents = iter_save_documents(TEST_SAVE_FILE)
+        meta = next(documents)
+        assert meta["name"] == "XCOM Files"
+        game = next(documents)
+        assert "difficulty" in game
+        with pytest.raises(StopIteration):
+            next(documents)
+
+    def test_iter_save_documents_checks_meta(self, tmp_path):
+        """Test that a header without a name is rejected unless asked not to"""
+        save = tmp_path / "nameless.sav"
+        save.write_text("mods: []\n---\ndifficulty: 1\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Could not find section 'meta'"):
+            next(iter_save_documents(str(save)))
+
+        meta, game = iter_save_documents(str(save), check_meta=False)
+        assert meta == {"mods": []}
+        assert game["difficulty"] == 1
+        # The game section never needed the name
+        assert load_data_from_yaml(str(save), section="game")["difficulty"] == 1
+
+    def test_read_save_header(self):
+        """Test that the header reader returns only the metadata document"""
+        meta = read_save_header(TEST_SAVE_FILE)
+        assert meta["name"] == "XCOM Files"
+        assert "mods" in meta
+        assert "difficulty" not in meta
+
+    def test_read_save_header_skips_game_document(self, tmp_path):
+        """Test that the game document is never parsed by the header reader"""
+        save = tmp_path / "header_only.sav"
+        save.write_text(
+            'name: Header\nmods:\n  - "xcom1 ver: 1.0"\n---\ndifficulty: [unclosed\n',
+            encoding="utf-8",
+        )
+        meta = read_save_header(str(save))
+        assert meta == {"name": "Header", "mods": ["xcom1 ver: 1.0"]}
+
+        # load_data_from_yaml's "meta" section goes through the header reader
+        meta = load_data_from_yaml(str(save), section="meta")
+        assert meta == {"name": "Header", "mods": ["xcom1 ver: 1.0"]}
+
+    def test_save_cache_round_trip(self, tmp_path):
+        """Test that a second load is served from the parsed save cache"""
+        cache_dir = str(tmp_path / "cache")
+        meta, game = load_save(TEST_SAVE_FILE, cache_dir=cache_dir)
+
+        cache_files = os.listdir(cache_dir)
+        assert len(cache_files) == 1
+        assert cache_files[0].startswith("save_")
+        # Written in the shared cache container, not as a raw pickle
+        with open(os.path.join(cache_dir, cache_files[0]), "rb") as f:
+            assert f.read(4) == b"XSRC"
+
+        with patch("yaml_loader.safe_load_all") as mock_parse:
+            cached_meta, cached_game = load_save(TEST_SAVE_FILE, cache_dir=cache_dir)
+            mock_parse.assert_not_called()
+
+        assert cached_meta == meta
+        assert cached_game == game
+
+    def test_save_cache_invalidated_on_change(self, tmp_path):
+        """Test that editing a save replaces its cache entry"""
+        cache_dir = str(tmp_path / "cache")
+        save = tmp_path / "game.sav"
+        save.write_text("name: A\n---\ndifficulty: 1\n", encoding="utf-8")
+        _, game = load_save(str(save), cache_dir=cache_dir)
+        assert game["difficulty"] == 1
+
+        save.write_text("name: A\n---\ndifficulty: 2\n", encoding="utf-8")
+        _, game = load_save(str(save), cache_dir=cache_dir)
+        assert game["difficulty"] == 2
+        assert len(os.listdir(cache_dir)) == 1
+
+    def test_save_cache_corrupt_file_removed(self, tmp_path):
+        """Test that an unreadable cache entry is discarded and re-parsed"""
+        cache_dir = str(tmp_path / "cache")
+        save = tmp_path / "game.sav"
+        save.write_text("name: A\n---\ndifficulty: 1\n", encoding="utf-8")
+        load_save(str(save), cache_dir=cache_dir)
+
+        cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+        with open(cache_file, "wb") as f:
+            f.write(b"not a cache file")
+
+        _, game = load_save(str(save), cache_dir=cache_dir)
+        assert game["difficulty"] == 1
+        # Rewritten with valid data after the re-parse
+        assert os.path.getsize(cache_file) > len(b"not a cache file")
+
+    def test_lazy_game_document(self):
+        """Test that lazy loading only parses the sections that are accessed"""
+        _, full = load_save(TEST_SAVE_FILE)
+        _, game = load_save(TEST_SAVE_FILE, lazy=True)
+
+        assert isinstance(game, LazyGameDocument)
+        assert list(game) == list(full)
+        assert "countries" in game
+        assert game.parsed_sections == {}
+
+        assert game["bases"] == full["bases"]
+        assert list(game.parsed_sections) == ["bases"]
+        assert "countries" not in game.parsed_sections
+        assert game.get("missing") is None
+
+    def test_lazy_game_document_matches_full_parse(self):
+        """Test that every lazily parsed section matches a full parse"""
+        _, full = load_save(TEST_SAVE_FILE)
+        _, game = load_save(TEST_SAVE_FILE, lazy=True)
+        assert dict(game) == full
+        assert game.is_complete
+
+    def test_lazy_game_document_reader_functions(self):
+        """Test that the roster can be read from a lazy document"""
+        _, game = load_save(TEST_SAVE_FILE, lazy=True)
+        mission_data = read_missions(game)
+        soldier_list, mission_participants = read_soldiers(game, mission_data)
+        assert len(soldier_list) > 0
+        assert len(mission_participants[102]) == 4
+        assert set(game.parsed_sections) == {
+            "missionStatistics",
+            "bases",
+            "deadSoldiers",
+        }
+
+    def test_lazy_save_cache_keeps_parsed_sections(self, tmp_path):
+        """Test that sections parsed lazily are cached for the next open"""
+        cache_dir = str(tmp_path / "cache")
+        _, game = load_save(TEST_SAVE_FILE, cache_dir=cache_dir, lazy=True)
+        bases = game["bases"]
+        assert game.flush()
+
+        with patch("yaml_loader.safe_load", wraps=yaml_loader.safe_load) as mock_parse:
+            _, cached = load_save(TEST_SAVE_FILE, cache_dir=cache_dir, lazy=True)
+            assert cached["bases"] == bases
+            mock_parse.assert_called_once()  # Only the metadata header
+
+    def test_lazy_save_cache_written_on_flush(self, tmp_path):
+        """Test that parsing sections does not write the cache until a flush"""
+        cache_dir = str(tmp_path / "cache")
+        _, game = load_save(TEST_SAVE_FILE, cache_dir=cache_dir, lazy=True)
+
+        with patch("src.reader._save_save_cache") as mock_save:
+            read_roster(game, read_missions(game))
+            mock_save.assert_not_called()
+
+            assert game.flush()
+            mock_save.assert_called_once()
+            # Nothing new to write
+            assert not game.flush()
+            mock_save.assert_called_once()
+
+    def test_lazy_game_document_releases_body(self):
+        """Test that the raw document is dropped once every section is parsed"""
+        _, game = load_save(TEST_SAVE_FILE, lazy=True)
+        for key in list(game)[:-1]:
+            game[key]
+        assert game._body is not None
+        game[list(game)[-1]]
+        assert game._body is None
+        assert game.is_complete
+
+    def test_lazy_game_document_invalid_document_count(self, tmp_path):
+        """Test that lazy loading still rejects extra documents"""
+        save = tmp_path / "three.sav"
+        save.write_text("name: A\n---\ndifficulty: 1\n---\nextra: 1\n")
+        with pytest.raises(ValueError, match="Expected 2 YAML documents"):
+            load_save(str(save), lazy=True)
+
     def test_load_data_invalid_document_count(self):
         """Test that loading a file with wrong number of documents raises ValueError"""
         # Create single document file
@@ -0,0 +1,106 @@
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import cache_format
+import ruleset_store
+
+TABLES = {
+    "items": {
+        "STR_RIFLE": {"type": "STR_RIFLE", "weight": 8, "costs": {1: 10}},
+        "STR_PISTOL": {"type": "STR_PISTOL", "weight": 3},
+    },
+    "soldiers": {"STR_SOLDIER": {"rankStrings": ["STR_ROOKIE", "STR_SQUADDIE"]}},
+    "facilities": {},
+}
+
+
+@pytest.fixture
+def store_path(tmp_path):
+    path = tmp_path / f"rulesets{ruleset_store.EXTENSION}"
+    ruleset_store.write_store(path, TABLES)
+    return path
+
+
+class TestRulesetStore:
+    def test_round_trip(self, store_path):
+        with ruleset_store.RulesetStore(store_path) as store:
+            for name, table in TABLES.items():
+                mapped = store[name]
+                assert len(mapped) == len(table)
+                assert dict(mapped) == table
+            assert store["items"]["STR_RIFLE"]["costs"] == {1: 10}
+
+    def test_missing_keys(self, store_path):
+        with ruleset_store.RulesetStore(store_path) as store:
+            items = store["items"]
+            assert "STR_LASER" not in items
+            assert items.get("STR_LASER", {}) == {}
+            with pytest.raises(KeyError):
+                items["STR_LASER"]
+            assert "anything" not in store["facilities"]
+            with pytest.raises(KeyError):
+                store["ufos"]
+
+    def test_hash_collisions(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ruleset_store, "_key_hash", lambda key: 42)
+        path = tmp_path / "collide.store"
+        table = {f"STR_{i}": i for i in range(10)}
+        ruleset_store.write_store(path, {"items": table})
+        with ruleset_store.RulesetStore(path) as store:
+            assert all(store["items"][key] == value for key, value in table.items())
+            assert "STR_10" not in store["items"]
+
+    def test_entries_are_decoded_once(self, store_path):
+        with ruleset_store.RulesetStore(store_path) as store:
+            items = store["items"]
+            with patch.object(
+                ruleset_store.RulesetTable,
+                "_decode",
+                autospec=True,
+                side_effect=ruleset_store.RulesetTable._decode,
+            ) as mock_decode:
+                first = items["STR_RIFLE"]
+                assert "STR_RIFLE" in items
+                assert items["STR_RIFLE"] is first
+            assert mock_decode.call_count == 1
+
+    def test_no_temporary_files_left(self, store_path):
+        assert os.listdir(os.path.dirname(store_path)) == [store_path.name]
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            b"",
+            b"XSRC" + bytes(8),
+            ruleset_store.MAGIC + (99).to_bytes(4, "little") + bytes(4),
+            ruleset_store.MAGIC + (1).to_bytes(4, "little") + (3).to_bytes(4, "little"),
+        ],
+        ids=["empty", "magic", "version", "truncated"],
+    )
+    def test_rejects_invalid_files(self, tmp_path, data):
+        path = tmp_path / "bad.store"
+        path.write_bytes(data)
+        with pytest.raises(ruleset_store.StoreFormatError):
+            ruleset_store.RulesetStore(path)
+
+    def test_pickle_entries_need_to_be_allowed(self, tmp_path):
+        path = tmp_path / "pickled.store"
+        ruleset_store.write_store(path, TABLES, serializer="pickle")
+        with ruleset_store.RulesetStore(path) as store:
+            with pytest.raises(cache_format.UntrustedCacheError):
+                store["items"]["STR_RIFLE"]
+        with ruleset_store.RulesetStore(path, ("pickle",)) as store:
+            assert store["items"]["STR_RIFLE"]["weight"] == 8
+
+    def test_rejects_stores_of_other_users(self, store_path):
+        with (
+            patch("os.getuid", return_value=os.getuid() + 1),
+            pytest.raises(cache_format.UntrustedCacheError),
+        ):
+            ruleset_store.RulesetStore(store_path)
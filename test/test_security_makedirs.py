@@ -7,6 +7,8 @@ from unittest.mock import MagicMock, patch
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 
 # Mock tkinter and customtkinter and other GUI stuff before importing SettingsView
@@ -0,0 +1,148 @@
+import os
+import sys
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from soldier_table import SoldierTable, TableRow, stripe, text_key
+
+COLUMNS = ["ID", "Name", "Missions"]
+
+
+def _row(iid, name, missions, tags=()):
+    return TableRow(
+        iid, (iid, name, missions), (iid, text_key(name), missions), tags=tags
+    )
+
+
+def _table(count, page_size=10):
+    table = SoldierTable(COLUMNS, page_size=page_size)
+    table.set_rows(_row(i, f"Soldier {i}", count - i) for i in range(count))
+    return table
+
+
+def test_pages_cover_rows_in_order():
+    table = _table(25)
+
+    assert table.window() == []
+    table.next_page()
+    assert table.window() == list(range(10))
+    table.next_page()
+    assert table.has_more
+    table.next_page()
+    assert table.window() == list(range(25))
+    assert not table.has_more
+    table.next_page()
+    assert table.shown == 25
+
+
+def test_unpaged_table_shows_everything():
+    table = _table(25, page_size=None)
+    table.next_page()
+    assert table.window() == list(range(25))
+
+
+def test_set_rows_resets_window():
+    table = _table(25)
+    table.next_page()
+    table.sync()
+
+    table.set_rows([_row(7, "Solo", 1)])
+
+    assert len(table) == 1
+    assert table.shown == 0
+    assert table.materialized() == []
+    assert table.values(7) == (7, "Solo", 1)
+
+
+def test_sort_uses_typed_keys():
+    table = SoldierTable(COLUMNS)
+    table.set_rows([_row(1, "bob", 10), _row(2, "Alice", 9), _row(3, "carl", 100)])
+
+    # 9 < 10 < 100 numerically, "Alice" < "bob" ignoring case
+    table.sort("Missions")
+    assert table.order == [2, 1, 3]
+    table.sort("Name", reverse=True)
+    assert table.order == [3, 1, 2]
+
+
+def test_sort_keeps_window_size():
+    table = _table(25)
+    table.next_page()
+
+    table.sort("Missions")
+
+    assert table.shown == 10
+    assert table.order == list(range(24, -1, -1))
+    assert table.window() == list(range(24, 14, -1))
+
+
+def test_sync_inserts_new_rows_and_restripes_moved_ones():
+    table = SoldierTable(COLUMNS, page_size=2)
+    table.set_rows(
+        [_row(1, "b", 3), _row(2, "a", 2, tags=("wounded",)), _row(3, "c", 1)]
+    )
+    table.next_page()
+    assert table.sync() == ([(1, ("even",)), (2, ("odd", "wounded"))], [])
+    # Nothing changed since the last sync
+    assert table.sync() == ([], [])
+
+    table.sort("Missions")
+    # Row 3 enters the window, row 2 keeps its stripe, row 1 leaves
+    assert table.window() == [3, 2]
+    assert table.sync() == ([(3, ("even",))], [])
+
+    # Row 1 comes back at a position with the same stripe
+    table.next_page()
+    assert table.sync() == ([], [])
+    assert sorted(table.materialized()) == [1, 2, 3]
+
+    table.sort("Name")
+    assert table.window() == [2, 1, 3]
+    assert table.sync() == ([], [(2, ("even", "wounded")), (1, ("odd",))])
+
+
+def test_filter_keeps_ids_and_sort_order():
+    table = _table(30)
+    table.sort("Missions")
+    table.next_page()
+    table.sync()
+
+    materialized = set(table.window())
+    table.set_filter(lambda row: row.iid % 2 == 0)
+    assert table.order == [iid for iid in table._sorted if iid % 2 == 0]
+    assert table.window() == table.order[:10]
+    new, retagged = table.sync()
+    # Only rows that were not materialized yet are inserted
+    assert {iid for iid, _ in new} == set(table.window()) - materialized
+
+    # Sorting keeps the filter
+    table.sort("ID")
+    assert table.window() == list(range(0, 20, 2))
+    table.sync()
+
+    # Clearing the filter brings the hidden rows back under the same ids
+    table.set_filter(None)
+    assert table.window() == list(range(10))
+    new, _ = table.sync()
+    assert [iid for iid, _ in new] == [1, 3, 5, 7, 9]
+
+
+def test_filter_window_covers_a_page():
+    table = _table(30)
+    table.set_filter(lambda row: row.iid < 4)
+    assert table.window() == [0, 1, 2, 3]
+
+    table.set_filter(None)
+    assert table.shown == 10
+
+
+def test_set_rows_keeps_filter():
+    table = _table(5)
+    table.set_filter(lambda row: row.iid != 2)
+    table.set_rows(_row(i, "x", 0) for i in range(4))
+    assert table.order == [0, 1, 3]
+
+
+def test_stripe():
+    assert [stripe(i) for i in range(3)] == ["even", "odd", "even"]
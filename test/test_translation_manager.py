@@ -3,11 +3,14 @@ import os
 import shutil
 import sys
 import tempfile
+from unittest.mock import patch
 
 import yaml
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+# src/ modules import each other by bare name
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from src.data_manager import GameDataManager
 from src.translation_manager import TranslationManager
@@ -123,3 +126,90 @@ class TestTranslationManager:
             f"Error loading translation file {invalid_yaml_path}" in record.getMessage()
             for record in caplog.records
         )
+
+    def _manager(self):
+        dm = GameDataManager(self.test_dir)
+        dm._cache_dir = os.path.join(self.test_dir, "cache")
+        dm.index_mods()
+        return TranslationManager(dm)
+
+    def test_translation_cache(self):
+        """A second load with unchanged files is served from the cache."""
+        lang_file = os.path.join(self.mod1_dir, "Language", "en-US.yml")
+        with open(lang_file, "w") as f:
+            yaml.dump({"en-US": {"STR_MOD1": "Mod1"}}, f)
+        mod_list = ["xcom1 ver: 1.0", "mod1 ver: 1.0"]
+
+        self._manager().load_all(mod_list)
+
+        tm = self._manager()
+        with patch.object(tm, "_load_file") as mock_load_file:
+            tm.load_all(mod_list)
+        mock_load_file.assert_not_called()
+        assert tm.get("STR_MOD1") == "Mod1"
+
+        # Editing a language file invalidates the cache
+        with open(lang_file, "w") as f:
+            yaml.dump({"en-US": {"STR_MOD1": "Mod1 v2"}}, f)
+        st = os.stat(lang_file)
+        os.utime(lang_file, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+        tm = self._manager()
+        tm.load_all(mod_list)
+        assert tm.get("STR_MOD1") == "Mod1 v2"
+
+    def test_translation_cache_keyed_by_language_and_mods(self):
+        with open(os.path.join(self.common_lang_dir, "en-US.yml"), "w") as f:
+            yaml.dump({"en-US": {"STR_A": "A"}}, f)
+        with open(os.path.join(self.common_lang_dir, "de.yml"), "w") as f:
+            yaml.dump({"de": {"STR_A": "Ah"}}, f)
+        with open(os.path.join(self.mod1_dir, "Language", "en-US.yml"), "w") as f:
+            yaml.dump({"en-US": {"STR_A": "Mod A"}}, f)
+
+        tm = self._manager()
+        tm.load_all(["xcom1 ver: 1.0"])
+        assert tm.get("STR_A") == "A"
+        tm.load_all(["xcom1 ver: 1.0", "mod1 ver: 1.0"])
+        assert tm.get("STR_A") == "Mod A"
+        tm.language = "de"
+        tm.load_all(["xcom1 ver: 1.0"])
+        assert tm.get("STR_A") == "Ah"
+
+    def test_broken_file_is_not_cached(self, caplog):
+        invalid_yaml_path = os.path.join(self.common_lang_dir, "en-US.yml")
+        with open(invalid_yaml_path, "w") as f:
+            f.write("invalid: yaml: :\n  - [")
+
+        self._manager().load_all([])
+        caplog.clear()
+        with caplog.at_level(logging.ERROR):
+            self._manager().load_all([])
+        assert "Error loading translation file" in caplog.text
+
+    def test_list_variants_collapsed_and_translate_many(self):
+        with open(os.path.join(self.common_lang_dir, "en-US.yml"), "w") as f:
+            yaml.dump(
+                {
+                    "en-US": {
+                        "STR_NAME": ["First", "Second"],
+                        "STR_EMPTY": [],
+                        "STR_PLAIN": "Plain",
+                    }
+                },
+                f,
+            )
+
+        tm = self._manager()
+        tm.load_all([])
+        # Variants are resolved once at load time
+        assert tm.translations["STR_NAME"] == "First"
+        assert tm.get("STR_NAME") == "First"
+        assert tm.translate_many(
+            ["STR_NAME", "STR_PLAIN", "STR_MISSING", "", None]
+        ) == ["First", "Plain", "STR_MISSING", "", ""]
+        assert tm.translate_many(iter(["STR_PLAIN"])) == ["Plain"]
+
+        # The cached table is already collapsed
+        cached = self._manager()
+        cached.load_all([])
+        assert cached.translations == tm.translations
@@ -0,0 +1,52 @@
+import importlib
+import logging
+import os
+import sys
+
+import pytest
+import yaml
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import yaml_loader
+
+
+class TestYamlLoader:
+    def test_safe_load(self):
+        assert yaml_loader.safe_load("a: 1\nb: [x, y]\n") == {"a": 1, "b": ["x", "y"]}
+
+    def test_safe_load_all(self):
+        docs = list(yaml_loader.safe_load_all("a: 1\n---\nb: 2\n"))
+        assert docs == [{"a": 1}, {"b": 2}]
+
+    def test_safe_load_rejects_unsafe_tags(self):
+        with pytest.raises(yaml.YAMLError):
+            yaml_loader.safe_load("!!python/object/apply:os.system ['true']")
+
+    def test_prefers_c_loader(self):
+        if hasattr(yaml, "CSafeLoader"):
+            assert yaml_loader.BACKEND == "libyaml"
+            assert yaml_loader.SafeLoader is yaml.CSafeLoader
+        else:
+            assert yaml_loader.BACKEND == "pure-python"
+
+    def test_fallback_without_libyaml(self, monkeypatch):
+        """Without the C extension the pure-Python loader is used."""
+        monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+        try:
+            module = importlib.reload(yaml_loader)
+            assert module.BACKEND == "pure-python"
+            assert module.SafeLoader is yaml.SafeLoader
+            assert module.safe_load("a: 1") == {"a": 1}
+        finally:
+            monkeypatch.undo()
+            importlib.reload(yaml_loader)
+
+    def test_backend_logged_once(self, caplog):
+        yaml_loader._backend_logged = False
+        with caplog.at_level(logging.INFO, logger="yaml_loader"):
+            yaml_loader.safe_load("a: 1")
+            yaml_loader.safe_load("b: 2")
+        messages = [r.getMessage() for r in caplog.records if "YAML loader" in r.msg]
+        assert messages == [f"Using {yaml_loader.BACKEND} YAML loader."]